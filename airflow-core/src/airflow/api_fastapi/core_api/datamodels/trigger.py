@@ -34,3 +34,4 @@ class TriggerResponse(BaseModel):
     kwargs: Annotated[str, BeforeValidator(str)]
     created_date: datetime
     triggerer_id: int | None
+    loop_time: float | None = None
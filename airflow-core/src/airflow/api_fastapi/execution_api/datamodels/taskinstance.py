@@ -228,6 +228,44 @@ TIStateUpdate = Annotated[
     Discriminator(ti_state_discriminator),
 ]
 
+# The subset of TIStateUpdate that can be sent in bulk: the states a task reaches when it stops running.
+TITerminalStateUpdate = Annotated[
+    Annotated[TITerminalStatePayload, Tag("_terminal_")]
+    | Annotated[TISuccessStatePayload, Tag("success")]
+    | Annotated[TIRetryStatePayload, Tag("up_for_retry")],
+    Discriminator(ti_state_discriminator),
+]
+
+
+class TIBulkStateUpdateItem(StrictBaseModel):
+    """A single TaskInstance state transition in a bulk state update."""
+
+    task_instance_id: uuid.UUID
+    token: str
+    """The JWT issued for this TaskInstance, proving the sender is allowed to update it."""
+    payload: TITerminalStateUpdate
+
+
+class TIBulkStateUpdate(StrictBaseModel):
+    """Schema for moving many running TaskInstances to a terminal state in one request."""
+
+    updates: Annotated[list[TIBulkStateUpdateItem], Field(min_length=1)]
+
+
+class TIBulkStateUpdateResult(BaseModel):
+    """Outcome of a single item in a bulk state update."""
+
+    task_instance_id: uuid.UUID
+    status_code: int
+    """The HTTP status code the single-item ``/{task_instance_id}/state`` endpoint would have returned."""
+    detail: dict[str, Any] | str | None = None
+
+
+class TIBulkStateUpdateResponse(BaseModel):
+    """Response for a bulk state update, with one result per item in the order they were sent."""
+
+    results: list[TIBulkStateUpdateResult]
+
 
 class TIHeartbeatInfo(StrictBaseModel):
     """Schema for TaskInstance heartbeat endpoint."""
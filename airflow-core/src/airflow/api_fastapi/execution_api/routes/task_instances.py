@@ -29,15 +29,16 @@ from uuid import UUID
 import attrs
 import structlog
 from cadwyn import VersionedAPIRouter
-from fastapi import Body, HTTPException, Query, status
+from fastapi import Body, Depends, HTTPException, Query, status
 from pydantic import JsonValue
 from sqlalchemy import func, or_, tuple_, update
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import select
-from structlog.contextvars import bind_contextvars
+from structlog.contextvars import bind_contextvars, bound_contextvars
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.auth.tokens import JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
@@ -45,6 +46,9 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     InactiveAssetsResponse,
     PrevSuccessfulDagRunResponse,
     TaskStatesResponse,
+    TIBulkStateUpdate,
+    TIBulkStateUpdateResponse,
+    TIBulkStateUpdateResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -56,7 +60,7 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TISuccessStatePayload,
     TITerminalStatePayload,
 )
-from airflow.api_fastapi.execution_api.deps import JWTBearerTIPathDep
+from airflow.api_fastapi.execution_api.deps import DepContainer, JWTBearerTIPathDep
 from airflow.exceptions import TaskNotFound
 from airflow.models.asset import AssetActive
 from airflow.models.dagrun import DagRun as DR
@@ -341,8 +345,6 @@ def ti_update_state(
     bind_contextvars(ti_id=ti_id_str)
     log.debug("Updating task instance state", new_state=ti_patch_payload.state)
 
-    updated_state: str = ""
-
     old = select(TI.state, TI.try_number, TI.max_tries, TI.dag_id).where(TI.id == ti_id_str).with_for_update()
     try:
         (
@@ -381,6 +383,26 @@ def ti_update_state(
             },
         )
 
+    _apply_ti_state_update(
+        ti_patch_payload=ti_patch_payload,
+        ti_id_str=ti_id_str,
+        dag_id=dag_id,
+        session=session,
+        dag_bag=dag_bag,
+    )
+
+
+def _apply_ti_state_update(
+    *,
+    ti_patch_payload: TIStateUpdate,
+    ti_id_str: str,
+    dag_id: str,
+    session: SessionDep,
+    dag_bag: DagBagDep,
+) -> None:
+    """Apply a state transition to a TaskInstance that has already been locked and checked to be running."""
+    updated_state: str = ""
+
     # We exclude_unset to avoid updating fields that are not set in the payload
     data = ti_patch_payload.model_dump(exclude={"task_outlets", "outlet_events"}, exclude_unset=True)
     query = update(TI).where(TI.id == ti_id_str).values(data)
@@ -537,6 +559,121 @@ def _create_ti_state_update_query_and_update_state(
     return query, updated_state
 
 
+@attrs.define(frozen=True)
+class _AuthorizedBulkStateUpdate:
+    payload: TIBulkStateUpdate
+    unauthorized: frozenset[UUID]
+
+
+async def _authorize_bulk_state_update(
+    bulk_payload: Annotated[TIBulkStateUpdate, Body()],
+    services=DepContainer,
+) -> _AuthorizedBulkStateUpdate:
+    """
+    Check the token sent with each item was issued for that TaskInstance.
+
+    The request itself is authenticated with the token of any one task, so without this a worker could
+    update the state of any other TaskInstance.
+    """
+    validator: JWTValidator = await services.aget(JWTValidator)
+    unauthorized = set()
+    for item in bulk_payload.updates:
+        try:
+            await validator.avalidated_claims(
+                item.token, {"sub": {"essential": True, "value": str(item.task_instance_id)}}
+            )
+        except Exception:
+            log.warning("Failed to validate JWT in bulk state update", ti_id=str(item.task_instance_id))
+            unauthorized.add(item.task_instance_id)
+    return _AuthorizedBulkStateUpdate(payload=bulk_payload, unauthorized=frozenset(unauthorized))
+
+
+@router.patch(
+    "/states",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "Invalid payload for the state transitions"},
+    },
+)
+def ti_bulk_update_state(
+    authorized: Annotated[_AuthorizedBulkStateUpdate, Depends(_authorize_bulk_state_update)],
+    session: SessionDep,
+    dag_bag: DagBagDep,
+) -> TIBulkStateUpdateResponse:
+    """
+    Move many running TaskInstances to a terminal state in one request and one transaction.
+
+    Each item is applied exactly as ``PATCH /{task_instance_id}/state`` would apply it, inside its own
+    savepoint, so an item that fails does not affect the others. The response has a result for every item,
+    in the order they were sent, with the status code the single-item endpoint would have responded with.
+    """
+    updates = authorized.payload.updates
+    ti_ids = {str(item.task_instance_id) for item in updates}
+    log.debug("Bulk updating task instance states", count=len(updates))
+
+    # Lock all the rows up front, in a consistent order so concurrent bulk updates can't deadlock
+    locked = {
+        str(ti_id): (state, dag_id)
+        for ti_id, state, dag_id in session.execute(
+            select(TI.id, TI.state, TI.dag_id).where(TI.id.in_(ti_ids)).order_by(TI.id).with_for_update()
+        )
+    }
+
+    results: list[TIBulkStateUpdateResult] = []
+    seen: set[str] = set()
+    for item in updates:
+        ti_id_str = str(item.task_instance_id)
+        result = TIBulkStateUpdateResult(task_instance_id=item.task_instance_id, status_code=204)
+        results.append(result)
+
+        if item.task_instance_id in authorized.unauthorized:
+            result.status_code = status.HTTP_403_FORBIDDEN
+            result.detail = {"reason": "invalid_token", "message": "Invalid auth token for Task Instance"}
+            continue
+        if ti_id_str in seen:
+            result.status_code = status.HTTP_409_CONFLICT
+            result.detail = {
+                "reason": "duplicate",
+                "message": "Task Instance was already updated in this request",
+            }
+            continue
+        seen.add(ti_id_str)
+
+        if (row := locked.get(ti_id_str)) is None:
+            result.status_code = status.HTTP_404_NOT_FOUND
+            result.detail = {"reason": "not_found", "message": "Task Instance not found"}
+            continue
+        previous_state, dag_id = row
+        if previous_state != TaskInstanceState.RUNNING:
+            result.status_code = status.HTTP_409_CONFLICT
+            result.detail = {
+                "reason": "invalid_state",
+                "message": "TI was not in the running state so it cannot be updated",
+                "previous_state": previous_state,
+            }
+            continue
+
+        with bound_contextvars(ti_id=ti_id_str):
+            try:
+                with session.begin_nested():
+                    _apply_ti_state_update(
+                        ti_patch_payload=item.payload,
+                        ti_id_str=ti_id_str,
+                        dag_id=dag_id,
+                        session=session,
+                        dag_bag=dag_bag,
+                    )
+            except HTTPException as e:
+                result.status_code = e.status_code
+                result.detail = e.detail
+            except Exception:
+                log.exception("Error updating Task Instance state in bulk update")
+                result.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                result.detail = "Error updating Task Instance state"
+
+    return TIBulkStateUpdateResponse(results=results)
+
+
 @ti_id_router.patch(
     "/{task_instance_id}/skip-downstream",
     status_code=status.HTTP_204_NO_CONTENT,
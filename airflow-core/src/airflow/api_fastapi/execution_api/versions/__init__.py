@@ -26,9 +26,11 @@ from airflow.api_fastapi.execution_api.versions.v2025_08_10 import (
     AddDagVersionIdField,
     AddIncludePriorDatesToGetXComSlice,
 )
+from airflow.api_fastapi.execution_api.versions.v2025_09_23 import AddBulkTaskInstanceStateEndpoint
 
 bundle = VersionBundle(
     HeadVersion(),
+    Version("2025-09-23", AddBulkTaskInstanceStateEndpoint),
     Version(
         "2025-08-10",
         AddDagVersionIdField,
@@ -76,6 +76,11 @@ def get_bundle_version_path(bundle_name: str, version: str) -> Path:
     return base_folder / version
 
 
+def get_parsed_dag_cache_path(bundle_name: str, version: str) -> Path:
+    """Folder where task runners cache DAGs parsed from this bundle version."""
+    return get_bundle_storage_root_path() / "_parsed_dags" / bundle_name / version
+
+
 @dataclass(frozen=True)
 class TrackedBundleVersionInfo:
     """
@@ -169,6 +174,11 @@ class BundleUsageTrackingManager:
                 flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)  # exclusive lock, do not wait
                 # remove the actual bundle copy
                 shutil.rmtree(bundle_version_path)
+                # and any DAGs task runners have cached from it
+                shutil.rmtree(
+                    get_parsed_dag_cache_path(bundle_name=bundle_name, version=info.version),
+                    ignore_errors=True,
+                )
                 # remove the lock file
                 os.remove(info.lock_file_path)
         except BlockingIOError:
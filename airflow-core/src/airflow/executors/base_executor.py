@@ -18,9 +18,10 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import defaultdict, deque
-from collections.abc import Sequence
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
@@ -97,6 +98,131 @@ class RunningRetryAttemptType:
         return True
 
 
+def _priority_weight(workload: Any) -> int:
+    # Not every executor (or test) queues ExecuteTask workloads, those are queued with the default priority
+    priority_weight = getattr(getattr(workload, "ti", None), "priority_weight", 0)
+    return priority_weight if isinstance(priority_weight, int) else 0
+
+
+class QueuedTasks(MutableMapping["TaskInstanceKey", "workloads.ExecuteTask"]):
+    """
+    Workloads queued in an executor by task instance key, indexed in a heap by priority.
+
+    It behaves like a dict (iterating in insertion order), and additionally returns the first workloads by
+    descending ``priority_weight``, then insertion order, without sorting all of them: adding or removing a
+    workload is ``O(log n)`` and getting the first ``k`` workloads by priority ``O(k log k)``, whatever the
+    number of workloads queued.
+    """
+
+    def __init__(self) -> None:
+        self._workloads: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        # Entries are (-priority_weight, insertion order, key), so the smallest is the one to run first
+        self._heap: list[tuple[int, int, TaskInstanceKey]] = []
+        self._positions: dict[TaskInstanceKey, int] = {}
+        self._insertion_order = 0
+        self._pending_by_priority: Counter[int] = Counter()
+
+    def __getitem__(self, key: TaskInstanceKey) -> workloads.ExecuteTask:
+        return self._workloads[key]
+
+    def __setitem__(self, key: TaskInstanceKey, workload: workloads.ExecuteTask) -> None:
+        priority_weight = _priority_weight(workload)
+        if key in self._workloads:
+            # Like a dict, replacing a workload keeps its insertion order
+            pos = self._positions[key]
+            old_priority, insertion_order, _ = self._heap[pos]
+            self._decrement_pending(-old_priority)
+            self._heap[pos] = (-priority_weight, insertion_order, key)
+            self._sift_down(self._sift_up(pos))
+        else:
+            self._insertion_order += 1
+            self._heap.append((-priority_weight, self._insertion_order, key))
+            self._sift_up(len(self._heap) - 1)
+        self._workloads[key] = workload
+        self._pending_by_priority[priority_weight] += 1
+
+    def __delitem__(self, key: TaskInstanceKey) -> None:
+        del self._workloads[key]
+        pos = self._positions.pop(key)
+        removed_priority = -self._heap[pos][0]
+        last = self._heap.pop()
+        if pos < len(self._heap):
+            self._heap[pos] = last
+            self._sift_down(self._sift_up(pos))
+        self._decrement_pending(removed_priority)
+
+    def __iter__(self) -> Iterator[TaskInstanceKey]:
+        return iter(self._workloads)
+
+    def __len__(self) -> int:
+        return len(self._workloads)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._workloads
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._workloads!r})"
+
+    def copy(self) -> dict[TaskInstanceKey, workloads.ExecuteTask]:
+        return dict(self._workloads)
+
+    def by_priority(self, limit: int | None = None) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+        """
+        Return the first ``limit`` (or all) queued workloads, ordered by priority.
+
+        :param limit: Maximum number of workloads to return.
+        """
+        if limit is None or limit >= len(self._heap):
+            entries = sorted(self._heap)
+        else:
+            # Best-first walk down the heap: only the parents of the entries returned are looked at
+            entries = []
+            frontier = [(self._heap[0], 0)] if self._heap and limit > 0 else []
+            while frontier and len(entries) < limit:
+                entry, pos = heapq.heappop(frontier)
+                entries.append(entry)
+                for child in (2 * pos + 1, 2 * pos + 2):
+                    if child < len(self._heap):
+                        heapq.heappush(frontier, (self._heap[child], child))
+        return [(key, self._workloads[key]) for _, _, key in entries]
+
+    def pending_by_priority(self) -> dict[int, int]:
+        """Return the number of workloads queued, by ``priority_weight``."""
+        return dict(self._pending_by_priority)
+
+    def _decrement_pending(self, priority_weight: int) -> None:
+        self._pending_by_priority[priority_weight] -= 1
+        if not self._pending_by_priority[priority_weight]:
+            del self._pending_by_priority[priority_weight]
+
+    def _sift_up(self, pos: int) -> int:
+        heap, entry = self._heap, self._heap[pos]
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if heap[parent] <= entry:
+                break
+            heap[pos] = heap[parent]
+            self._positions[heap[pos][2]] = pos
+            pos = parent
+        heap[pos] = entry
+        self._positions[entry[2]] = pos
+        return pos
+
+    def _sift_down(self, pos: int) -> int:
+        heap, entry = self._heap, self._heap[pos]
+        while (child := 2 * pos + 1) < len(heap):
+            if child + 1 < len(heap) and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[pos] = heap[child]
+            self._positions[heap[pos][2]] = pos
+            pos = child
+        heap[pos] = entry
+        self._positions[entry[2]] = pos
+        return pos
+
+
 class BaseExecutor(LoggingMixin):
     """
     Base class to inherit for concrete executors such as Celery, Kubernetes, Local, etc.
@@ -146,8 +272,9 @@ class BaseExecutor(LoggingMixin):
 
         self.parallelism: int = parallelism
         self.team_id: str | None = team_id
-        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        self.queued_tasks: QueuedTasks = QueuedTasks()
         self.running: set[TaskInstanceKey] = set()
+        self._pending_priorities: set[int] = set()
         self.event_buffer: dict[TaskInstanceKey, EventBufferValueType] = {}
         self._task_event_logs: deque[Log] = deque()
 
@@ -295,21 +422,45 @@ class BaseExecutor(LoggingMixin):
             tags={"status": "running", "name": name},
         )
 
-    def order_queued_tasks_by_priority(self) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+        if isinstance(self.queued_tasks, QueuedTasks):
+            pending_by_priority_metric_name = (
+                f"executor.pending_by_priority.{metric_suffix}"
+                if multiple_executors_configured
+                else "executor.pending_by_priority"
+            )
+            pending_by_priority = self.queued_tasks.pending_by_priority()
+            # Reset the gauges of priorities that have no task queued anymore
+            for priority_weight in self._pending_priorities - pending_by_priority.keys():
+                pending_by_priority[priority_weight] = 0
+            self._pending_priorities = {p for p, pending in pending_by_priority.items() if pending}
+            for priority_weight, num_pending in sorted(pending_by_priority.items()):
+                Stats.gauge(
+                    pending_by_priority_metric_name,
+                    value=num_pending,
+                    tags={"priority_weight": str(priority_weight), "name": name},
+                )
+
+    def order_queued_tasks_by_priority(
+        self, limit: int | None = None
+    ) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
         """
         Orders the queued tasks by priority.
 
+        :param limit: Only return the first ``limit`` tasks by priority.
         :return: List of workloads from the queued_tasks according to the priority.
         """
         if not self.queued_tasks:
             return []
 
-        # V3 + new executor that supports workloads
+        if isinstance(self.queued_tasks, QueuedTasks):
+            return self.queued_tasks.by_priority(limit)
+
+        # queued_tasks was replaced by a plain dict
         return sorted(
             self.queued_tasks.items(),
             key=lambda x: x[1].ti.priority_weight,
             reverse=True,
-        )
+        )[:limit]
 
     @add_debug_span
     def trigger_tasks(self, open_slots: int) -> None:
@@ -318,12 +469,9 @@ class BaseExecutor(LoggingMixin):
 
         :param open_slots: Number of open slots
         """
-        sorted_queue = self.order_queued_tasks_by_priority()
         workload_list = []
 
-        for _ in range(min((open_slots, len(self.queued_tasks)))):
-            key, item = sorted_queue.pop(0)
-
+        for key, item in self.order_queued_tasks_by_priority(limit=max(open_slots, 0)):
             # If a task makes it here but is still understood by the executor
             # to be running, it generally means that the task has been killed
             # externally and not yet been marked as failed.
@@ -28,6 +28,7 @@ from __future__ import annotations
 import ctypes
 import logging
 import multiprocessing
+import multiprocessing.context
 import multiprocessing.sharedctypes
 import os
 from multiprocessing import Queue, SimpleQueue
@@ -35,6 +36,7 @@ from typing import TYPE_CHECKING
 
 from setproctitle import setproctitle
 
+from airflow.configuration import conf
 from airflow.executors import workloads
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -48,8 +50,8 @@ if TYPE_CHECKING:
 
 def _run_worker(
     logger_name: str,
-    input: SimpleQueue[workloads.All | None],
-    output: Queue[TaskInstanceStateType],
+    input: SimpleQueue[workloads.All | list[workloads.All] | None],
+    output: Queue[TaskInstanceStateType | list[TaskInstanceStateType]],
     unread_messages: multiprocessing.sharedctypes.Synchronized[int],
 ):
     import signal
@@ -63,7 +65,7 @@ def _run_worker(
     while True:
         setproctitle("airflow worker -- LocalExecutor: <idle>")
         try:
-            workload = input.get()
+            message = input.get()
         except EOFError:
             log.info(
                 "Failed to read tasks from the task queue because the other "
@@ -72,29 +74,51 @@ def _run_worker(
             )
             break
 
-        if workload is None:
+        if message is None:
             # Received poison pill, no more tasks to run
             return
 
-        if not isinstance(workload, workloads.ExecuteTask):
-            raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
-
         # Decrement this as soon as we pick up a message off the queue
         with unread_messages:
             unread_messages.value -= 1
-        key = None
-        if ti := getattr(workload, "ti", None):
-            key = ti.key
+
+        if isinstance(message, list):
+            # A batch of workloads: run them one after the other and report all their results at once
+            output.put(_run_batch(log, message))
         else:
-            raise TypeError(f"Don't know how to get ti key from {type(workload).__name__}")
+            output.put(_run_workload(log, message))
 
+
+def _run_batch(log: logging.Logger, batch: list[workloads.All]) -> list[TaskInstanceStateType]:
+    """Run the workloads of a batch, keeping the results of the others when one of them can't be run."""
+    results = []
+    for workload in batch:
         try:
-            _execute_work(log, workload)
+            results.append(_run_workload(log, workload))
+        except (ValueError, TypeError) as e:
+            log.exception("Could not run workload %s of a batch", type(workload).__name__)
+            if ti := getattr(workload, "ti", None):
+                results.append((ti.key, TaskInstanceState.FAILED, e))
+    return results
+
+
+def _run_workload(log: logging.Logger, workload: workloads.All) -> TaskInstanceStateType:
+    if not isinstance(workload, workloads.ExecuteTask):
+        raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
+
+    key = None
+    if ti := getattr(workload, "ti", None):
+        key = ti.key
+    else:
+        raise TypeError(f"Don't know how to get ti key from {type(workload).__name__}")
+
+    try:
+        _execute_work(log, workload)
 
-            output.put((key, TaskInstanceState.SUCCESS, None))
-        except Exception as e:
-            log.exception("uhoh")
-            output.put((key, TaskInstanceState.FAILED, e))
+        return key, TaskInstanceState.SUCCESS, None
+    except Exception as e:
+        log.exception("uhoh")
+        return key, TaskInstanceState.FAILED, e
 
 
 def _execute_work(log: logging.Logger, workload: workloads.ExecuteTask) -> None:
@@ -134,6 +158,12 @@ class LocalExecutor(BaseExecutor):
 
     It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
 
+    With ``[local_executor] prefork_workers`` enabled, worker processes are forked from a "forkserver"
+    process that has already imported ``[local_executor] prefork_preload_modules``, rather than from the
+    scheduler. With ``[local_executor] worker_batch_size`` greater than one, workloads are sent to the
+    workers (and their results sent back) in batches, once per heartbeat. A worker runs the workloads of a
+    batch one after the other.
+
     :param parallelism: how many parallel processes are run in the executor
     """
 
@@ -141,28 +171,45 @@ class LocalExecutor(BaseExecutor):
 
     serve_logs: bool = True
 
-    activity_queue: SimpleQueue[workloads.All | None]
-    result_queue: SimpleQueue[TaskInstanceStateType]
-    workers: dict[int, multiprocessing.Process]
+    activity_queue: SimpleQueue[workloads.All | list[workloads.All] | None]
+    result_queue: SimpleQueue[TaskInstanceStateType | list[TaskInstanceStateType]]
+    workers: dict[int, multiprocessing.process.BaseProcess]
     _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
 
     def __init__(self, parallelism: int = PARALLELISM):
         super().__init__(parallelism=parallelism)
         if self.parallelism < 0:
             raise ValueError("parallelism must be greater than or equal to 0")
+        self.prefork_workers = conf.getboolean("local_executor", "prefork_workers", fallback=False)
+        self.worker_batch_size = conf.getint("local_executor", "worker_batch_size", fallback=1)
+        if self.worker_batch_size < 1:
+            raise ValueError("[local_executor] worker_batch_size must be greater than or equal to 1")
+        self._pending_workloads: list[workloads.All] = []
+
+    def _get_mp_context(self) -> multiprocessing.context.BaseContext:
+        if not self.prefork_workers:
+            return multiprocessing.get_context()
+        ctx = multiprocessing.get_context("forkserver")
+        preload = conf.getlist("local_executor", "prefork_preload_modules", fallback=[])
+        # The forkserver is started (and the modules imported) when the first worker is spawned
+        ctx.set_forkserver_preload([__name__, *preload])
+        return ctx
 
     def start(self) -> None:
         """Start the executor."""
         # We delay opening these queues until the start method mostly for unit tests. ExecutorLoader caches
         # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the queues, then test 2
         # comes back and gets the same LocalExecutor instance, so we have to open new here.)
-        self.activity_queue = SimpleQueue()
-        self.result_queue = SimpleQueue()
+        # Queues and locks have to come from the same context as the workers that use them.
+        self._mp_context = self._get_mp_context()
+        self.activity_queue = self._mp_context.SimpleQueue()
+        self.result_queue = self._mp_context.SimpleQueue()
         self.workers = {}
+        self._pending_workloads = []
 
         # Mypy sees this value as `SynchronizedBase[c_uint]`, but that isn't the right runtime type behaviour
         # (it looks like an int to python)
-        self._unread_messages = multiprocessing.Value(ctypes.c_uint)
+        self._unread_messages = self._mp_context.Value(ctypes.c_uint)
 
     def _check_workers(self):
         # Reap any dead workers
@@ -193,7 +240,7 @@ class LocalExecutor(BaseExecutor):
             self._spawn_worker()
 
     def _spawn_worker(self):
-        p = multiprocessing.Process(
+        p = self._mp_context.Process(
             target=_run_worker,
             kwargs={
                 "logger_name": self.log.name,
@@ -210,13 +257,31 @@ class LocalExecutor(BaseExecutor):
     def sync(self) -> None:
         """Sync will get called periodically by the heartbeat method."""
         self._read_results()
+        self._send_pending_workloads()
         self._check_workers()
 
     def _read_results(self):
         while not self.result_queue.empty():
-            key, state, exc = self.result_queue.get()
+            message = self.result_queue.get()
+
+            for key, state, _ in message if isinstance(message, list) else [message]:
+                self.change_state(key, state)
+
+    def _send_pending_workloads(self) -> None:
+        """
+        Send the workloads queued since the last heartbeat to the workers, in batches of ``worker_batch_size``.
 
-            self.change_state(key, state)
+        A worker runs the workloads of its batch one after the other, and reports their results once the
+        whole batch is done.
+        """
+        if not self._pending_workloads:
+            return
+        pending, self._pending_workloads = self._pending_workloads, []
+        for i in range(0, len(pending), self.worker_batch_size):
+            self.activity_queue.put(pending[i : i + self.worker_batch_size])
+            with self._unread_messages:
+                self._unread_messages.value += 1
+            self._check_workers()
 
     def end(self) -> None:
         """End the executor."""
@@ -225,6 +290,9 @@ class LocalExecutor(BaseExecutor):
             "; waiting for running tasks to finish.  Signal again if you don't want to wait."
         )
 
+        # Don't leave behind the workloads queued since the last heartbeat
+        self._send_pending_workloads()
+
         # We can't tell which proc will pick which close message up, so we send all the messages, and then
         # wait on all the procs
 
@@ -249,6 +317,10 @@ class LocalExecutor(BaseExecutor):
 
     @provide_session
     def queue_workload(self, workload: workloads.All, session: Session = NEW_SESSION):
+        if self.worker_batch_size > 1:
+            # Sent to the workers at the next heartbeat
+            self._pending_workloads.append(workload)
+            return
         self.activity_queue.put(workload)
         with self._unread_messages:
             self._unread_messages.value += 1
@@ -153,6 +153,9 @@ class RunTrigger(BaseModel):
 
     encrypted_kwargs: str
 
+    encrypted_checkpoint: str | None = None
+    """The state the trigger last saved, to resume it from, if any."""
+
     timeout_after: datetime | None = None
 
     type: Literal["RunTrigger"] = Field(init=False, default="RunTrigger")
@@ -18,14 +18,16 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import heapq
+import json
 import logging
 import os
 import selectors
 import signal
 import sys
 import time
-from collections import deque
-from collections.abc import Generator, Iterable
+from collections import Counter, defaultdict, deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Generator, Hashable, Iterable
 from contextlib import suppress
 from datetime import datetime
 from socket import socket
@@ -88,11 +90,12 @@ if TYPE_CHECKING:
     from airflow.jobs.job import Job
     from airflow.sdk.api.client import Client
     from airflow.sdk.types import RuntimeTaskInstanceProtocol as RuntimeTI
-    from airflow.triggers.base import BaseTrigger
+    from airflow.triggers.base import BaseTrigger, TriggerEvent
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "ShardedTriggerRunnerSupervisor",
     "TriggerRunner",
     "TriggerRunnerSupervisor",
     "TriggererJobRunner",
@@ -103,13 +106,18 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
     """
     Run active triggers in asyncio and update their dependent tests/DAGs once their events have fired.
 
-    It runs as two threads:
-     - The main thread does DB calls/checkins
-     - A subthread runs all the async code
+    It runs as two processes:
+     - The main process does DB calls/checkins
+     - A subprocess runs all the async code
+
+    With ``[triggerer] runner_processes`` set to more than one, the async code is split across that many
+    subprocesses, see :class:`ShardedTriggerRunnerSupervisor`.
     """
 
     job_type = "TriggererJob"
 
+    trigger_runner: TriggerRunnerSupervisor | ShardedTriggerRunnerSupervisor
+
     def __init__(
         self,
         job: Job,
@@ -161,10 +169,15 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
     def _execute(self) -> int | None:
         self.log.info("Starting the triggerer")
         try:
-            # Kick off runner sub-process without DB access
-            self.trigger_runner = TriggerRunnerSupervisor.start(
-                job=self.job, capacity=self.capacity, logger=log
-            )
+            # Kick off runner sub-process(es) without DB access
+            if (num_runners := conf.getint("triggerer", "runner_processes", fallback=1)) > 1:
+                self.trigger_runner = ShardedTriggerRunnerSupervisor.start(
+                    job=self.job, capacity=self.capacity, num_runners=num_runners, logger=log
+                )
+            else:
+                self.trigger_runner = TriggerRunnerSupervisor.start(
+                    job=self.job, capacity=self.capacity, logger=log
+                )
 
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
@@ -191,6 +204,8 @@ class messages:
         """Tell the async trigger runner process to start, and where to send status update messages."""
 
         type: Literal["StartTriggerer"] = "StartTriggerer"
+        # Trigger classes to import in the background, before any triggers need them
+        preload_classpaths: list[str] = []
 
     class TriggerStateChanges(BaseModel):
         """
@@ -209,6 +224,12 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        # Seconds each trigger has spent running in the event loop since the last report, and the seconds since
+        # the last report
+        loop_time: dict[int, float] | None = None
+        loop_time_period: float | None = None
+        # The latest (encrypted) checkpoint of the triggers that saved one since the last report
+        checkpoints: dict[int, str] | None = None
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
@@ -293,11 +314,13 @@ class TriggerLoggingFactory:
 
         log_file = init_log_file(self.log_path)
 
+        # Append, as the same trigger can be started more than once by this triggerer (for instance when it is
+        # moved between the runners of a ShardedTriggerRunnerSupervisor)
         pretty_logs = False
         if pretty_logs:
-            underlying_logger: WrappedLogger = structlog.WriteLogger(log_file.open("w", buffering=1))
+            underlying_logger: WrappedLogger = structlog.WriteLogger(log_file.open("a", buffering=1))
         else:
-            underlying_logger = structlog.BytesLogger(log_file.open("wb"))
+            underlying_logger = structlog.BytesLogger(log_file.open("ab"))
         logger = structlog.wrap_logger(underlying_logger, processors=processors).bind()
         self.bound_logger = logger
         return logger
@@ -319,6 +342,42 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+@attrs.define
+class TriggerHandover:
+    """
+    The triggers an overloaded triggerer is handing over to another triggerer (see ``Trigger.rebalance``).
+
+    They stay assigned to this triggerer until it has stopped running them, and are only handed over then, so
+    that they never run on both triggerers at once.
+    """
+
+    target_id: int | None = None
+    trigger_ids: set[int] = attrs.field(factory=set)
+    last_rebalance: float = 0
+
+    def rebalance(self, job_id: int, capacity: int, known_trigger_ids: set[int]) -> None:
+        """
+        Hand over the triggers that have stopped, and pick triggers to hand over if we're overloaded.
+
+        Triggers are picked at most once a minute (as often as trigger costs are updated), and only once the
+        previous ones have all been handed over.
+
+        :param known_trigger_ids: The triggers this triggerer is still running or reporting on.
+        """
+        if self.target_id is not None and (stopped := self.trigger_ids - known_trigger_ids):
+            Trigger.hand_over(list(stopped), job_id, self.target_id)
+            self.trigger_ids -= stopped
+        load_balance_threshold = TriggerRunnerSupervisor.load_balance_threshold
+        if self.trigger_ids or load_balance_threshold <= 0:
+            return
+        if (now := time.monotonic()) - self.last_rebalance >= 60:
+            self.target_id, trigger_ids = Trigger.rebalance(
+                job_id, capacity, TriggerRunnerSupervisor.health_check_threshold, load_balance_threshold
+            )
+            self.trigger_ids = set(trigger_ids)
+            self.last_rebalance = now
+
+
 @attrs.define(kw_only=True)
 class TriggerRunnerSupervisor(WatchedSubprocess):
     """
@@ -332,6 +391,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     capacity: int
 
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+    load_balance_threshold = conf.getfloat("triggerer", "load_balance_threshold", fallback=0.5)
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -357,6 +417,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # Event loop time reported by the async process that we have yet to record in the DB
+    loop_time: Counter[int] = attrs.field(factory=Counter, init=False)
+    loop_time_period: float | None = attrs.field(default=None, init=False)
+
+    # Trigger checkpoints reported by the async process that we have yet to write to the DB
+    checkpoints: dict[int, str] = attrs.field(factory=dict, init=False)
+
+    handover: TriggerHandover = attrs.field(factory=TriggerHandover, init=False)
+
     def is_alive(self) -> bool:
         # Set by `_service_subprocess` in the loop
         return self._exit_code is None
@@ -367,11 +436,20 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         *,
         job: Job,
         logger=None,
+        close_in_child: Iterable[socket] = (),
         **kwargs,
     ):
-        proc = super().start(id=job.id, job=job, target=cls.run_in_process, logger=logger, **kwargs)
+        """
+        Start the trigger runner subprocess.
+
+        :param close_in_child: Sockets of this process that the subprocess should not keep open.
+        """
+        target = functools.partial(cls.run_in_process, tuple(close_in_child))
+        proc = super().start(id=job.id, job=job, target=target, logger=logger, **kwargs)
 
-        msg = messages.StartTriggerer()
+        msg = messages.StartTriggerer(
+            preload_classpaths=Trigger.get_classpaths(job.id, cls.health_check_threshold)
+        )
         proc.send_msg(msg, request_id=0)
         return proc
 
@@ -400,6 +478,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 self.events.extend(msg.events)
             if msg.failures:
                 self.failed_triggers.extend(msg.failures)
+            if msg.loop_time:
+                self.loop_time.update(msg.loop_time)
+                self.loop_time_period = msg.loop_time_period
+            if msg.checkpoints:
+                self.checkpoints.update(msg.checkpoints)
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
@@ -524,6 +607,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
                 self.handle_events()
                 self.handle_failed_triggers()
+                self.handle_loop_time()
+                self.handle_checkpoints()
                 self.clean_unused()
                 self.heartbeat()
 
@@ -538,20 +623,26 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     @add_debug_span
     def load_triggers(self):
         """Query the database for the triggers we're supposed to be running and update the runner."""
-        Trigger.assign_unassigned(self.job.id, self.capacity, self.health_check_threshold)
+        self.handover.rebalance(self.job.id, self.capacity, self.known_trigger_ids)
+        Trigger.assign_unassigned(
+            self.job.id, self.capacity, self.health_check_threshold, self.load_balance_threshold
+        )
         ids = Trigger.ids_for_triggerer(self.job.id)
-        self.update_triggers(set(ids))
+        self.update_triggers(set(ids) - self.handover.trigger_ids)
 
     @add_debug_span
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
+        if not self.events:
+            return
+        # Pull out of the deque in a thread-safe manner
+        events_to_submit = []
         while self.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
-            # Emit stat event
-            Stats.incr("triggers.succeeded")
+            events_to_submit.append(self.events.popleft())
+        # Tell the model to wake up their tasks, all at once
+        Trigger.submit_events(events_to_submit)
+        # Emit stat event
+        Stats.incr("triggers.succeeded", len(events_to_submit))
 
     @add_debug_span
     def clean_unused(self):
@@ -572,6 +663,19 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             # Emit stat event
             Stats.incr("triggers.failed")
 
+    @add_debug_span
+    def handle_loop_time(self):
+        """Record the time the triggers have spent in the event loop, so it can be seen in the API."""
+        if self.loop_time:
+            Trigger.add_loop_time(dict(self.loop_time), period=self.loop_time_period)
+            self.loop_time.clear()
+
+    def handle_checkpoints(self):
+        """Write the checkpoints the triggers saved to the DB, to resume them from should they be moved."""
+        if self.checkpoints:
+            Trigger.save_checkpoints(self.checkpoints)
+            self.checkpoints.clear()
+
     def emit_metrics(self):
         Stats.gauge(f"triggers.running.{self.job.hostname}", len(self.running_triggers))
         Stats.gauge("triggers.running", len(self.running_triggers), tags={"hostname": self.job.hostname})
@@ -589,6 +693,16 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             }
         )
 
+    @property
+    def known_trigger_ids(self) -> set[int]:
+        """IDs of the triggers that are starting, running, or that we still have to report on, in this runner."""
+        return (
+            self.running_triggers.union(workload.id for workload in self.creating_triggers)
+            .union(x[0] for x in self.events)
+            .union(self.cancelling_triggers)
+            .union(trigger[0] for trigger in self.failed_triggers)
+        )
+
     def update_triggers(self, requested_trigger_ids: set[int]):
         """
         Request that we update what triggers we're running.
@@ -599,13 +713,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         """
         render_log_fname = log_filename_template_renderer()
 
-        known_trigger_ids = (
-            self.running_triggers.union(x[0] for x in self.events)
-            .union(self.cancelling_triggers)
-            .union(trigger[0] for trigger in self.failed_triggers)
-        )
         # Work out the two difference sets
-        new_trigger_ids = requested_trigger_ids - known_trigger_ids
+        new_trigger_ids = requested_trigger_ids - self.known_trigger_ids
         cancel_trigger_ids = self.running_triggers - requested_trigger_ids
         # Bulk-fetch new trigger records
         new_triggers = Trigger.bulk_fetch(new_trigger_ids)
@@ -638,6 +747,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 classpath=new_trigger_orm.classpath,
                 id=new_id,
                 encrypted_kwargs=new_trigger_orm.encrypted_kwargs,
+                encrypted_checkpoint=new_trigger_orm.encrypted_checkpoint,
                 ti=None,
             )
             if new_trigger_orm.task_instance:
@@ -728,10 +838,165 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 log.log(lvl_name, event.pop("event", None), **event)
 
     @classmethod
-    def run_in_process(cls):
+    def run_in_process(cls, close_sockets: Iterable[socket] = ()):
+        for sock in close_sockets:
+            sock.close()
         TriggerRunner().run()
 
 
+@attrs.define(kw_only=True)
+class ShardedTriggerRunnerSupervisor:
+    """
+    Run the triggers of one triggerer job in several TriggerRunner subprocesses, each with its own event loop.
+
+    A trigger that blocks its event loop (with CPU heavy work, or blocking IO) only holds up the triggers that
+    share a runner with it, and the triggerer can make use of more than one CPU core. All DB access still
+    happens in this process, which partitions the triggers assigned to the job between the runners.
+
+    A trigger stays on the runner it was started on, and new triggers are given to the runner with the fewest
+    triggers. When the runners get out of balance (because the triggers of one of them finished, say) the
+    excess triggers of the busiest runners are cancelled, and once they have stopped they are started again on
+    the least busy runners.
+    """
+
+    job: Job
+    capacity: int
+    runners: list[TriggerRunnerSupervisor]
+    selector: selectors.BaseSelector = attrs.field(repr=False)
+
+    stop: bool = False
+    handover: TriggerHandover = attrs.field(factory=TriggerHandover, init=False)
+
+    @classmethod
+    def start(
+        cls, *, job: Job, capacity: int, num_runners: int, logger=None
+    ) -> ShardedTriggerRunnerSupervisor:
+        # All the runners register their sockets in the same selector, so we can wait on all of them at once
+        selector = selectors.DefaultSelector()
+        runners: list[TriggerRunnerSupervisor] = []
+        for _ in range(num_runners):
+            # The runners started earlier have sockets open in this process which a new runner would inherit.
+            # If the new runner kept them open, the earlier runners would not see EOF should we go away.
+            inherited = [sock for runner in runners for sock in runner._open_sockets]
+            runners.append(
+                TriggerRunnerSupervisor.start(
+                    job=job,
+                    capacity=-(-capacity // num_runners),
+                    logger=logger,
+                    selector=selector,
+                    close_in_child=inherited,
+                )
+            )
+        return cls(job=job, capacity=capacity, runners=runners, selector=selector)
+
+    @property
+    def _exit_code(self) -> int | None:
+        return next((runner._exit_code for runner in self.runners if runner._exit_code is not None), None)
+
+    def run(self) -> None:
+        """Run synchronously and handle all database reads/writes."""
+        from airflow.sdk.execution_time.secrets_masker import reset_secrets_masker
+
+        reset_secrets_masker()
+
+        while not self.stop:
+            if any(not runner.is_alive() for runner in self.runners):
+                log.error("Trigger runner process has died! Exiting.")
+                break
+            with DebugTrace.start_span(span_name="triggerer_job_loop", component="TriggererJobRunner"):
+                self.load_triggers()
+
+                # Wait for up to 1 second for activity
+                self._service_subprocesses(1)
+
+                for runner in self.runners:
+                    runner.handle_events()
+                    runner.handle_failed_triggers()
+                    runner.handle_loop_time()
+                    runner.handle_checkpoints()
+                Trigger.clean_unused()
+                perform_heartbeat(
+                    self.job, heartbeat_callback=self.runners[0].heartbeat_callback, only_if_necessary=True
+                )
+
+                self.emit_metrics()
+
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ):
+        for runner in self.runners:
+            runner.kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+
+    def _service_subprocesses(self, max_wait_time: float) -> None:
+        for key, _ in self.selector.select(timeout=max(0.01, max_wait_time)):
+            WatchedSubprocess._run_socket_handler(key)
+        for runner in self.runners:
+            runner._check_subprocess_exit()
+
+    @add_debug_span
+    def load_triggers(self):
+        """Query the database for the triggers we're supposed to be running and split them between runners."""
+        self.handover.rebalance(
+            self.job.id, self.capacity, set().union(*(runner.known_trigger_ids for runner in self.runners))
+        )
+        Trigger.assign_unassigned(
+            self.job.id,
+            self.capacity,
+            TriggerRunnerSupervisor.health_check_threshold,
+            TriggerRunnerSupervisor.load_balance_threshold,
+        )
+        ids = set(Trigger.ids_for_triggerer(self.job.id)) - self.handover.trigger_ids
+        for runner, runner_ids in zip(self.runners, self.partition_triggers(ids)):
+            runner.update_triggers(runner_ids)
+
+    def partition_triggers(self, trigger_ids: set[int]) -> list[set[int]]:
+        """
+        Work out which of the triggers assigned to this job each runner should be running.
+
+        A trigger a runner knows about is never given to another runner until the first one reports that it
+        has stopped, so a trigger moved between runners is never running twice.
+        """
+        assignments: list[set[int]] = []
+        unplaced = set(trigger_ids)
+        target = -(-len(trigger_ids) // len(self.runners))
+        slack = max(1, target // 10)
+        for runner in self.runners:
+            known = runner.known_trigger_ids & unplaced
+            unplaced -= known
+            keep = known - runner.cancelling_triggers
+            if len(keep) > target + slack:
+                # Move the newest triggers, the older ones are more likely to be close to done
+                excess = sorted(keep & runner.running_triggers, reverse=True)[: len(keep) - target]
+                log.info("Moving triggers to a less busy runner", runner_pid=runner.pid, count=len(excess))
+                keep.difference_update(excess)
+            assignments.append(keep)
+
+        for trigger_id in sorted(unplaced):
+            min(assignments, key=len).add(trigger_id)
+        return assignments
+
+    def emit_metrics(self):
+        running = sum(len(runner.running_triggers) for runner in self.runners)
+        Stats.gauge(f"triggers.running.{self.job.hostname}", running)
+        Stats.gauge("triggers.running", running, tags={"hostname": self.job.hostname})
+
+        capacity_left = self.capacity - running
+        Stats.gauge(f"triggerer.capacity_left.{self.job.hostname}", capacity_left)
+        Stats.gauge("triggerer.capacity_left", capacity_left, tags={"hostname": self.job.hostname})
+
+        span = Trace.get_current_span()
+        span.set_attributes(
+            {
+                "trigger host": self.job.hostname,
+                "triggers running": running,
+                "capacity left": capacity_left,
+            }
+        )
+
+
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
@@ -740,6 +1005,173 @@ class TriggerDetails(TypedDict):
     events: int
 
 
+class _TimedCoroutine(Coroutine):
+    """
+    Wrap a coroutine, and report how long each step of it took.
+
+    The event loop runs a task by calling ``send`` (or ``throw``) on its coroutine, which returns once the
+    coroutine next awaits something. So the time spent in those calls is exactly the time the coroutine kept
+    every other task in the loop waiting.
+    """
+
+    __slots__ = ("_coro", "_on_step")
+
+    def __init__(self, coro: Coroutine, on_step: Callable[[float], None]):
+        self._coro = coro
+        self._on_step = on_step
+
+    def send(self, value):
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._on_step(time.perf_counter() - start)
+
+    def throw(self, *args):
+        start = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._on_step(time.perf_counter() - start)
+
+    def close(self):
+        self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+
+# Sent by a shared trigger run to its subscribers once the trigger has finished
+_SHARED_TRIGGER_FINISHED = object()
+
+
+@attrs.define(eq=False)
+class _SharedTriggerRun:
+    """
+    One run of a trigger, whose events go to all the triggers subscribed to it.
+
+    Only new subscribers that join before the first event is fired get to share a run; once it has fired
+    (which for most triggers means it is about to finish) later ones start a new run. The checkpoints the
+    trigger saves are saved for every subscriber.
+    """
+
+    key: Hashable
+    trigger: BaseTrigger
+    shared_runs: dict[Hashable, _SharedTriggerRun] = attrs.field(repr=False)
+    on_step: Callable[[float], None] = attrs.field(repr=False)
+
+    subscribers: list[asyncio.Queue] = attrs.field(factory=list, init=False)
+    task: asyncio.Task | None = attrs.field(default=None, init=False)
+    # How to save a checkpoint for each subscriber
+    on_checkpoint: dict[asyncio.Queue, Callable[[dict[str, Any]], None]] = attrs.field(
+        factory=dict, init=False, repr=False
+    )
+
+    def __attrs_post_init__(self):
+        self.trigger._on_checkpoint = self._save_checkpoint
+
+    def subscribe(self, on_checkpoint: Callable[[dict[str, Any]], None] | None = None) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.append(queue)
+        if on_checkpoint is not None:
+            self.on_checkpoint[queue] = on_checkpoint
+            # A subscriber joining a run that is under way resumes from where the run is
+            if self.task is not None and self.trigger.checkpoint is not None:
+                on_checkpoint(self.trigger.checkpoint)
+        if self.task is None:
+            self.task = asyncio.create_task(_TimedCoroutine(self.run(), self.on_step))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with suppress(ValueError):
+            self.subscribers.remove(queue)
+        self.on_checkpoint.pop(queue, None)
+        if not self.subscribers:
+            self._close()
+            if self.task:
+                self.task.cancel()
+
+    def _close(self) -> None:
+        """Stop new subscribers from joining this run."""
+        if self.shared_runs.get(self.key) is self:
+            del self.shared_runs[self.key]
+
+    def _publish(self, item: Any) -> None:
+        for queue in self.subscribers:
+            queue.put_nowait(item)
+
+    def _save_checkpoint(self, state: dict[str, Any]) -> None:
+        for on_checkpoint in self.on_checkpoint.values():
+            on_checkpoint(state)
+
+    async def run(self):
+        try:
+            async for event in self.trigger.run():
+                self._close()
+                self._publish(event)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            self._publish(e)
+        else:
+            self._publish(_SHARED_TRIGGER_FINISHED)
+        finally:
+            self._close()
+            with suppress(Exception):
+                await self.trigger.cleanup()
+
+
+class _SharedTriggerSubscriber(events.BaseTrigger):
+    """Stands in for a trigger that shares a run with identical triggers, and passes on the events of that run."""
+
+    def __init__(
+        self,
+        *,
+        key: Hashable,
+        trigger: BaseTrigger,
+        shared_runs: dict[Hashable, _SharedTriggerRun],
+        on_step: Callable[[float], None],
+        timeout_after: datetime | None = None,
+    ):
+        super().__init__()
+        self.key = key
+        self.trigger = trigger
+        self.trigger_id = trigger.trigger_id
+        self.task_instance = trigger.task_instance
+        self.timeout_after = timeout_after
+        self.shared_runs = shared_runs
+        self.on_step = on_step
+        # The shared run replaces the callback of the trigger it runs, so keep hold of ours
+        self.on_checkpoint = trigger._on_checkpoint
+        self._subscription: tuple[_SharedTriggerRun, asyncio.Queue] | None = None
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return self.trigger.serialize()
+
+    async def run(self) -> AsyncIterator[events.TriggerEvent]:
+        if (shared := self.shared_runs.get(self.key)) is None:
+            shared = self.shared_runs[self.key] = _SharedTriggerRun(
+                self.key, self.trigger, self.shared_runs, self.on_step
+            )
+        else:
+            Stats.incr("triggers.coalesced")
+        queue = shared.subscribe(self.on_checkpoint)
+        self._subscription = (shared, queue)
+        try:
+            while (item := await queue.get()) is not _SHARED_TRIGGER_FINISHED:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            await self.cleanup()
+
+    async def cleanup(self) -> None:
+        if self._subscription:
+            shared, queue = self._subscription
+            self._subscription = None
+            shared.unsubscribe(queue)
+
+
 @attrs.define(kw_only=True)
 class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _async_writer: asyncio.StreamWriter = attrs.field(alias="async_writer")
@@ -814,6 +1246,29 @@ class TriggerRunner:
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException | None]]
 
+    # Seconds each trigger has spent running in the event loop since we last reported it, and the same by
+    # trigger classpath
+    loop_time: defaultdict[int, float]
+    loop_time_by_classpath: defaultdict[str, float]
+
+    # Steps of triggers that took long enough to hold up the event loop, for the watchdog to report on
+    slow_steps: deque[tuple[str, str, float]]
+
+    # Runs of triggers that are shared by identical triggers, by coalescing key
+    shared_runs: dict[Hashable, _SharedTriggerRun]
+
+    # Triggers that only wait for a point in time are not run. We keep a heap of (timestamp, trigger ID) for
+    # them instead, and the event to fire once the time is up, with how to record the time firing it took
+    timers: list[tuple[float, int]]
+    timer_events: dict[int, tuple[TriggerEvent, Callable[[float], None]]]
+
+    # The latest checkpoint saved by each trigger since we last reported them
+    checkpoints: dict[int, dict[str, Any]]
+
+    # Timers that have fired or were cancelled, and triggers cancelled before we created them, that we have
+    # yet to report as finished
+    finished_timers: list[int]
+
     # Should-we-stop flag
     # TODO: set this in a sig-int handler
     stop: bool = False
@@ -831,6 +1286,21 @@ class TriggerRunner:
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.loop_time = defaultdict(float)
+        self.loop_time_by_classpath = defaultdict(float)
+        self.slow_steps = deque()
+        self.shared_runs = {}
+        self.timers = []
+        self.timer_events = {}
+        self.finished_timers = []
+        self.checkpoints = {}
+        self.coalesce_identical_triggers = conf.getboolean(
+            "triggerer", "coalesce_identical_triggers", fallback=False
+        )
+        self.trigger_creation_batch_size = conf.getint(
+            "triggerer", "trigger_creation_batch_size", fallback=1000
+        )
+        self.checkpoint_interval = conf.getfloat("triggerer", "checkpoint_interval", fallback=30)
         self.job_id = None
 
     def run(self):
@@ -844,31 +1314,50 @@ class TriggerRunner:
         Actual triggers run in their own separate coroutines.
         """
         # Make sure comms are initialized before allowing any Triggers to run
-        await self.init_comms()
+        start_msg = await self.init_comms()
 
         watchdog = asyncio.create_task(self.block_watchdog())
+        timers = asyncio.create_task(self.run_timers())
+        preload = asyncio.create_task(self.preload_trigger_classes(start_msg.preload_classpaths))
 
-        last_status = time.monotonic()
+        last_status = last_checkpoint = time.monotonic()
         try:
             while not self.stop:
                 # Raise exceptions from the tasks
                 if watchdog.done():
                     watchdog.result()
+                if timers.done():
+                    timers.result()
 
                 # Run core logic
 
                 finished_ids = await self.cleanup_finished_triggers()
+                # Every minute, log status
+                loop_time = loop_time_period = None
+                if (now := time.monotonic()) - last_status >= 60:
+                    count = len(self.triggers) + len(self.timer_events)
+                    self.log.info("%i triggers currently running", count)
+                    loop_time, loop_time_period = self.report_loop_time(), now - last_status
+                    last_status = now
+                checkpoints = None
+                if now - last_checkpoint >= self.checkpoint_interval:
+                    checkpoints = {
+                        trigger_id: Trigger.encrypt_kwargs(state)
+                        for trigger_id, state in self.checkpoints.items()
+                    }
+                    self.checkpoints.clear()
+                    last_checkpoint = now
                 # This also loads the triggers we need to create or cancel
-                await self.sync_state_to_supervisor(finished_ids)
+                await self.sync_state_to_supervisor(
+                    finished_ids,
+                    loop_time=loop_time,
+                    loop_time_period=loop_time_period,
+                    checkpoints=checkpoints,
+                )
                 await self.create_triggers()
                 await self.cancel_triggers()
                 # Sleep for a bit
                 await asyncio.sleep(1)
-                # Every minute, log status
-                if (now := time.monotonic()) - last_status >= 60:
-                    count = len(self.triggers)
-                    self.log.info("%i triggers currently running", count)
-                    last_status = now
 
         except Exception:
             with suppress(BrokenPipeError):
@@ -877,13 +1366,17 @@ class TriggerRunner:
             raise
         # Wait for supporting tasks to complete
         await watchdog
+        await timers
+        await preload
 
-    async def init_comms(self):
+    async def init_comms(self) -> messages.StartTriggerer:
         """
         Set up the communications pipe between this process and the supervisor.
 
         This also sets up the SUPERVISOR_COMMS so that TaskSDK code can work as expected too (but that will
         need to be wrapped in an ``sync_to_async()`` call)
+
+        :return: The start message the supervisor sent us.
         """
         from airflow.sdk.execution_time import task_runner
 
@@ -901,28 +1394,55 @@ class TriggerRunner:
 
         if not isinstance(msg, messages.StartTriggerer):
             raise RuntimeError(f"Required first message to be a messages.StartTriggerer, it was {msg}")
+        return msg
+
+    async def preload_trigger_classes(self, classpaths: Iterable[str]) -> None:
+        """
+        Import the given trigger classes in a background thread.
+
+        This warms up the trigger class cache after a (re)start, so that the event loop is not held up
+        importing big provider modules while it recreates thousands of triggers.
+        """
+        for classpath in classpaths:
+            if self.stop:
+                return
+            try:
+                await asyncio.to_thread(self.get_trigger_by_classpath, classpath)
+            except Exception:
+                # We will fail the triggers using it properly once we try to create them
+                self.log.debug("Unable to preload trigger class", classpath=classpath, exc_info=True)
 
     async def create_triggers(self):
-        """Drain the to_create queue and create all new triggers that have been requested in the DB."""
+        """
+        Drain the to_create queue and create all new triggers that have been requested in the DB.
+
+        At most ``trigger_creation_batch_size`` triggers are created per call, the rest are left in the queue
+        for the next one.
+        """
+        created = 0
         while self.to_create:
+            if self.trigger_creation_batch_size and created >= self.trigger_creation_batch_size:
+                self.log.info("Created %i triggers, %i left to create", created, len(self.to_create))
+                break
+            created += 1
             await asyncio.sleep(0)
             workload = self.to_create.popleft()
             trigger_id = workload.id
-            if trigger_id in self.triggers:
+            if trigger_id in self.triggers or trigger_id in self.timer_events:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
                 continue
 
             try:
-                trigger_class = self.get_trigger_by_classpath(workload.classpath)
+                # Import trigger classes we have not got yet in a thread, so we don't block the event loop
+                trigger_class = self.trigger_cache.get(workload.classpath) or await asyncio.to_thread(
+                    self.get_trigger_by_classpath, workload.classpath
+                )
             except BaseException as e:
                 # Either the trigger code or the path to it is bad. Fail the trigger.
                 self.log.error("Trigger failed to load code", error=e, classpath=workload.classpath)
                 self.failed_triggers.append((trigger_id, e))
                 continue
 
-            # Loading the trigger class could have been expensive. Lets give other things a chance to run!
-            await asyncio.sleep(0)
-
             try:
                 from airflow.serialization.serialized_objects import smart_decode_trigger_kwargs
 
@@ -942,40 +1462,151 @@ class TriggerRunner:
             trigger_instance.triggerer_job_id = self.job_id
             trigger_instance.task_instance = ti = workload.ti
             trigger_instance.timeout_after = workload.timeout_after
+            if workload.encrypted_checkpoint:
+                try:
+                    trigger_instance.checkpoint = Trigger._decrypt_kwargs(workload.encrypted_checkpoint)
+                except Exception:
+                    self.log.warning(
+                        "Unable to load the checkpoint of trigger, starting it afresh", trigger_id=trigger_id
+                    )
+            trigger_instance._on_checkpoint = functools.partial(self.record_checkpoint, trigger_id)
 
             trigger_name = (
                 f"{ti.dag_id}/{ti.run_id}/{ti.task_id}/{ti.map_index}/{ti.try_number} (ID {trigger_id})"
                 if ti
                 else f"ID {trigger_id}"
             )
+            # Time every step of the trigger, so we can tell which triggers are blocking the event loop
+            on_step = functools.partial(self.record_step, trigger_id, trigger_name, workload.classpath)
+            if (timer := self.get_timer(workload.classpath, trigger_instance)) is not None:
+                self.add_timer(trigger_id, *timer, on_step)
+                continue
+
+            if (key := self.get_coalescing_key(workload.classpath, trigger_instance)) is not None:
+                trigger_instance = self.share_trigger(
+                    key, trigger_instance, on_step, timeout_after=workload.timeout_after
+                )
+            coro = _TimedCoroutine(self.run_trigger(trigger_id, trigger_instance), on_step)
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance), name=trigger_name
-                ),
+                "task": asyncio.create_task(coro, name=trigger_name),
                 "name": trigger_name,
                 "events": 0,
             }
 
+    def record_checkpoint(self, trigger_id: int, state: dict[str, Any]) -> None:
+        """Keep the checkpoint a trigger saved, to send it to the supervisor with the next batch."""
+        self.checkpoints[trigger_id] = state
+
+    def get_timer(self, classpath: str, trigger: BaseTrigger) -> tuple[datetime, TriggerEvent] | None:
+        """Return when the trigger fires and with what event, if all it does is wait for that time."""
+        try:
+            return trigger.timer()
+        except Exception:
+            self.log.warning("Unable to get the timer of trigger, running it instead", classpath=classpath)
+            return None
+
+    def add_timer(
+        self, trigger_id: int, moment: datetime, event: TriggerEvent, on_step: Callable[[float], None]
+    ) -> None:
+        heapq.heappush(self.timers, (moment.timestamp(), trigger_id))
+        self.timer_events[trigger_id] = (event, on_step)
+        self.log.info("Trigger waiting until %s", moment, trigger_id=trigger_id)
+
+    def fire_timers(self, now: float) -> None:
+        """Fire the events of the timers that are due at ``now`` (a timestamp)."""
+        while self.timers and self.timers[0][0] <= now:
+            _, trigger_id = heapq.heappop(self.timers)
+            # Cancelled timers are left in the heap, and skipped here
+            if (timer := self.timer_events.pop(trigger_id, None)) is None:
+                continue
+            event, on_step = timer
+            # Firing is the only step of a timer trigger, time it like those of the triggers that run
+            start = time.perf_counter()
+            self.log.info("Trigger fired event", result=event, trigger_id=trigger_id)
+            self.events.append((trigger_id, event))
+            self.finished_timers.append(trigger_id)
+            on_step(time.perf_counter() - start)
+
+    async def run_timers(self):
+        """Fire the events of the timer triggers once they are due."""
+        while not self.stop:
+            now = time.time()
+            self.fire_timers(now)
+            # Wake up at least every second to pick up new timers, and in case the system clock changed
+            await asyncio.sleep(min(self.timers[0][0] - now, 1) if self.timers else 1)
+
+    def get_coalescing_key(self, classpath: str, trigger: BaseTrigger) -> Hashable | None:
+        """Return the key of the shared trigger run the trigger should join, or None if it should run alone."""
+        try:
+            key = trigger.coalescing_key()
+            if key is None and self.coalesce_identical_triggers:
+                from airflow.serialization.serialized_objects import BaseSerialization
+
+                key = json.dumps(BaseSerialization.serialize(trigger.serialize()[1]), sort_keys=True)
+            hash(key)
+        except Exception:
+            self.log.warning(
+                "Unable to get the coalescing key of trigger", classpath=classpath, exc_info=True
+            )
+            return None
+        return None if key is None else (classpath, key)
+
+    def share_trigger(
+        self,
+        key: Hashable,
+        trigger: BaseTrigger,
+        on_step: Callable[[float], None],
+        timeout_after: datetime | None = None,
+    ) -> _SharedTriggerSubscriber:
+        """
+        Wrap a trigger so that it shares its run with any other trigger with the same coalescing key.
+
+        The returned trigger only starts a new run of the trigger when there isn't one to join already. Steps
+        of the shared run are timed as steps of the trigger that started it.
+        """
+        return _SharedTriggerSubscriber(
+            key=key,
+            trigger=trigger,
+            shared_runs=self.shared_runs,
+            on_step=on_step,
+            timeout_after=timeout_after,
+        )
+
     async def cancel_triggers(self):
         """
         Drain the to_cancel queue and ensure all triggers that are not in the DB are cancelled.
 
         This allows the cleanup job to delete them.
         """
+        not_started = set()
         while self.to_cancel:
             trigger_id = self.to_cancel.popleft()
             if trigger_id in self.triggers:
                 # We only delete if it did not exit already
                 self.triggers[trigger_id]["task"].cancel()
+            elif self.timer_events.pop(trigger_id, None) is not None:
+                self.finished_timers.append(trigger_id)
+            else:
+                not_started.add(trigger_id)
             await asyncio.sleep(0)
 
+        # Triggers can be cancelled while they are still waiting for their turn to be created
+        if not_started and self.to_create:
+            to_create = deque()
+            for workload in self.to_create:
+                if workload.id in not_started:
+                    self.finished_timers.append(workload.id)
+                else:
+                    to_create.append(workload)
+            self.to_create = to_create
+
     async def cleanup_finished_triggers(self) -> list[int]:
         """
         Go through all trigger tasks (coroutines) and clean up entries for ones that have exited.
 
         Optionally warn users if the exit was not normal.
         """
-        finished_ids: list[int] = []
+        finished_ids, self.finished_timers = self.finished_timers, []
         for trigger_id, details in list(self.triggers.items()):
             if details["task"].done():
                 finished_ids.append(trigger_id)
@@ -1017,7 +1648,13 @@ class TriggerRunner:
             await asyncio.sleep(0)
         return finished_ids
 
-    async def sync_state_to_supervisor(self, finished_ids: list[int]):
+    async def sync_state_to_supervisor(
+        self,
+        finished_ids: list[int],
+        loop_time: dict[int, float] | None = None,
+        loop_time_period: float | None = None,
+        checkpoints: dict[int, str] | None = None,
+    ):
         # Copy out of our deques in threadsafe manner to sync state with parent
         events_to_send = []
         while self.events:
@@ -1031,7 +1668,12 @@ class TriggerRunner:
             failures_to_send.append((id, tb))
 
         msg = messages.TriggerStateChanges(
-            events=events_to_send, finished=finished_ids, failures=failures_to_send
+            events=events_to_send,
+            finished=finished_ids,
+            failures=failures_to_send,
+            loop_time=loop_time or None,
+            loop_time_period=loop_time_period,
+            checkpoints=checkpoints or None,
         )
 
         if not events_to_send:
@@ -1057,6 +1699,38 @@ class TriggerRunner:
         self.to_create.extend(resp.to_create)
         self.to_cancel.extend(resp.to_cancel)
 
+    def record_step(self, trigger_id: int, name: str, classpath: str, duration: float) -> None:
+        """Record that a step of a trigger held the event loop for ``duration`` seconds."""
+        self.loop_time[trigger_id] += duration
+        self.loop_time_by_classpath[classpath] += duration
+        if duration > 0.1:
+            self.slow_steps.append((name, classpath, duration))
+
+    def report_loop_time(self) -> dict[int, float]:
+        """
+        Emit metrics and log the worst offenders for the time triggers spent in the event loop.
+
+        :return: the seconds each running trigger spent in the event loop since the last report, to store in
+            the DB.
+        """
+        for classpath, seconds in self.loop_time_by_classpath.items():
+            Stats.incr("triggers.loop_time_ms", round(seconds * 1000), tags={"classpath": classpath})
+        self.loop_time_by_classpath.clear()
+
+        # Include the triggers that did not run at all, so that their cost drops to 0
+        loop_time = dict.fromkeys(self.triggers, 0.0)
+        loop_time.update(self.loop_time)
+        if worst := heapq.nlargest(5, self.loop_time.items(), key=lambda item: item[1]):
+            self.log.info(
+                "Triggers that spent the most time in the event loop since the last report",
+                triggers={
+                    self.triggers[id]["name"] if id in self.triggers else f"ID {id}": round(seconds, 3)
+                    for id, seconds in worst
+                },
+            )
+        self.loop_time.clear()
+        return loop_time
+
     async def block_watchdog(self):
         """
         Watchdog loop that detects blocking (badly-written) triggers.
@@ -1066,8 +1740,8 @@ class TriggerRunner:
         there are badly-written triggers taking longer than that and blocking
         the event loop.
 
-        Unfortunately, we can't tell what trigger is blocking things, but
-        we can at least detect the top-level problem.
+        Every step of a trigger is timed (see ``record_step``), so when the
+        loop was held up by a trigger we report which one it was.
         """
         while not self.stop:
             last_run = time.monotonic()
@@ -1075,14 +1749,25 @@ class TriggerRunner:
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
-            if time_elapsed > 0.2:
+            if time_elapsed <= 0.2:
+                self.slow_steps.clear()
+                continue
+            if not self.slow_steps:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
                     "likely by a badly-written trigger. Set PYTHONASYNCIODEBUG=1 "
                     "to get more information on overrunning coroutines.",
                     time_elapsed,
                 )
-                Stats.incr("triggers.blocked_main_thread")
+            while self.slow_steps:
+                name, classpath, duration = self.slow_steps.popleft()
+                await self.log.ainfo(
+                    "Trigger %s blocked the triggerer's async thread for %.2f seconds",
+                    name,
+                    duration,
+                    classpath=classpath,
+                )
+            Stats.incr("triggers.blocked_main_thread")
 
     async def run_trigger(self, trigger_id, trigger):
         """Run a trigger (they are async generators) and push their events into our outbound event deque."""
@@ -0,0 +1,50 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add loop_time to trigger.
+
+Revision ID: 7d1c4e2f9a3b
+Revises: 808787349f22
+Create Date: 2025-08-12 14:03:27.418925
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d1c4e2f9a3b"
+down_revision = "808787349f22"
+branch_labels = None
+depends_on = None
+airflow_version = "3.1.0"
+
+
+def upgrade():
+    """Add loop_time column to trigger table."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("loop_time", sa.Float(), nullable=True))
+
+
+def downgrade():
+    """Remove loop_time column from trigger table."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.drop_column("loop_time")
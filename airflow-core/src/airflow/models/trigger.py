@@ -24,7 +24,7 @@ from functools import singledispatch
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Column, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import Column, Float, Integer, String, Text, bindparam, delete, func, or_, select, update
 from sqlalchemy.orm import Session, relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
 
@@ -33,7 +33,7 @@ from airflow.assets.manager import AssetManager
 from airflow.models.asset import asset_trigger_association_table
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
-from airflow.triggers.base import BaseTaskEndEvent
+from airflow.triggers.base import BaseTaskEndEvent, TriggerEvent
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
@@ -42,7 +42,7 @@ from airflow.utils.state import TaskInstanceState
 if TYPE_CHECKING:
     from sqlalchemy.sql import Select
 
-    from airflow.triggers.base import BaseTrigger, TriggerEvent
+    from airflow.triggers.base import BaseTrigger
 
 TRIGGER_FAIL_REPR = "__fail__"
 """String value to represent trigger failure.
@@ -54,6 +54,12 @@ Internal use only.
 
 log = logging.getLogger(__name__)
 
+# How many trigger events to handle with a query at a time in Trigger.submit_events
+SUBMIT_EVENTS_BATCH_SIZE = 1000
+
+# Below this cost (in seconds of event loop time per second) a triggerer is never considered overloaded
+MIN_COST_TO_BALANCE = 0.1
+
 
 class TriggerFailureReason(str, Enum):
     """
@@ -94,6 +100,13 @@ class Trigger(Base):
     encrypted_kwargs = Column("kwargs", Text, nullable=False)
     created_date = Column(UtcDateTime, nullable=False)
     triggerer_id = Column(Integer, nullable=True)
+    # Seconds the trigger has spent running in a triggerer's event loop, i.e. time it kept other triggers waiting
+    loop_time = Column(Float, nullable=True)
+    # The share of an event loop the trigger used recently (seconds of loop time per second), used to balance
+    # the load of the triggerers
+    cost = Column(Float, nullable=True)
+    # The state the trigger last saved to resume from, encrypted like its kwargs
+    encrypted_checkpoint = Column(Text, nullable=True)
 
     triggerer_job = relationship(
         "Job",
@@ -140,6 +153,13 @@ class Trigger(Base):
         serialized_kwargs = BaseSerialization.serialize(kwargs)
         return get_fernet().encrypt(json.dumps(serialized_kwargs).encode("utf-8")).decode("utf-8")
 
+    @property
+    def checkpoint(self) -> dict[str, Any] | None:
+        """Return the decrypted checkpoint of the trigger, if it saved one."""
+        if self.encrypted_checkpoint is None:
+            return None
+        return self._decrypt_kwargs(self.encrypted_checkpoint)
+
     @staticmethod
     def _decrypt_kwargs(encrypted_kwargs: str) -> dict[str, Any]:
         """Decrypt the kwargs of the trigger."""
@@ -165,6 +185,10 @@ class Trigger(Base):
         from airflow.models.crypto import get_fernet
 
         self.encrypted_kwargs = get_fernet().rotate(self.encrypted_kwargs.encode("utf-8")).decode("utf-8")
+        if self.encrypted_checkpoint is not None:
+            self.encrypted_checkpoint = (
+                get_fernet().rotate(self.encrypted_checkpoint.encode("utf-8")).decode("utf-8")
+            )
 
     @classmethod
     def from_object(cls, trigger: BaseTrigger) -> Trigger:
@@ -187,6 +211,44 @@ class Trigger(Base):
         )
         return {obj.id: obj for obj in session.scalars(stmt)}
 
+    @classmethod
+    @provide_session
+    def save_checkpoints(cls, checkpoints: dict[int, str], session: Session = NEW_SESSION) -> None:
+        """
+        Store the checkpoints triggers saved, already encrypted.
+
+        :param checkpoints: Encrypted checkpoint by trigger ID
+        """
+        table = cls.__table__
+        session.execute(
+            update(table)
+            .where(table.c.id == bindparam("trigger_id"))
+            .values(encrypted_checkpoint=bindparam("b_checkpoint")),
+            [
+                {"trigger_id": trigger_id, "b_checkpoint": checkpoint}
+                for trigger_id, checkpoint in checkpoints.items()
+            ],
+        )
+
+    @classmethod
+    @provide_session
+    def get_classpaths(
+        cls, triggerer_id: int, health_check_threshold: float, session: Session = NEW_SESSION
+    ) -> list[str]:
+        """
+        Return the classpaths of the triggers a triggerer runs or can pick up.
+
+        Those are the triggers assigned to it, and those without an alive triggerer (see ``assign_unassigned``).
+        """
+        query = select(cls.classpath).where(
+            or_(
+                cls.triggerer_id == triggerer_id,
+                cls.triggerer_id.is_(None),
+                cls.triggerer_id.not_in(cls._alive_triggerer_ids(health_check_threshold)),
+            )
+        )
+        return list(session.scalars(query.distinct()))
+
     @classmethod
     @provide_session
     def fetch_trigger_ids_with_non_task_associations(cls, session: Session = NEW_SESSION) -> set[str]:
@@ -256,14 +318,99 @@ class Trigger(Base):
         if trigger is None:
             # Already deleted for some reason
             return
-        for asset in trigger.assets:
+        trigger._submit_event_to_assets_and_deadline(event, session=session)
+
+    def _submit_event_to_assets_and_deadline(self, event: TriggerEvent, *, session: Session) -> None:
+        for asset in self.assets:
             AssetManager.register_asset_change(
                 asset=asset.to_public(),
                 extra={"from_trigger": True, "payload": event.payload},
                 session=session,
             )
-        if trigger.deadline:
-            trigger.deadline.handle_callback_event(event, session)
+        if self.deadline:
+            self.deadline.handle_callback_event(event, session)
+
+    @classmethod
+    @provide_session
+    def submit_events(cls, events: list[tuple[int, TriggerEvent]], session: Session = NEW_SESSION) -> None:
+        """
+        Fire many events at once.
+
+        This has the same effect as calling ``submit_event`` for each of them in order, but the task instances
+        and triggers involved are loaded with a query per batch of events, and the tasks woken up by a plain
+        ``TriggerEvent`` are resumed with a single (executemany) UPDATE.
+        """
+        for i in range(0, len(events), SUBMIT_EVENTS_BATCH_SIZE):
+            cls._submit_event_batch(events[i : i + SUBMIT_EVENTS_BATCH_SIZE], session=session)
+            session.flush()
+
+    @classmethod
+    def _submit_event_batch(cls, events: list[tuple[int, TriggerEvent]], *, session: Session) -> None:
+        from airflow.models import Deadline
+
+        # Only the first event of a trigger resumes its tasks, as they are no longer deferred after that
+        first_events: dict[int, TriggerEvent] = {}
+        for trigger_id, event in events:
+            first_events.setdefault(trigger_id, event)
+
+        default_handler = handle_event_submit.dispatch(TriggerEvent)
+        with_default_handler = {
+            trigger_id
+            for trigger_id, event in first_events.items()
+            if handle_event_submit.dispatch(type(event)) is default_handler
+        }
+
+        now = timezone.utcnow()
+        resume_params = []
+        resumed: list[TaskInstance] = []
+        others: list[TaskInstance] = []
+        for ti in session.scalars(
+            select(TaskInstance).where(
+                TaskInstance.trigger_id.in_(first_events), TaskInstance.state == TaskInstanceState.DEFERRED
+            )
+        ):
+            if ti.trigger_id in with_default_handler:
+                # This is what handle_event_submit does for a TriggerEvent
+                next_kwargs = dict(ti.next_kwargs or {})
+                next_kwargs["event"] = first_events[ti.trigger_id].payload
+                resume_params.append({"ti_id": ti.id, "b_next_kwargs": next_kwargs})
+                resumed.append(ti)
+            else:
+                others.append(ti)
+
+        if resume_params:
+            table = TaskInstance.__table__
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam("ti_id"))
+                .values(
+                    next_kwargs=bindparam("b_next_kwargs", type_=table.c.next_kwargs.type),
+                    trigger_id=None,
+                    state=TaskInstanceState.SCHEDULED,
+                    scheduled_dttm=now,
+                ),
+                resume_params,
+            )
+            # The ORM objects we loaded are stale now
+            for ti in resumed:
+                session.expire(ti)
+        for ti in others:
+            handle_event_submit(first_events[ti.trigger_id], task_instance=ti, session=session)
+
+        # Send the events to assets and deadlines
+        associated_ids = session.scalars(
+            select(asset_trigger_association_table.c.trigger_id)
+            .where(asset_trigger_association_table.c.trigger_id.in_(first_events))
+            .union(select(Deadline.trigger_id).where(Deadline.trigger_id.in_(first_events)))
+        ).all()
+        if not associated_ids:
+            return
+        triggers = {
+            trigger.id: trigger for trigger in session.scalars(select(cls).where(cls.id.in_(associated_ids)))
+        }
+        for trigger_id, event in events:
+            if trigger := triggers.get(trigger_id):
+                trigger._submit_event_to_assets_and_deadline(event, session=session)
 
     @classmethod
     @provide_session
@@ -300,6 +447,126 @@ class Trigger(Base):
             task_instance.state = TaskInstanceState.SCHEDULED
             task_instance.scheduled_dttm = timezone.utcnow()
 
+    @classmethod
+    @provide_session
+    def add_loop_time(
+        cls, loop_time: dict[int, float], period: float | None = None, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Add to the time triggers have spent running in the event loop of a triggerer.
+
+        :param loop_time: Maps trigger IDs to the seconds to add to their loop time.
+        :param period: The seconds over which ``loop_time`` was measured. If given, the cost of the
+            triggers is updated too.
+        """
+        if not loop_time:
+            return
+        table = cls.__table__
+        seconds = bindparam("seconds", type_=Float)
+        values = {"loop_time": coalesce(table.c.loop_time, 0) + seconds}
+        if period:
+            values["cost"] = seconds / period
+        session.execute(
+            update(table).where(table.c.id == bindparam("trigger_id")).values(values),
+            [{"trigger_id": trigger_id, "seconds": seconds} for trigger_id, seconds in loop_time.items()],
+        )
+
+    @classmethod
+    def get_triggerer_costs(
+        cls, alive_triggerer_ids: list[int] | Select, session: Session
+    ) -> dict[int, float]:
+        """Return the total cost of the triggers of each alive triggerer."""
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        query = (
+            select(Job.id, func.coalesce(func.sum(cls.cost), 0))
+            .outerjoin(cls, cls.triggerer_id == Job.id)
+            .where(Job.id.in_(alive_triggerer_ids))
+            .group_by(Job.id)
+        )
+        return {job_id: float(cost) for job_id, cost in session.execute(query)}
+
+    @classmethod
+    @provide_session
+    def rebalance(
+        cls,
+        triggerer_id: int,
+        capacity: int,
+        health_check_threshold: float,
+        load_balance_threshold: float,
+        session: Session = NEW_SESSION,
+    ) -> tuple[int | None, list[int]]:
+        """
+        Pick triggers to hand over to the least loaded triggerer, if this triggerer is overloaded.
+
+        A triggerer is overloaded when the cost of its triggers is more than ``load_balance_threshold`` times
+        higher than the average of the alive triggerers. It picks as many triggers as it takes to bring it
+        (and the least loaded triggerer) closer to the average, largest first, but no more than the least
+        loaded triggerer has room for (triggerers are assumed to have the same ``capacity``).
+
+        Nothing is moved yet: the triggers stay assigned to this triggerer until it has stopped them, and
+        are only then handed over with ``hand_over``, so that they never run on both triggerers at once.
+
+        :return: the triggerer to hand the triggers over to, and the ids of the triggers.
+        """
+        costs = cls.get_triggerer_costs(cls._alive_triggerer_ids(health_check_threshold), session=session)
+        if not cls._is_overloaded(triggerer_id, costs, load_balance_threshold):
+            return None, []
+        average = sum(costs.values()) / len(costs)
+        target_id = min(costs, key=costs.__getitem__)
+        to_move = min(costs[triggerer_id] - average, average - costs[target_id])
+        room = capacity - session.scalar(select(func.count(cls.id)).where(cls.triggerer_id == target_id))
+
+        moving: list[int] = []
+        for trigger_id, cost in session.execute(
+            select(cls.id, cls.cost)
+            .where(cls.triggerer_id == triggerer_id, cls.cost > 0)
+            .order_by(cls.cost.desc())
+        ):
+            if len(moving) >= room:
+                break
+            if cost <= to_move:
+                moving.append(trigger_id)
+                to_move -= cost
+        if moving:
+            log.info(
+                "Handing %d triggers over from overloaded triggerer %s to triggerer %s",
+                len(moving),
+                triggerer_id,
+                target_id,
+            )
+        return target_id, moving
+
+    @classmethod
+    @provide_session
+    def hand_over(
+        cls, trigger_ids: Iterable[int], triggerer_id: int, target_id: int, session: Session = NEW_SESSION
+    ) -> None:
+        """Assign triggers that ``triggerer_id`` has stopped running to ``target_id``."""
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(trigger_ids), cls.triggerer_id == triggerer_id)
+            .values(triggerer_id=target_id)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _is_overloaded(triggerer_id: int, costs: dict[int, float], load_balance_threshold: float) -> bool:
+        if load_balance_threshold <= 0 or len(costs) < 2 or triggerer_id not in costs:
+            return False
+        average = sum(costs.values()) / len(costs)
+        return costs[triggerer_id] > max(average * (1 + load_balance_threshold), MIN_COST_TO_BALANCE)
+
+    @staticmethod
+    def _alive_triggerer_ids(health_check_threshold: float) -> Select:
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        return select(Job.id).where(
+            Job.end_date.is_(None),
+            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+            Job.job_type == "TriggererJob",
+        )
+
     @classmethod
     @provide_session
     def ids_for_triggerer(cls, triggerer_id, session: Session = NEW_SESSION) -> list[int]:
@@ -309,7 +576,12 @@ class Trigger(Base):
     @classmethod
     @provide_session
     def assign_unassigned(
-        cls, triggerer_id, capacity, health_check_threshold, session: Session = NEW_SESSION
+        cls,
+        triggerer_id,
+        capacity,
+        health_check_threshold,
+        load_balance_threshold: float = 0,
+        session: Session = NEW_SESSION,
     ) -> None:
         """
         Assign unassigned triggers based on a number of conditions.
@@ -317,20 +589,24 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer and the Triggerer job heartrate
         health check threshold, and assigns unassigned triggers until that capacity is reached,
         or there are no more unassigned triggers.
-        """
-        from airflow.jobs.job import Job  # To avoid circular import
 
+        If ``load_balance_threshold`` is set, an overloaded triggerer (see ``rebalance``) does not take any
+        new triggers, and leaves them to the less loaded triggerers.
+        """
         count = session.scalar(select(func.count(cls.id)).filter(cls.triggerer_id == triggerer_id))
         capacity -= count
 
         if capacity <= 0:
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
+        alive_triggerer_ids = cls._alive_triggerer_ids(health_check_threshold)
+
+        if load_balance_threshold > 0 and cls._is_overloaded(
+            triggerer_id,
+            cls.get_triggerer_costs(alive_triggerer_ids, session=session),
+            load_balance_threshold,
+        ):
+            return
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -18,9 +18,9 @@ from __future__ import annotations
 
 import abc
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Hashable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Annotated, Any
 
 import structlog
@@ -63,6 +63,16 @@ class BaseTrigger(abc.ABC, LoggingMixin):
     let them be re-instantiated elsewhere.
     """
 
+    checkpoint: dict[str, Any] | None = None
+    """
+    The state the trigger last saved with ``save_checkpoint``.
+
+    This is set by the triggerer before ``run`` is called, when the trigger is resumed from a checkpoint.
+    """
+
+    # Set by the triggerer, to persist the checkpoints the trigger saves
+    _on_checkpoint: Callable[[dict[str, Any]], None] | None = None
+
     def __init__(self, **kwargs):
         # these values are set by triggerer when preparing to run the instance
         # when run, they are injected into logger record.
@@ -102,6 +112,48 @@ class BaseTrigger(abc.ABC, LoggingMixin):
         raise NotImplementedError("Triggers must implement run()")
         yield  # To convince Mypy this is an async iterator.
 
+    def coalescing_key(self) -> Hashable | None:
+        """
+        Return a key for what this trigger waits on, so that identical triggers can share one run.
+
+        When a triggerer runs several triggers of the same class with the same (not None) key, it only runs
+        one of them and sends the events it fires to all of them. This is only correct if the trigger fires
+        the same events no matter which task deferred on it, so it must not depend on ``task_instance`` or
+        ``trigger_id``.
+
+        By default triggers are not shared, unless ``[triggerer] coalesce_identical_triggers`` is enabled,
+        in which case triggers with the same serialized kwargs are.
+        """
+        return None
+
+    def timer(self) -> tuple[datetime, TriggerEvent] | None:
+        """
+        Return when the trigger fires and the event it fires then, for triggers that only wait for a time.
+
+        The triggerer does not run the triggers that return something here. It keeps them in a timer heap
+        instead, which takes a lot less memory than a coroutine per trigger and only wakes up the event loop
+        when a timer is due.
+        """
+        return None
+
+    def save_checkpoint(self, state: dict[str, Any]) -> None:
+        """
+        Save the state the trigger needs to carry on from where it is, should it be run again elsewhere.
+
+        When the triggerer running a trigger dies, the trigger is re-instantiated from its kwargs on another
+        triggerer, and ``checkpoint`` is set to the state it last saved. Long-running pollers can use this to
+        keep their cursor (the last event they have seen, a pagination token, a backoff delay...) rather than
+        scanning the external system from scratch.
+
+        Checkpoints are written to the database in the background and at most every
+        ``[triggerer] checkpoint_interval`` seconds, so only the latest one saved in that time is kept, and a
+        trigger may be resumed from a slightly older state than its last one. The state must be small and
+        serializable by Airflow, it is stored encrypted like the trigger kwargs.
+        """
+        self.checkpoint = state
+        if self._on_checkpoint is not None:
+            self._on_checkpoint(state)
+
     async def cleanup(self) -> None:
         """
         Cleanup the trigger.
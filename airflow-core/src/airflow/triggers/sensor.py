@@ -0,0 +1,237 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Trigger that runs the ``poke`` method of any sensor in the triggerer, for sensors in ``triggerer`` mode."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+import traceback
+from collections.abc import AsyncIterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from airflow.configuration import conf
+from airflow.exceptions import (
+    AirflowFailException,
+    AirflowSensorTimeout,
+    AirflowSkipException,
+    AirflowTaskTimeout,
+    SerializationError,
+)
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+from airflow.utils.file import MODIFIED_DAG_MODULE_NAME
+from airflow.utils.module_loading import import_string, qualname
+
+if TYPE_CHECKING:
+    from airflow.sdk.bases.sensor import BaseSensorOperator
+    from airflow.sdk.definitions.context import Context
+
+_DAG_MODULE_PREFIX = MODIFIED_DAG_MODULE_NAME.split("{")[0]
+
+# Arguments the sensor was created with that tie it to its DAG, it is re-created without them
+_DAG_ARGUMENTS = frozenset({"dag", "task_group", "params"})
+
+
+def _check_serializable(value: Any) -> None:
+    """
+    Check that the value survives the trigger kwargs serialization as is.
+
+    Callables are serialized as their source code, they can't be re-created from it.
+    """
+    from airflow.serialization.serialized_objects import BaseSerialization
+
+    def check_callables(value: Any) -> None:
+        if isinstance(value, Mapping):
+            items: Any = value.values()
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            items = value
+        elif callable(value):
+            raise SerializationError(f"{value!r} is callable")
+        else:
+            return
+        for item in items:
+            check_callables(item)
+
+    check_callables(value)
+    BaseSerialization.serialize(value, strict=True)
+
+
+@functools.cache
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool running the pokes of all the sensors in this trigger runner process."""
+    return ThreadPoolExecutor(
+        max_workers=conf.getint("triggerer", "sensor_poke_threads", fallback=16),
+        thread_name_prefix="sensor-poke",
+    )
+
+
+class SensorPokeTrigger(BaseTrigger):
+    """
+    Poke a sensor from the triggerer until its criteria is met.
+
+    The sensor is re-created in the triggerer from its class (which must be a sensor importable there) and the
+    arguments it was created with, its templated fields set to their values rendered by the task that
+    deferred. Its ``poke`` method is run in a thread pool shared by all sensors of the trigger runner process,
+    sized by ``[triggerer] sensor_poke_threads``. Pokes follow the ``poke_interval`` (and exponential backoff)
+    of the sensor. Its ``timeout`` is enforced by the deferral timeout.
+
+    :param sensor_classpath: Classpath of the sensor.
+    :param sensor_kwargs: Arguments the sensor was created with.
+    :param rendered_fields: Rendered values of the templated fields of the sensor.
+    :param context: The entries of the task context that can be serialized.
+    :param started_at: Timestamp of the first poke of the sensor.
+    :param poke_count: How many times the sensor has been poked already.
+    """
+
+    def __init__(
+        self,
+        sensor_classpath: str,
+        sensor_kwargs: dict[str, Any],
+        rendered_fields: dict[str, Any],
+        context: dict[str, Any],
+        started_at: float,
+        poke_count: int = 1,
+    ):
+        super().__init__()
+        self.sensor_classpath = sensor_classpath
+        self.sensor_kwargs = sensor_kwargs
+        self.rendered_fields = rendered_fields
+        self.context = context
+        self.started_at = started_at
+        self.poke_count = poke_count
+
+    @classmethod
+    def from_sensor(
+        cls, sensor: BaseSensorOperator, context: Context, *, started_at: float, poke_count: int
+    ) -> SensorPokeTrigger | None:
+        """Return a trigger poking the sensor, or None if the sensor can't be run in the triggerer."""
+        sensor_classpath = qualname(sensor)
+        if sensor_classpath.startswith(_DAG_MODULE_PREFIX) or "<locals>" in sensor_classpath:
+            sensor.log.warning(
+                "Sensor can't be run in the triggerer, poking it in the task instead: "
+                "%s can't be imported by the triggerer",
+                sensor_classpath,
+            )
+            return None
+
+        init_kwargs = getattr(sensor, "_BaseOperator__init_kwargs", {})
+        sensor_kwargs = {key: value for key, value in init_kwargs.items() if key not in _DAG_ARGUMENTS}
+        rendered_fields = {field: getattr(sensor, field) for field in sensor.template_fields}
+        try:
+            _check_serializable(sensor_kwargs)
+            _check_serializable(rendered_fields)
+        except (SerializationError, TypeError, ValueError) as e:
+            sensor.log.warning("Sensor can't be run in the triggerer, poking it in the task instead: %s", e)
+            return None
+
+        serializable_context = {}
+        for key, value in context.items():
+            try:
+                _check_serializable(value)
+            except (SerializationError, TypeError, ValueError):
+                continue
+            serializable_context[key] = value
+        return cls(
+            sensor_classpath=sensor_classpath,
+            sensor_kwargs=sensor_kwargs,
+            rendered_fields=rendered_fields,
+            context=serializable_context,
+            started_at=started_at,
+            poke_count=poke_count,
+        )
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            qualname(self),
+            {
+                attr: getattr(self, attr)
+                for attr in (
+                    "sensor_classpath",
+                    "sensor_kwargs",
+                    "rendered_fields",
+                    "context",
+                    "started_at",
+                    "poke_count",
+                )
+            },
+        )
+
+    def _create_sensor(self) -> BaseSensorOperator:
+        """Re-create the sensor, refusing anything that isn't a sensor."""
+        from airflow.sdk.bases.sensor import BaseSensorOperator
+
+        sensor_class = import_string(self.sensor_classpath)
+        if not isinstance(sensor_class, type) or not issubclass(sensor_class, BaseSensorOperator):
+            raise TypeError(f"{self.sensor_classpath} is not a sensor")
+        sensor = sensor_class(**self.sensor_kwargs)
+        for field, value in self.rendered_fields.items():
+            setattr(sensor, field, value)
+        return sensor
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        from asgiref.sync import sync_to_async
+
+        from airflow.sdk.bases.sensor import PokeReturnValue
+
+        try:
+            sensor = self._create_sensor()
+        except Exception as e:
+            yield TriggerEvent(
+                {
+                    "status": "error",
+                    "message": "".join(traceback.format_exception(type(e), e, e.__traceback__)),
+                }
+            )
+            return
+        context = dict(self.context)
+        # Calls to the supervisor (for connections and variables) only work from threads started this way
+        poke = sync_to_async(sensor.poke, thread_sensitive=False, executor=_get_executor())
+
+        def run_duration() -> float:
+            return time.time() - self.started_at
+
+        poke_count = self.poke_count
+        while True:
+            await asyncio.sleep(sensor._get_next_poke_interval(self.started_at, run_duration, poke_count))
+            poke_count += 1
+            try:
+                poke_return = await poke(context)
+            except AirflowSkipException as e:
+                yield TriggerEvent({"status": "skipped", "message": str(e)})
+                return
+            except (AirflowSensorTimeout, AirflowTaskTimeout, AirflowFailException) as e:
+                yield TriggerEvent({"status": "failed", "message": str(e)})
+                return
+            except Exception as e:
+                if sensor.silent_fail:
+                    self.log.error("Sensor poke failed: \n %s", traceback.format_exc())
+                    continue
+                yield TriggerEvent(
+                    {
+                        "status": "error",
+                        "message": "".join(traceback.format_exception(type(e), e, e.__traceback__)),
+                    }
+                )
+                return
+
+            if poke_return:
+                xcom_value = poke_return.xcom_value if isinstance(poke_return, PokeReturnValue) else None
+                yield TriggerEvent({"status": "success", "xcom_value": xcom_value})
+                return
@@ -5769,6 +5769,17 @@ export const $TriggerResponse = {
                 }
             ],
             title: 'Triggerer Id'
+        },
+        loop_time: {
+            anyOf: [
+                {
+                    type: 'number'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Loop Time'
         }
     },
     type: 'object',
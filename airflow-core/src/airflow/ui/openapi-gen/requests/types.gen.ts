@@ -1457,6 +1457,7 @@ export type TriggerResponse = {
     kwargs: string;
     created_date: string;
     triggerer_id: number | null;
+    loop_time?: number | null;
 };
 
 /**
@@ -93,7 +93,7 @@ _REVISION_HEADS_MAP: dict[str, str] = {
     "2.10.3": "5f2621c13b39",
     "3.0.0": "29ce7909c52b",
     "3.0.3": "fe199e1abd77",
-    "3.1.0": "808787349f22",
+    "3.1.0": "e2a8f6b13c47",
 }
 
 
@@ -351,6 +351,7 @@ class TestGetTaskInstance(TestTaskInstanceEndpoint):
             "trigger": {
                 "classpath": "none",
                 "kwargs": "{}",
+                "loop_time": None,
             },
             "triggerer_job": {
                 "dag_display_name": None,
@@ -1110,6 +1110,157 @@ class TestTIUpdateState:
         assert ti.state == State.SUCCESS
 
 
+class TestTIBulkUpdateState:
+    def setup_method(self):
+        clear_db_assets()
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_assets()
+        clear_db_runs()
+
+    def _create_tis(self, dag_maker, session, states):
+        with dag_maker("test_ti_bulk_update_state"):
+            for i in range(len(states)):
+                EmptyOperator(task_id=f"task{i}")
+
+        dr = dag_maker.create_dagrun()
+        tis = sorted(dr.get_task_instances(session=session), key=lambda ti: ti.task_id)
+        for ti, state in zip(tis, states):
+            ti.state = state
+            ti.start_date = DEFAULT_START_DATE
+            session.merge(ti)
+        session.commit()
+        return tis
+
+    @staticmethod
+    def _item(ti, state, **kwargs):
+        return {
+            "task_instance_id": str(ti.id),
+            "token": "fake",
+            "payload": {"state": state, "end_date": DEFAULT_END_DATE.isoformat(), **kwargs},
+        }
+
+    def test_bulk_update_state(self, client, session, dag_maker):
+        tis = self._create_tis(dag_maker, session, [State.RUNNING] * 4)
+
+        response = client.patch(
+            "/execution/task-instances/states",
+            json={
+                "updates": [
+                    self._item(tis[0], State.SUCCESS),
+                    self._item(tis[1], State.FAILED),
+                    self._item(tis[2], State.UP_FOR_RETRY),
+                    self._item(tis[3], State.SKIPPED, rendered_map_index="label"),
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [{"task_instance_id": str(ti.id), "status_code": 204, "detail": None} for ti in tis]
+        }
+
+        session.expire_all()
+        # A retried TI gets a new id, so look them up by task_id
+        tis = session.scalars(
+            select(TaskInstance)
+            .where(TaskInstance.dag_id == "test_ti_bulk_update_state")
+            .order_by(TaskInstance.task_id)
+        ).all()
+        assert [ti.state for ti in tis] == [State.SUCCESS, State.FAILED, State.UP_FOR_RETRY, State.SKIPPED]
+        assert [ti.end_date for ti in tis if ti.state != State.UP_FOR_RETRY] == [DEFAULT_END_DATE] * 3
+        assert tis[3].rendered_map_index == "label"
+
+    def test_bulk_update_state_per_item_errors(self, client, session, dag_maker):
+        running, not_running = self._create_tis(dag_maker, session, [State.RUNNING, State.SUCCESS])
+        missing = uuid6.uuid7()
+
+        response = client.patch(
+            "/execution/task-instances/states",
+            json={
+                "updates": [
+                    self._item(not_running, State.FAILED),
+                    {**self._item(running, State.SUCCESS), "task_instance_id": str(missing)},
+                    self._item(running, State.SUCCESS),
+                    self._item(running, State.FAILED),
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert [(r["task_instance_id"], r["status_code"]) for r in response.json()["results"]] == [
+            (str(not_running.id), 409),
+            (str(missing), 404),
+            (str(running.id), 204),
+            (str(running.id), 409),
+        ]
+        assert response.json()["results"][0]["detail"] == {
+            "reason": "invalid_state",
+            "message": "TI was not in the running state so it cannot be updated",
+            "previous_state": State.SUCCESS,
+        }
+
+        session.expire_all()
+        assert session.get(TaskInstance, running.id).state == State.SUCCESS
+        assert session.get(TaskInstance, not_running.id).state == State.SUCCESS
+
+    def test_bulk_update_state_checks_token_of_each_item(self, client, session, dag_maker):
+        allowed, denied = self._create_tis(dag_maker, session, [State.RUNNING, State.RUNNING])
+
+        validator = lifespan.registry._services[JWTValidator].factory()
+        default = validator.avalidated_claims.side_effect
+
+        def validated_claims(cred, validators=None):
+            if cred == "stolen":
+                raise RuntimeError("Invalid token")
+            return default(cred, validators)
+
+        validator.avalidated_claims.side_effect = validated_claims
+
+        response = client.patch(
+            "/execution/task-instances/states",
+            json={
+                "updates": [
+                    self._item(allowed, State.SUCCESS),
+                    {**self._item(denied, State.SUCCESS), "token": "stolen"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert [r["status_code"] for r in response.json()["results"]] == [204, 403]
+
+        session.expire_all()
+        assert session.get(TaskInstance, allowed.id).state == State.SUCCESS
+        assert session.get(TaskInstance, denied.id).state == State.RUNNING
+
+    def test_bulk_update_state_failed_item_does_not_affect_others(self, client, session, dag_maker):
+        first, second = self._create_tis(dag_maker, session, [State.RUNNING, State.RUNNING])
+
+        with mock.patch(
+            "airflow.api_fastapi.execution_api.routes.task_instances._apply_ti_state_update",
+            side_effect=[RuntimeError("boom"), None],
+        ):
+            response = client.patch(
+                "/execution/task-instances/states",
+                json={"updates": [self._item(first, State.SUCCESS), self._item(second, State.SUCCESS)]},
+            )
+
+        assert response.status_code == 200
+        assert [r["status_code"] for r in response.json()["results"]] == [500, 204]
+
+    @pytest.mark.parametrize("state", [State.DEFERRED, State.UP_FOR_RESCHEDULE, State.RUNNING])
+    def test_bulk_update_state_rejects_non_terminal_states(self, client, session, dag_maker, state):
+        (ti,) = self._create_tis(dag_maker, session, [State.RUNNING])
+
+        response = client.patch("/execution/task-instances/states", json={"updates": [self._item(ti, state)]})
+
+        assert response.status_code == 422
+        session.expire_all()
+        assert session.get(TaskInstance, ti.id).state == State.RUNNING
+
+
 class TestTISkipDownstream:
     def setup_method(self):
         clear_db_runs()
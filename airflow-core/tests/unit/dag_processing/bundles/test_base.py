@@ -35,6 +35,7 @@ from airflow.dag_processing.bundles.base import (
     BundleUsageTrackingManager,
     BundleVersionLock,
     get_bundle_storage_root_path,
+    get_parsed_dag_cache_path,
 )
 
 from tests_common.test_utils.config import conf_vars
@@ -252,6 +253,7 @@ class TestBundleUsageTrackingManager:
                     version = f"hour-{num}"
                     b = FakeBundle(version=version, name=bundle_name)
                     b.path.mkdir(exist_ok=True, parents=True)
+                    get_parsed_dag_cache_path(bundle_name, version).mkdir(exist_ok=True, parents=True)
                     with BundleVersionLock(
                         bundle_name=bundle_name,
                         bundle_version=version,
@@ -268,3 +270,7 @@ class TestBundleUsageTrackingManager:
                 assert len(lock_files) == expected_remaining
                 bundle_folders = list(b.versions_dir.iterdir())
                 assert len(bundle_folders) == expected_remaining
+                parsed_dag_cache_folders = list(
+                    get_parsed_dag_cache_path(bundle_name, "any").parent.iterdir()
+                )
+                assert len(parsed_dag_cache_folders) == expected_remaining
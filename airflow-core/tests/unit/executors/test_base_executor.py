@@ -31,7 +31,7 @@ from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.cli.cli_config import DefaultHelpParser, GroupCommand
 from airflow.cli.cli_parser import AirflowHelpFormatter
 from airflow.executors import workloads
-from airflow.executors.base_executor import BaseExecutor, RunningRetryAttemptType
+from airflow.executors.base_executor import BaseExecutor, QueuedTasks, RunningRetryAttemptType
 from airflow.executors.local_executor import LocalExecutor
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
@@ -166,6 +166,125 @@ def test_gauge_executor_metrics_with_multiple_executors(
     mock_stats_gauge.assert_has_calls(calls)
 
 
+def _queued_workload(priority_weight):
+    return mock.Mock(ti=mock.Mock(priority_weight=priority_weight))
+
+
+def _queued_tasks(priority_weights):
+    queued_tasks = QueuedTasks()
+    for i, priority_weight in enumerate(priority_weights):
+        queued_tasks[TaskInstanceKey("dag", f"task_{i}", "run", 1)] = _queued_workload(priority_weight)
+    return queued_tasks
+
+
+def _by_priority(queued_tasks, limit=None):
+    return [key.task_id for key, _ in queued_tasks.by_priority(limit)]
+
+
+def _sorted_by_priority(queued_tasks):
+    """Order of the task ids by priority, as sorting the workloads queued (in insertion order) would give."""
+    return [
+        key.task_id
+        for key, _ in sorted(queued_tasks.items(), key=lambda x: x[1].ti.priority_weight, reverse=True)
+    ]
+
+
+class TestQueuedTasks:
+    def test_by_priority(self):
+        queued_tasks = _queued_tasks([1, 5, 3, 5, 1, 10, 3])
+
+        assert _by_priority(queued_tasks) == _sorted_by_priority(queued_tasks)
+        assert _by_priority(queued_tasks) == [
+            "task_5",
+            "task_1",
+            "task_3",
+            "task_2",
+            "task_6",
+            "task_0",
+            "task_4",
+        ]
+
+    @pytest.mark.parametrize("limit", [0, 1, 3, 7, 100])
+    def test_by_priority_limit(self, limit):
+        queued_tasks = _queued_tasks([1, 5, 3, 5, 1, 10, 3])
+
+        assert _by_priority(queued_tasks, limit) == _sorted_by_priority(queued_tasks)[:limit]
+
+    def test_behaves_like_a_dict(self):
+        queued_tasks = _queued_tasks([1, 2, 3])
+        key = TaskInstanceKey("dag", "task_1", "run", 1)
+        workload = _queued_workload(0)
+
+        queued_tasks[key] = workload
+
+        assert list(queued_tasks) == [TaskInstanceKey("dag", f"task_{i}", "run", 1) for i in range(3)]
+        assert queued_tasks[key] is workload
+        assert queued_tasks.pop(key) is workload
+        assert key not in queued_tasks
+        assert len(queued_tasks) == 2
+        assert queued_tasks.copy() == dict(queued_tasks.items())
+
+    def test_remove_and_update_keep_order(self):
+        priority_weights = [7, 3, 9, 1, 3, 8, 2, 6, 5, 4, 9, 0]
+        queued_tasks = _queued_tasks(priority_weights)
+
+        for i in (0, 11, 5, 2, 7):
+            del queued_tasks[TaskInstanceKey("dag", f"task_{i}", "run", 1)]
+            assert _by_priority(queued_tasks) == _sorted_by_priority(queued_tasks)
+            assert _by_priority(queued_tasks, 2) == _sorted_by_priority(queued_tasks)[:2]
+        for i, priority_weight in ((1, 10), (10, 0), (3, 4)):
+            queued_tasks[TaskInstanceKey("dag", f"task_{i}", "run", 1)] = _queued_workload(priority_weight)
+            assert _by_priority(queued_tasks) == _sorted_by_priority(queued_tasks)
+            assert _by_priority(queued_tasks, 2) == _sorted_by_priority(queued_tasks)[:2]
+
+        queued_tasks.clear()
+        assert queued_tasks.by_priority() == []
+        assert queued_tasks.pending_by_priority() == {}
+
+    def test_pending_by_priority(self):
+        queued_tasks = _queued_tasks([1, 5, 3, 5, 1])
+        assert queued_tasks.pending_by_priority() == {1: 2, 3: 1, 5: 2}
+
+        del queued_tasks[TaskInstanceKey("dag", "task_2", "run", 1)]
+        queued_tasks[TaskInstanceKey("dag", "task_0", "run", 1)] = _queued_workload(5)
+        assert queued_tasks.pending_by_priority() == {1: 1, 5: 3}
+
+    def test_workloads_without_priority_weight(self):
+        queued_tasks = QueuedTasks()
+        queued_tasks[TaskInstanceKey("dag", "task_0", "run", 1)] = "command"
+        queued_tasks[TaskInstanceKey("dag", "task_1", "run", 1)] = _queued_workload(1)
+
+        assert _by_priority(queued_tasks) == ["task_1", "task_0"]
+        assert queued_tasks.pending_by_priority() == {0: 1, 1: 1}
+
+
+@mock.patch("airflow.executors.base_executor.BaseExecutor.sync")
+@mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
+@mock.patch("airflow.executors.base_executor.Stats.gauge")
+def test_gauge_executor_pending_by_priority(mock_stats_gauge, mock_trigger_tasks, mock_sync):
+    executor = BaseExecutor()
+    executor.queued_tasks = _queued_tasks([1, 5, 5])
+    executor.heartbeat()
+
+    tags = {"priority_weight": "1", "name": "BaseExecutor"}
+    mock_stats_gauge.assert_any_call("executor.pending_by_priority", value=1, tags=tags)
+    mock_stats_gauge.assert_any_call(
+        "executor.pending_by_priority", value=2, tags={"priority_weight": "5", "name": "BaseExecutor"}
+    )
+    # The priority weight is only ever a tag, never part of the metric name
+    assert not any(c.args[0].startswith("executor.pending_by_priority.") for c in mock_stats_gauge.mock_calls)
+
+    # Priorities without queued tasks anymore are reset once
+    mock_stats_gauge.reset_mock()
+    del executor.queued_tasks[TaskInstanceKey("dag", "task_0", "run", 1)]
+    executor.heartbeat()
+    mock_stats_gauge.assert_any_call("executor.pending_by_priority", value=0, tags=tags)
+
+    mock_stats_gauge.reset_mock()
+    executor.heartbeat()
+    assert mock.call("executor.pending_by_priority", value=0, tags=tags) not in mock_stats_gauge.mock_calls
+
+
 def setup_dagrun(dag_maker):
     date = timezone.utcnow()
     start_date = date - timedelta(days=2)
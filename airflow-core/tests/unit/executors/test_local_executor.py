@@ -27,7 +27,7 @@ from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
-from airflow.executors.local_executor import LocalExecutor, _execute_work
+from airflow.executors.local_executor import LocalExecutor, _execute_work, _run_batch
 from airflow.utils.state import State
 
 from tests_common.test_utils.config import conf_vars
@@ -55,7 +55,7 @@ class TestLocalExecutor:
         assert LocalExecutor.serve_logs
 
     @mock.patch("airflow.sdk.execution_time.supervisor.supervise")
-    def _test_execute(self, mock_supervise, parallelism=1):
+    def _test_execute(self, mock_supervise, parallelism=1, worker_batch_size=1):
         success_tis = [
             workloads.TaskInstance(
                 id=uuid7(),
@@ -83,7 +83,8 @@ class TestLocalExecutor:
 
         mock_supervise.side_effect = fake_supervise
 
-        executor = LocalExecutor(parallelism=parallelism)
+        with conf_vars({("local_executor", "worker_batch_size"): str(worker_batch_size)}):
+            executor = LocalExecutor(parallelism=parallelism)
         executor.start()
 
         assert executor.result_queue.empty()
@@ -132,6 +133,88 @@ class TestLocalExecutor:
     def test_execution(self, parallelism: int):
         self._test_execute(parallelism=parallelism)
 
+    @skip_spawn_mp_start
+    def test_execution_in_batches(self):
+        self._test_execute(parallelism=2, worker_batch_size=4)
+
+    @pytest.mark.parametrize(
+        ("worker_batch_size", "expected_batch_sizes"),
+        [
+            pytest.param(2, [2, 2, 1], id="batches"),
+            pytest.param(8, [5], id="one-batch"),
+        ],
+    )
+    def test_heartbeat_sends_workloads_in_batches(self, worker_batch_size, expected_batch_sizes):
+        with conf_vars({("local_executor", "worker_batch_size"): str(worker_batch_size)}):
+            executor = LocalExecutor(parallelism=5)
+        executor.start()
+        pending = [f"workload_{i}" for i in range(5)]
+
+        with mock.patch.object(executor, "_check_workers"):
+            for workload in pending:
+                executor.queue_workload(workload)
+            assert executor.activity_queue.empty()
+
+            executor.heartbeat()
+
+        batches = []
+        while not executor.activity_queue.empty():
+            batches.append(executor.activity_queue.get())
+        assert [len(batch) for batch in batches] == expected_batch_sizes
+        assert [workload for batch in batches for workload in batch] == pending
+        assert executor._unread_messages.value == len(expected_batch_sizes)
+        assert executor._pending_workloads == []
+        executor.end()
+
+    def test_read_batched_results(self):
+        executor = LocalExecutor()
+        executor.start()
+        keys = [f"key_{i}" for i in range(3)]
+        executor.result_queue.put([(keys[0], State.SUCCESS, None), (keys[1], State.FAILED, None)])
+        executor.result_queue.put((keys[2], State.SUCCESS, None))
+
+        with mock.patch.object(executor, "change_state") as change_state:
+            executor._read_results()
+
+        assert change_state.mock_calls == [
+            mock.call(keys[0], State.SUCCESS),
+            mock.call(keys[1], State.FAILED),
+            mock.call(keys[2], State.SUCCESS),
+        ]
+        executor.end()
+
+    @mock.patch("airflow.executors.local_executor._execute_work")
+    def test_run_batch_reports_workloads_it_cannot_run(self, mock_execute_work):
+        ok = mock.Mock(spec=workloads.ExecuteTask, ti=mock.Mock())
+        unknown_with_ti = mock.Mock(spec=["ti"])
+        unknown_without_ti = mock.Mock(spec=[])
+
+        results = _run_batch(mock.Mock(), [unknown_with_ti, unknown_without_ti, ok])
+
+        assert [(key, state) for key, state, _ in results] == [
+            (unknown_with_ti.ti.key, State.FAILED),
+            (ok.ti.key, State.SUCCESS),
+        ]
+        assert isinstance(results[0][2], ValueError)
+        mock_execute_work.assert_called_once_with(mock.ANY, ok)
+
+    @mock.patch("multiprocessing.context.ForkServerContext.set_forkserver_preload")
+    def test_prefork_workers(self, mock_set_forkserver_preload):
+        with conf_vars(
+            {
+                ("local_executor", "prefork_workers"): "True",
+                ("local_executor", "prefork_preload_modules"): "airflow.sdk, airflow.providers.standard",
+            }
+        ):
+            executor = LocalExecutor()
+            executor.start()
+
+        assert executor._mp_context.get_start_method() == "forkserver"
+        mock_set_forkserver_preload.assert_called_once_with(
+            ["airflow.executors.local_executor", "airflow.sdk", "airflow.providers.standard"]
+        )
+        executor.end()
+
     @mock.patch("airflow.executors.local_executor.LocalExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
     @mock.patch("airflow.executors.base_executor.Stats.gauge")
@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import json
 import os
+import re
 import selectors
 import time
 from collections.abc import AsyncIterator
@@ -30,12 +32,14 @@ from unittest.mock import ANY, AsyncMock, MagicMock, patch
 import pendulum
 import pytest
 from asgiref.sync import sync_to_async
+from sqlalchemy import select
 from structlog.typing import FilteringBoundLogger
 
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import (
+    ShardedTriggerRunnerSupervisor,
     TriggerCommsDecoder,
     TriggererJobRunner,
     TriggerRunner,
@@ -54,11 +58,13 @@ from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.providers.standard.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger
 from airflow.sdk import BaseHook
+from airflow.serialization.serialized_objects import BaseSerialization
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.triggers.testing import FailureTrigger, SuccessTrigger
 from airflow.utils.state import State, TaskInstanceState
 from airflow.utils.types import DagRunType
 
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.db import (
     clear_db_connections,
     clear_db_dags,
@@ -255,6 +261,87 @@ def test_trigger_lifecycle(spy_agency: SpyAgency, session):
         trigger_runner_supervisor.kill(force=False)
 
 
+class TestShardedTriggerRunnerSupervisor:
+    @pytest.fixture
+    def sharded(self, supervisor_builder, session):
+        job = Job()
+        session.add(job)
+        session.flush()
+        runners = [supervisor_builder(job) for _ in range(2)]
+        return ShardedTriggerRunnerSupervisor(
+            job=job, capacity=20, runners=runners, selector=runners[0].selector
+        )
+
+    def test_new_triggers_go_to_least_busy_runner(self, sharded):
+        sharded.runners[0].running_triggers.update({1, 2, 3})
+
+        assert sharded.partition_triggers({1, 2, 3, 4, 5}) == [{1, 2, 3}, {4, 5}]
+
+    def test_known_triggers_are_not_moved_until_finished(self, sharded):
+        first, second = sharded.runners
+        first.running_triggers.update({1, 2})
+        first.cancelling_triggers.add(2)
+        first.events.append((3, TriggerEvent(True)))
+
+        # 2 is still being cancelled, and 3 has an event to submit, so neither can be started elsewhere
+        assert sharded.partition_triggers({1, 2, 3}) == [{1, 3}, set()]
+
+        first.running_triggers.discard(2)
+        first.cancelling_triggers.discard(2)
+        assert sharded.partition_triggers({1, 2, 3}) == [{1, 3}, {2}]
+
+    def test_rebalance(self, sharded):
+        first, second = sharded.runners
+        first.running_triggers.update(range(1, 11))
+        second.running_triggers.update({11, 12})
+
+        assignments = sharded.partition_triggers(set(range(1, 13)))
+
+        # The newest of the excess triggers are taken off the first runner ...
+        assert assignments == [set(range(1, 7)), {11, 12}]
+        first.update_triggers(assignments[0])
+        assert first.cancelling_triggers == {7, 8, 9, 10}
+
+        # ... and are started on the second once they have finished
+        first.running_triggers.difference_update(first.cancelling_triggers)
+        first.cancelling_triggers.clear()
+        assert sharded.partition_triggers(set(range(1, 13))) == [set(range(1, 7)), {7, 8, 9, 10, 11, 12}]
+
+    def test_small_imbalance_is_left_alone(self, sharded):
+        sharded.runners[0].running_triggers.update({1, 2, 3})
+
+        assert sharded.partition_triggers({1, 2, 3}) == [{1, 2, 3}, set()]
+
+
+def test_sharded_trigger_lifecycle(session):
+    trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
+    *_, trigger_orm, _ = create_trigger_in_db(session, trigger)
+    job = Job(id=12345)
+    sharded = ShardedTriggerRunnerSupervisor.start(job=job, capacity=10, num_runners=2)
+    try:
+        assert len({runner.pid for runner in sharded.runners}) == 2
+
+        sharded.load_triggers()
+        for _ in range(30):
+            sharded._service_subprocesses(0.1)
+            if any(runner.running_triggers for runner in sharded.runners):
+                break
+        assert [runner.running_triggers for runner in sharded.runners] == [{trigger_orm.id}, set()]
+
+        session.delete(trigger_orm)
+        session.commit()
+        sharded.load_triggers()
+        for _ in range(30):
+            sharded._service_subprocesses(0.1)
+            if not sharded.runners[0].running_triggers:
+                break
+        else:
+            pytest.fail("Trigger was never cancelled")
+        assert all(runner.is_alive() for runner in sharded.runners)
+    finally:
+        sharded.kill(force=False)
+
+
 class TestTriggerRunner:
     @pytest.mark.asyncio
     async def test_run_inline_trigger_canceled(self, session) -> None:
@@ -453,7 +540,7 @@ async def test_trigger_create_race_condition_38599(session, supervisor_builder):
     # job1.latest_heartbeat = timezone.utcnow() - datetime.timedelta(hours=1)
     # session.commit()
 
-    # This calls Trigger.submit_event, which will unlink the trigger from the task instance
+    # This calls Trigger.submit_events, which will unlink the trigger from the task instance
 
     # Simulate this call: supervisor1._service_subprocess()
     supervisor1.events.append((trigger_orm.id, TriggerEvent(True)))
@@ -568,6 +655,353 @@ async def test_trigger_failing():
             info["task"].cancel()
 
 
+class BlockingTrigger(BaseTrigger):
+    """Trigger that blocks the event loop before it fires."""
+
+    def serialize(self):
+        return (f"{type(self).__module__}.{type(self).__qualname__}", {})
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        time.sleep(0.3)  # noqa: ASYNC251
+        yield TriggerEvent(True)
+
+
+@pytest.mark.asyncio
+async def test_blocking_trigger_is_reported(cap_structlog):
+    """Checks that the time a trigger blocks the event loop for is attributed to it."""
+    runner = TriggerRunner()
+    classpath = f"{BlockingTrigger.__module__}.{BlockingTrigger.__qualname__}"
+    runner.to_create.append(
+        workloads.RunTrigger.model_construct(
+            id=1, ti=None, classpath=classpath, encrypted_kwargs='{"__type":"dict", "__var":{}}'
+        ),
+    )
+    watchdog = asyncio.create_task(runner.block_watchdog())
+    # Let the watchdog start waiting
+    await asyncio.sleep(0)
+    await runner.create_triggers()
+    try:
+        for _ in range(30):
+            await asyncio.sleep(0.1)
+            if await runner.cleanup_finished_triggers():
+                break
+        else:
+            pytest.fail("Trigger never finished")
+    finally:
+        runner.stop = True
+        await watchdog
+
+    assert {
+        "event": re.compile(r"Trigger ID 1 blocked the triggerer's async thread for 0\.3\d seconds"),
+        "classpath": classpath,
+    } in cap_structlog
+
+    with patch("airflow.jobs.triggerer_job_runner.Stats") as stats:
+        loop_time = runner.report_loop_time()
+    assert loop_time[1] >= 0.3
+    stats.incr.assert_called_once_with("triggers.loop_time_ms", ANY, tags={"classpath": classpath})
+    assert stats.incr.call_args.args[1] >= 300
+    assert not runner.loop_time
+    assert not runner.loop_time_by_classpath
+
+
+class CoalescingTrigger(BaseTrigger):
+    """Trigger that shares its run with the other instances with the same key."""
+
+    runs = 0
+
+    def __init__(self, key, delay=0.2):
+        super().__init__()
+        self.key = key
+        self.delay = delay
+
+    def serialize(self):
+        return (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            {"key": self.key, "delay": self.delay},
+        )
+
+    def coalescing_key(self):
+        return self.key
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        type(self).runs += 1
+        self.save_checkpoint({"key": self.key})
+        await asyncio.sleep(self.delay)
+        yield TriggerEvent(self.key)
+
+
+class CheckpointingTrigger(BaseTrigger):
+    """Trigger that counts how many times it has run, in its checkpoint."""
+
+    def serialize(self):
+        return f"{type(self).__module__}.{type(self).__qualname__}", {}
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        runs = (self.checkpoint or {"runs": 0})["runs"] + 1
+        self.save_checkpoint({"runs": runs})
+        yield TriggerEvent(runs)
+
+
+def _coalescing_workload(trigger_id: int, key: str, delay: float = 0.2) -> workloads.RunTrigger:
+    classpath, kwargs = CoalescingTrigger(key, delay).serialize()
+    return workloads.RunTrigger.model_construct(
+        id=trigger_id,
+        ti=None,
+        classpath=classpath,
+        encrypted_kwargs=json.dumps(BaseSerialization.serialize(kwargs)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_triggers_share_one_run(monkeypatch):
+    monkeypatch.setattr(CoalescingTrigger, "runs", 0)
+    runner = TriggerRunner()
+    runner.to_create.extend(
+        [_coalescing_workload(1, "a"), _coalescing_workload(2, "a"), _coalescing_workload(3, "b")]
+    )
+    await runner.create_triggers()
+    try:
+        finished: list[int] = []
+        for _ in range(30):
+            await asyncio.sleep(0.1)
+            finished += await runner.cleanup_finished_triggers()
+            if len(finished) == 3:
+                break
+        else:
+            pytest.fail("Triggers never finished")
+    finally:
+        for info in runner.triggers.values():
+            info["task"].cancel()
+
+    assert sorted(runner.events, key=lambda e: e[0]) == [
+        (1, TriggerEvent("a")),
+        (2, TriggerEvent("a")),
+        (3, TriggerEvent("b")),
+    ]
+    assert not runner.failed_triggers
+    assert CoalescingTrigger.runs == 2
+    assert not runner.shared_runs
+    # The checkpoints of a shared run are saved for all of its subscribers
+    assert runner.checkpoints == {1: {"key": "a"}, 2: {"key": "a"}, 3: {"key": "b"}}
+
+
+@pytest.mark.asyncio
+async def test_shared_run_is_cancelled_with_its_last_subscriber():
+    runner = TriggerRunner()
+    runner.to_create.extend([_coalescing_workload(1, "a", delay=60), _coalescing_workload(2, "a", delay=60)])
+    await runner.create_triggers()
+    await asyncio.sleep(0.1)
+
+    shared = runner.shared_runs[(f"{__name__}.CoalescingTrigger", "a")]
+    assert len(shared.subscribers) == 2
+
+    runner.to_cancel.append(1)
+    await runner.cancel_triggers()
+    await asyncio.sleep(0.1)
+    assert await runner.cleanup_finished_triggers() == [1]
+    assert not shared.task.done()
+
+    runner.to_cancel.append(2)
+    await runner.cancel_triggers()
+    await asyncio.sleep(0.1)
+    assert await runner.cleanup_finished_triggers() == [2]
+    assert shared.task.cancelled()
+    assert not runner.shared_runs
+    assert not runner.failed_triggers
+
+
+@pytest.mark.parametrize("coalesce_identical", [True, False])
+def test_coalescing_identical_triggers(coalesce_identical):
+    with conf_vars({("triggerer", "coalesce_identical_triggers"): str(coalesce_identical)}):
+        runner = TriggerRunner()
+    moment = timezone.datetime(2025, 1, 1)
+    first, second, other = (
+        runner.get_coalescing_key("a.Trigger", DateTimeTrigger(m))
+        for m in (moment, moment, moment + datetime.timedelta(seconds=1))
+    )
+    if coalesce_identical:
+        assert first == second
+        assert first != other
+    else:
+        assert first is second is other is None
+
+
+@pytest.mark.asyncio
+async def test_time_based_triggers_use_timers():
+    """Checks that triggers that only wait for a moment are kept in a timer, rather than run."""
+    runner = TriggerRunner()
+    now = timezone.utcnow()
+    for trigger_id, moment in enumerate(
+        [now - datetime.timedelta(seconds=1), now, now + datetime.timedelta(hours=1)]
+    ):
+        classpath, kwargs = DateTimeTrigger(moment).serialize()
+        runner.to_create.append(
+            workloads.RunTrigger.model_construct(
+                id=trigger_id + 1,
+                ti=None,
+                classpath=classpath,
+                encrypted_kwargs=json.dumps(BaseSerialization.serialize(kwargs)),
+            )
+        )
+    await runner.create_triggers()
+
+    assert not runner.triggers
+    assert set(runner.timer_events) == {1, 2, 3}
+
+    runner.fire_timers(now.timestamp())
+    assert [(trigger_id, event.payload) for trigger_id, event in runner.events] == [
+        (1, now - datetime.timedelta(seconds=1)),
+        (2, now),
+    ]
+    assert await runner.cleanup_finished_triggers() == [1, 2]
+    # Firing them is accounted for like the steps of the triggers that run
+    assert set(runner.loop_time) == {1, 2}
+    assert runner.loop_time_by_classpath.keys() == {classpath}
+
+    runner.to_cancel.append(3)
+    await runner.cancel_triggers()
+    assert await runner.cleanup_finished_triggers() == [3]
+    assert not runner.timer_events
+
+    # The cancelled timer never fires
+    runner.fire_timers((now + datetime.timedelta(hours=2)).timestamp())
+    assert len(runner.events) == 2
+    assert not runner.timers
+
+
+@pytest.mark.asyncio
+async def test_triggers_are_created_in_batches():
+    with conf_vars({("triggerer", "trigger_creation_batch_size"): "2"}):
+        runner = TriggerRunner()
+    classpath, kwargs = DateTimeTrigger(timezone.utcnow() + datetime.timedelta(hours=1)).serialize()
+    runner.to_create.extend(
+        workloads.RunTrigger.model_construct(
+            id=trigger_id,
+            ti=None,
+            classpath=classpath,
+            encrypted_kwargs=json.dumps(BaseSerialization.serialize(kwargs)),
+        )
+        for trigger_id in (1, 2, 3, 4)
+    )
+
+    await runner.create_triggers()
+    assert set(runner.timer_events) == {1, 2}
+    assert [workload.id for workload in runner.to_create] == [3, 4]
+
+    # Triggers still waiting to be created can be cancelled
+    runner.to_cancel.append(3)
+    await runner.cancel_triggers()
+    assert await runner.cleanup_finished_triggers() == [3]
+
+    await runner.create_triggers()
+    assert set(runner.timer_events) == {1, 2, 4}
+    assert not runner.to_create
+
+
+@pytest.mark.asyncio
+async def test_preload_trigger_classes():
+    runner = TriggerRunner()
+    await runner.preload_trigger_classes(["airflow.triggers.testing.SuccessTrigger", "does.not.Exist"])
+    assert runner.trigger_cache == {"airflow.triggers.testing.SuccessTrigger": SuccessTrigger}
+
+
+def test_loop_time_is_recorded(session, supervisor_builder):
+    trigger_orm = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add(trigger_orm)
+    session.commit()
+    trigger_id = trigger_orm.id
+
+    supervisor: TriggerRunnerSupervisor = supervisor_builder()
+    for seconds in (0.5, 0.25):
+        supervisor._handle_request(
+            messages.TriggerStateChanges(events=None, loop_time={trigger_id: seconds}, loop_time_period=10),
+            req_id=1,
+            log=MagicMock(),
+        )
+    supervisor.handle_loop_time()
+
+    assert not supervisor.loop_time
+    assert session.execute(select(Trigger.loop_time, Trigger.cost).where(Trigger.id == trigger_id)).one() == (
+        0.75,
+        0.075,
+    )
+
+
+def test_triggers_are_handed_over_once_stopped(supervisor_builder, mocker):
+    supervisor: TriggerRunnerSupervisor = supervisor_builder()
+    supervisor.running_triggers.update({1, 2})
+    mocker.patch.object(TriggerRunnerSupervisor, "load_balance_threshold", 0.5)
+    rebalance = mocker.patch.object(Trigger, "rebalance", return_value=(99, [2]))
+    hand_over = mocker.patch.object(Trigger, "hand_over")
+    mocker.patch.object(Trigger, "assign_unassigned")
+    mocker.patch.object(Trigger, "ids_for_triggerer", side_effect=[[1, 2], [1, 2], [1]])
+    update_triggers = mocker.patch.object(TriggerRunnerSupervisor, "update_triggers")
+
+    supervisor.load_triggers()
+    # 2 is cancelled, but stays ours until it has stopped
+    update_triggers.assert_called_once_with({1})
+    hand_over.assert_not_called()
+
+    supervisor.load_triggers()
+    hand_over.assert_not_called()
+
+    supervisor.running_triggers.discard(2)
+    supervisor.load_triggers()
+    hand_over.assert_called_once_with([2], supervisor.job.id, 99)
+    assert update_triggers.call_args.args == ({1},)
+    # The next triggers are only picked a minute later
+    rebalance.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_trigger_resumes_from_checkpoint():
+    runner = TriggerRunner()
+    classpath, kwargs = CheckpointingTrigger().serialize()
+    runner.to_create.append(
+        workloads.RunTrigger.model_construct(
+            id=1,
+            ti=None,
+            classpath=classpath,
+            encrypted_kwargs=json.dumps(BaseSerialization.serialize(kwargs)),
+            encrypted_checkpoint=Trigger.encrypt_kwargs({"runs": 5}),
+            timeout_after=None,
+        )
+    )
+    await runner.create_triggers()
+    for _ in range(30):
+        await asyncio.sleep(0.1)
+        if await runner.cleanup_finished_triggers():
+            break
+    else:
+        pytest.fail("Trigger did not finish")
+
+    assert [(trigger_id, event.payload) for trigger_id, event in runner.events] == [(1, 6)]
+    assert runner.checkpoints == {1: {"runs": 6}}
+
+
+def test_checkpoints_are_saved(session, supervisor_builder):
+    trigger_orm = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add(trigger_orm)
+    session.commit()
+    trigger_id = trigger_orm.id
+
+    supervisor: TriggerRunnerSupervisor = supervisor_builder()
+    for runs in (1, 2):
+        supervisor._handle_request(
+            messages.TriggerStateChanges(
+                events=None, checkpoints={trigger_id: Trigger.encrypt_kwargs({"runs": runs})}
+            ),
+            req_id=1,
+            log=MagicMock(),
+        )
+    supervisor.handle_checkpoints()
+
+    assert not supervisor.checkpoints
+    trigger_orm = session.scalars(select(Trigger).where(Trigger.id == trigger_id)).one()
+    assert trigger_orm.checkpoint == {"runs": 2}
+
+
 def test_failed_trigger(session, dag_maker, supervisor_builder):
     """
     Checks that the triggerer will correctly fail task instances that depend on
@@ -26,6 +26,7 @@ import pendulum
 import pytest
 import pytz
 from cryptography.fernet import Fernet
+from sqlalchemy import select
 
 from airflow._shared.timezones import timezone
 from airflow.jobs.job import Job
@@ -211,6 +212,68 @@ def test_submit_event(mock_deadline_submit_event, session, create_task_instance)
     mock_deadline_submit_event.assert_called_once_with(event, session)
 
 
+def test_submit_events(session, create_task_instance):
+    """
+    Tests that events submitted in bulk have the same effect as submitting them one by one.
+    """
+    plain, task_end, asset_trigger = (
+        Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(3)
+    )
+    session.add_all([plain, task_end, asset_trigger])
+    session.flush()
+    # Two task instances deferred on the same trigger, and one on a trigger that ends its task
+    first = create_task_instance(
+        session=session, task_id="first", logical_date=timezone.utcnow(), state=State.DEFERRED
+    )
+    first.trigger_id = plain.id
+    first.next_kwargs = {"cheesecake": True}
+    second = TaskInstance(
+        task=EmptyOperator(task_id="second", dag=first.task.dag),
+        run_id=first.run_id,
+        dag_version_id=first.dag_version_id,
+    )
+    second.state = State.DEFERRED
+    second.trigger_id = plain.id
+    third = TaskInstance(
+        task=EmptyOperator(task_id="third", dag=first.task.dag),
+        run_id=first.run_id,
+        dag_version_id=first.dag_version_id,
+    )
+    third.state = State.DEFERRED
+    third.trigger_id = task_end.id
+    session.add_all([second, third])
+    asset = AssetModel("test")
+    asset.triggers.append(asset_trigger)
+    session.add(asset)
+    session.commit()
+
+    Trigger.submit_events(
+        [
+            (plain.id, TriggerEvent("one")),
+            (asset_trigger.id, TriggerEvent("a")),
+            (task_end.id, TaskSuccessEvent()),
+            (plain.id, TriggerEvent("two")),
+            (asset_trigger.id, TriggerEvent("b")),
+        ],
+        session=session,
+    )
+    session.flush()
+
+    tis = {ti.task_id: ti for ti in session.scalars(select(TaskInstance))}
+    assert tis["first"].state == State.SCHEDULED
+    assert tis["first"].trigger_id is None
+    assert tis["first"].scheduled_dttm is not None
+    # Only the first event of a trigger resumes its tasks
+    assert tis["first"].next_kwargs == {"event": "one", "cheesecake": True}
+    assert tis["second"].state == State.SCHEDULED
+    assert tis["second"].next_kwargs == {"event": "one"}
+    assert tis["third"].state == State.SUCCESS
+    # But every event is sent to the assets
+    assert [
+        event.extra["payload"] for event in session.scalars(select(AssetEvent).order_by(AssetEvent.id))
+    ] == ["a", "b"]
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
@@ -231,6 +294,167 @@ def test_submit_failure(session, create_task_instance):
     assert updated_task_instance.next_method == "__fail__"
 
 
+def test_save_checkpoints(session):
+    first = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    second = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([first, second])
+    session.commit()
+    assert first.checkpoint is None
+
+    Trigger.save_checkpoints(
+        {first.id: Trigger.encrypt_kwargs({"cursor": "abc", "at": DEFAULT_DATE})}, session=session
+    )
+    session.commit()
+    session.expire_all()
+
+    assert first.checkpoint == {"cursor": "abc", "at": DEFAULT_DATE}
+    assert second.checkpoint is None
+    assert "abc" not in first.encrypted_checkpoint
+
+
+def test_add_loop_time(session):
+    first = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    second = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add_all([first, second])
+    session.commit()
+
+    Trigger.add_loop_time({first.id: 1.5}, session=session)
+    Trigger.add_loop_time({first.id: 0.5, second.id: 2.0}, session=session)
+    session.commit()
+
+    assert dict(session.execute(select(Trigger.id, Trigger.loop_time)).all()) == {
+        first.id: 2.0,
+        second.id: 2.0,
+    }
+
+    Trigger.add_loop_time({first.id: 6.0, second.id: 0.0}, period=60, session=session)
+    session.commit()
+
+    assert dict(session.execute(select(Trigger.id, Trigger.cost)).all()) == {first.id: 0.1, second.id: 0.0}
+
+
+def _triggerer(session) -> Job:
+    job = Job(heartrate=10, state=State.RUNNING)
+    TriggererJobRunner(job)
+    session.add(job)
+    session.flush()
+    return job
+
+
+def _trigger_with_cost(session, triggerer: Job | None, cost: float | None) -> Trigger:
+    trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    trigger.triggerer_id = triggerer.id if triggerer else None
+    trigger.cost = cost
+    session.add(trigger)
+    session.flush()
+    return trigger
+
+
+def test_rebalance(session):
+    busy, quiet, idle = (_triggerer(session) for _ in range(3))
+    busy_triggers = [_trigger_with_cost(session, busy, cost) for cost in (0.5, 0.3, 0.1, 0.1)]
+    _trigger_with_cost(session, quiet, 0.1)
+    session.commit()
+
+    # The average is 0.37, so moving the 0.3 trigger brings both busy and idle closest to it
+    target_id, trigger_ids = Trigger.rebalance(
+        busy.id, capacity=10, health_check_threshold=30, load_balance_threshold=0.5, session=session
+    )
+    assert (target_id, trigger_ids) == (idle.id, [busy_triggers[1].id])
+
+    # Nothing moves until the triggers are handed over
+    assert session.get(Trigger, busy_triggers[1].id).triggerer_id == busy.id
+    Trigger.hand_over(trigger_ids, busy.id, target_id, session=session)
+    session.expire_all()
+    assert [session.get(Trigger, t.id).triggerer_id for t in busy_triggers] == [
+        busy.id,
+        idle.id,
+        busy.id,
+        busy.id,
+    ]
+    assert Trigger.get_triggerer_costs([busy.id, quiet.id, idle.id], session=session) == pytest.approx(
+        {busy.id: 0.7, quiet.id: 0.1, idle.id: 0.3}
+    )
+
+    # Still overloaded (0.7 against an average of 0.37), so the two small ones go to the least loaded
+    target_id, trigger_ids = Trigger.rebalance(
+        busy.id, capacity=10, health_check_threshold=30, load_balance_threshold=0.5, session=session
+    )
+    assert (target_id, trigger_ids) == (quiet.id, [busy_triggers[2].id, busy_triggers[3].id])
+
+    # ... but only as many as it has room for
+    target_id, trigger_ids = Trigger.rebalance(
+        busy.id, capacity=2, health_check_threshold=30, load_balance_threshold=0.5, session=session
+    )
+    assert (target_id, trigger_ids) == (quiet.id, [busy_triggers[2].id])
+
+    Trigger.hand_over(trigger_ids, busy.id, target_id, session=session)
+    target_id, trigger_ids = Trigger.rebalance(
+        busy.id, capacity=10, health_check_threshold=30, load_balance_threshold=0.5, session=session
+    )
+    assert (target_id, trigger_ids) == (quiet.id, [busy_triggers[3].id])
+    Trigger.hand_over(trigger_ids, busy.id, target_id, session=session)
+
+    # 0.5 is close enough to the average now
+    assert Trigger.rebalance(
+        busy.id, capacity=10, health_check_threshold=30, load_balance_threshold=0.5, session=session
+    ) == (None, [])
+
+
+def test_get_classpaths(session):
+    this, other = _triggerer(session), _triggerer(session)
+    dead = _triggerer(session)
+    dead.end_date = timezone.utcnow()
+    for triggerer, classpath in (
+        (this, "airflow.triggers.testing.SuccessTrigger"),
+        (None, "airflow.triggers.testing.FailureTrigger"),
+        (dead, "airflow.providers.standard.triggers.temporal.DateTimeTrigger"),
+        (other, "airflow.providers.standard.triggers.temporal.TimeDeltaTrigger"),
+    ):
+        trigger = Trigger(classpath=classpath, kwargs={})
+        trigger.triggerer_id = triggerer.id if triggerer else None
+        session.add(trigger)
+    session.commit()
+
+    # The triggers of the other (alive) triggerer are not ours to run
+    assert sorted(Trigger.get_classpaths(this.id, health_check_threshold=30, session=session)) == [
+        "airflow.providers.standard.triggers.temporal.DateTimeTrigger",
+        "airflow.triggers.testing.FailureTrigger",
+        "airflow.triggers.testing.SuccessTrigger",
+    ]
+
+
+def test_hand_over_skips_triggers_no_longer_ours(session):
+    source, target, other = (_triggerer(session) for _ in range(3))
+    trigger = _trigger_with_cost(session, other, 0.5)
+    session.commit()
+
+    Trigger.hand_over([trigger.id], source.id, target.id, session=session)
+    session.expire_all()
+    assert session.get(Trigger, trigger.id).triggerer_id == other.id
+
+
+@pytest.mark.need_serialized_dag
+def test_assign_unassigned_skips_overloaded_triggerer(session, create_task_instance):
+    busy = _triggerer(session)
+    # Another triggerer, with nothing to do
+    _triggerer(session)
+    _trigger_with_cost(session, busy, 1.0)
+    unassigned = _trigger_with_cost(session, None, None)
+    ti = create_task_instance(task_id="waiting", logical_date=timezone.utcnow(), state=State.DEFERRED)
+    ti.trigger_id = unassigned.id
+    session.commit()
+
+    Trigger.assign_unassigned(busy.id, 100, health_check_threshold=30, load_balance_threshold=0.5)
+    session.expire_all()
+    assert session.get(Trigger, unassigned.id).triggerer_id is None
+
+    # Without load balancing, it's only about the number of triggers
+    Trigger.assign_unassigned(busy.id, 100, health_check_threshold=30)
+    session.expire_all()
+    assert session.get(Trigger, unassigned.id).triggerer_id == busy.id
+
+
 @pytest.mark.parametrize(
     "event_cls, expected",
     [
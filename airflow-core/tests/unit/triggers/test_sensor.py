@@ -0,0 +1,140 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from airflow.exceptions import AirflowFailException, AirflowSkipException
+from airflow.models.trigger import Trigger
+from airflow.sdk import DAG
+from airflow.sdk.bases.sensor import BaseSensorOperator, PokeReturnValue
+from airflow.triggers.sensor import SensorPokeTrigger
+
+ERRORS = {
+    "skip": AirflowSkipException("skip"),
+    "fail": AirflowFailException("fail"),
+    "boom": ValueError("boom"),
+}
+
+
+class CountingSensor(BaseSensorOperator):
+    """Sensor that is done on its ``done_after``th poke, or raises the ``error`` exception."""
+
+    template_fields = ("target",)
+
+    def __init__(self, *, target="", done_after=1, error=None, **kwargs):
+        super().__init__(**kwargs)
+        self.target = target
+        self.done_after = done_after
+        self.error = error
+        self.pokes = 0
+
+    def poke(self, context):
+        self.pokes += 1
+        if self.error:
+            raise ERRORS[self.error]
+        if self.pokes >= self.done_after:
+            return PokeReturnValue(True, xcom_value=(context["ds"], self.target))
+        return False
+
+
+class CallableSensor(CountingSensor):
+    def __init__(self, *, check, **kwargs):
+        super().__init__(**kwargs)
+        self.check = check
+
+
+def _make_trigger(sensor: BaseSensorOperator) -> SensorPokeTrigger | None:
+    return SensorPokeTrigger.from_sensor(
+        sensor, {"ds": "2025-01-01", "ti": object()}, started_at=time.time(), poke_count=1
+    )
+
+
+async def _events(trigger: SensorPokeTrigger) -> list:
+    return [event.payload async for event in trigger.run()]
+
+
+class TestSensorPokeTrigger:
+    def test_serialization(self):
+        trigger = _make_trigger(CountingSensor(task_id="sensor", target="{{ ds }}", done_after=3))
+
+        classpath, kwargs = trigger.serialize()
+
+        assert classpath == "airflow.triggers.sensor.SensorPokeTrigger"
+        assert SensorPokeTrigger(**kwargs).serialize() == (classpath, kwargs)
+        # Goes through the trigger kwargs serialization unchanged
+        assert Trigger._decrypt_kwargs(Trigger.encrypt_kwargs(kwargs)) == kwargs
+
+    def test_sensor_is_recreated_without_dag_and_task_context(self):
+        with DAG("dag"):
+            sensor = CountingSensor(task_id="sensor", target="{{ ds }}", done_after=3)
+        sensor.target = "2025-01-01"  # as rendered by the task
+
+        trigger = _make_trigger(sensor)
+
+        assert trigger.sensor_classpath == f"{__name__}.CountingSensor"
+        recreated = trigger._create_sensor()
+        assert (recreated.task_id, recreated.done_after, recreated.target) == ("sensor", 3, "2025-01-01")
+        assert not recreated.has_dag()
+        assert trigger.context == {"ds": "2025-01-01"}
+
+    def test_sensor_defined_in_dag_file_is_not_supported(self):
+        dag_file_sensor = type("DagFileSensor", (CountingSensor,), {"__module__": "unusual_prefix_abc_dag"})
+
+        assert _make_trigger(dag_file_sensor(task_id="sensor")) is None
+
+    def test_sensor_with_callable_argument_is_not_supported(self):
+        assert _make_trigger(CallableSensor(task_id="sensor", check=lambda: True)) is None
+
+    @pytest.mark.asyncio
+    async def test_run_refuses_classes_that_are_not_sensors(self):
+        trigger = SensorPokeTrigger(
+            sensor_classpath="subprocess.Popen",
+            sensor_kwargs={"args": ["true"]},
+            rendered_fields={},
+            context={},
+            started_at=time.time(),
+        )
+
+        (event,) = await _events(trigger)
+
+        assert event["status"] == "error"
+        assert "subprocess.Popen is not a sensor" in event["message"]
+
+    @pytest.mark.asyncio
+    async def test_run_pokes_until_done(self):
+        sensor = CountingSensor(task_id="sensor", target="{{ ds }}", done_after=3, poke_interval=0)
+        sensor.target = "2025-01-01"
+        trigger = _make_trigger(sensor)
+
+        assert await _events(trigger) == [{"status": "success", "xcom_value": ("2025-01-01", "2025-01-01")}]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error, status",
+        [("skip", "skipped"), ("fail", "failed"), ("boom", "error")],
+    )
+    async def test_run_reports_poke_errors(self, error, status):
+        trigger = _make_trigger(CountingSensor(task_id="sensor", error=error, poke_interval=0))
+
+        (event,) = await _events(trigger)
+
+        assert event["status"] == status
+        assert str(ERRORS[error]) in event["message"]
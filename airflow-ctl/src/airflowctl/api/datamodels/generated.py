@@ -911,6 +911,7 @@ class TriggerResponse(BaseModel):
     kwargs: Annotated[str, Field(title="Kwargs")]
     created_date: Annotated[datetime, Field(title="Created Date")]
     triggerer_id: Annotated[int | None, Field(title="Triggerer Id")] = None
+    loop_time: Annotated[float | None, Field(title="Loop Time")] = None
 
 
 class TriggererInfoResponse(BaseModel):
@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Helpers shared by the benchmark scripts in this directory.
+
+The scripts are run directly (``python dev/airflow_perf/<script>.py``), so they import this module by its name.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import textwrap
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import rich_click as click
+import structlog
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from sqlalchemy.orm import Session
+
+    from airflow.models.dagbag import DagBag
+
+DAG_FILE = """
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+with DAG("{dag_id}", schedule=None):
+    for i in range({num_tasks}):
+        BaseOperator(task_id=f"task_{{i}}")
+"""
+
+
+def percentiles(values: Iterable[float]) -> dict[str, float]:
+    """Return the p50, p95, p99 and max of ``values`` (in seconds), in milliseconds."""
+    values = sorted(values)
+    if len(values) > 1:
+        quantiles = statistics.quantiles(values, n=100, method="inclusive")
+        p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+    else:
+        p50 = p95 = p99 = values[0] if values else 0.0
+    return {
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+    }
+
+
+def benchmark_options(func: Callable) -> Callable:
+    """Add the ``--verbose``, ``--reset-db`` and ``--output`` options every benchmark has."""
+    options = (
+        click.option("--verbose", is_flag=True, default=False, help="Show the logs of Airflow"),
+        click.option("--reset-db", is_flag=True, default=False, help="Reset the metadata DB before seeding"),
+        click.option(
+            "--output", type=click.Path(dir_okay=False), help="Write the results as JSON to this file"
+        ),
+    )
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def prepare(*, verbose: bool, reset_db: bool) -> None:
+    """Silence Airflow's logs unless ``verbose``, and reset the metadata DB if asked to."""
+    os.environ.setdefault("AIRFLOW__CORE__LOAD_EXAMPLES", "False")
+
+    from airflow.utils import db
+
+    if not verbose:
+        logging.disable(logging.CRITICAL)
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    if reset_db:
+        db.resetdb()
+
+
+def save_results(results: dict, output: str | None, console: Console) -> None:
+    """Write ``results`` as JSON to ``output``, if set."""
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        console.print(f"Saved results to {output}")
+
+
+def print_table(console: Console, title: str, columns: Sequence[str], rows: Iterable[Sequence[str]]) -> None:
+    """Print a table of results, with the labels in the first column and the numbers in the others."""
+    table = Table(title=title)
+    for i, column in enumerate(columns):
+        table.add_column(column, justify="right" if i else "left", no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def count_queries(on_query: Callable[[], Any]) -> None:
+    """Call ``on_query`` before every SQL statement the metadata DB engine executes."""
+    from sqlalchemy import event
+
+    from airflow import settings
+
+    @event.listens_for(settings.engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        on_query()
+
+
+def sync_dags(dagbag: DagBag, bundle_name: str, session: Session) -> None:
+    """Write the DAGs of ``dagbag`` to the DB in the ``bundle_name`` bundle, without any earlier runs."""
+    from sqlalchemy import delete, select
+
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.dagrun import DagRun
+    from airflow.models.xcom import XComModel
+
+    if not session.scalar(select(DagBundleModel).where(DagBundleModel.name == bundle_name)):
+        session.add(DagBundleModel(name=bundle_name))
+        session.flush()
+    session.execute(delete(XComModel).where(XComModel.dag_id.in_(dagbag.dag_ids)))
+    session.execute(delete(DagRun).where(DagRun.dag_id.in_(dagbag.dag_ids)))
+    dagbag.sync_to_db(bundle_name, None, session=session)
+
+
+def create_dag(dag_id: str, num_tasks: int, bundle_name: str) -> None:
+    """Create (or re-create) a DAG of ``num_tasks`` independent tasks, without any runs."""
+    from airflow.models.dagbag import DagBag
+    from airflow.utils.session import create_session
+
+    with tempfile.TemporaryDirectory() as dag_folder:
+        with open(os.path.join(dag_folder, f"{dag_id}.py"), "w") as f:
+            f.write(textwrap.dedent(DAG_FILE.format(dag_id=dag_id, num_tasks=num_tasks)))
+        dagbag = DagBag(dag_folder=dag_folder, include_examples=False, safe_mode=False)
+        if dagbag.import_errors:
+            sys.exit(f"Unable to parse DAG {dag_id}: {dagbag.import_errors}")
+
+        with create_session() as session:
+            sync_dags(dagbag, bundle_name, session)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Load test for the Task Execution API.
+
+Every running task talks to the Execution API through its supervisor, so the latency of the handful of routes
+a supervisor calls for every task (``ti_run``, ``ti_heartbeat``, ``ti_update_state``, XComs and Variables) is
+what limits how many tasks a deployment can run concurrently.
+
+This script seeds a DAG with the requested number of queued task instances in the configured metadata DB
+(``AIRFLOW__DATABASE__SQL_ALCHEMY_CONN`` - SQLite works for a quick check, but use Postgres or MySQL for
+numbers that mean anything) and then simulates one supervisor per task instance against the Execution API
+running in-process. For every route it reports request count, errors, p50/p99 latency and the number of SQL
+queries executed per request, together with the overall throughput.
+
+The results can be written to a JSON file with ``--output`` and compared against an earlier run with
+``--baseline`` to catch regressions, in which case the script exits with a non-zero status if any route got
+slower (by more than ``--tolerance``) or started making more queries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import os
+import random
+import secrets
+import socket
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, NamedTuple
+
+import rich_click as click
+from benchmark_utils import (
+    benchmark_options,
+    count_queries,
+    create_dag,
+    percentiles,
+    prepare,
+    print_table,
+    save_results,
+)
+from rich.console import Console
+
+if TYPE_CHECKING:
+    import httpx
+
+BUNDLE_NAME = "execution_api_load"
+DAG_ID = "execution_api_load"
+VARIABLE_KEY = "execution_api_load"
+
+# Number of SQL queries made by the request currently being handled. The app runs in the same event loop as
+# the supervisors (and sync routes in threads started with a copy of the context) so the counter set around
+# each request is visible to the DB engine event.
+_request_queries: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "_request_queries", default=None
+)
+
+
+class LoadTI(NamedTuple):
+    """A task instance seeded for a simulated supervisor."""
+
+    id: str
+    dag_id: str
+    run_id: str
+    task_id: str
+
+
+class RouteStats:
+    """
+    Collect latencies, errors and query counts for a single route.
+    """
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.errors: Counter[str] = Counter()
+        self.successes = 0
+        self.queries = 0
+        """Queries made by successful requests, failed ones could have stopped at any point."""
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": len(self.latencies),
+            "errors": dict(self.errors),
+            **percentiles(self.latencies),
+            "queries_per_request": self.queries / self.successes if self.successes else 0.0,
+        }
+
+
+def seed(num_supervisors: int, tasks_per_run: int) -> list[LoadTI]:
+    """
+    Create (or re-create) the load test DAG with ``num_supervisors`` queued task instances.
+    """
+    from airflow.models.dagbag import DBDagBag
+    from airflow.models.variable import Variable
+    from airflow.utils import timezone
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    create_dag(DAG_ID, tasks_per_run, BUNDLE_NAME)
+
+    tis: list[LoadTI] = []
+    with create_session() as session:
+        Variable.set(VARIABLE_KEY, "value", session=session)
+        dag = DBDagBag().get_latest_version_of_dag(DAG_ID, session=session)
+        if dag is None:
+            sys.exit(f"DAG {DAG_ID} was not written to the DB")
+
+        now = timezone.utcnow()
+        num_runs = -(-num_supervisors // tasks_per_run)
+        for run_no in range(num_runs):
+            dag_run = dag.create_dagrun(
+                run_id=f"load__{run_no}",
+                run_after=now,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                start_date=now,
+                session=session,
+            )
+            for ti in dag_run.task_instances:
+                if len(tis) == num_supervisors:
+                    break
+                ti.state = TaskInstanceState.QUEUED
+                tis.append(LoadTI(str(ti.id), ti.dag_id, ti.run_id, ti.task_id))
+    return tis
+
+
+def count_request_queries() -> None:
+    """
+    Attribute every SQL statement executed by the metadata DB engine to the request being handled.
+    """
+
+    def on_query():
+        if (queries := _request_queries.get()) is not None:
+            queries[0] += 1
+
+    count_queries(on_query)
+
+
+class Supervisor:
+    """
+    Simulate the Execution API calls a supervisor makes while running a single task instance.
+    """
+
+    def __init__(self, ti: LoadTI, client: httpx.AsyncClient, stats: dict[str, RouteStats]):
+        self.ti = ti
+        self.client = client
+        self.stats = stats
+        self.pid = random.randint(1000, 2**22)
+
+    async def call(self, route: str, method: str, url: str, **kwargs) -> None:
+        route_stats = self.stats[route]
+        queries = [0]
+        token = _request_queries.set(queries)
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception as e:
+            route_stats.errors[type(e).__name__] += 1
+            return
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_queries.reset(token)
+        route_stats.latencies.append(elapsed)
+        if response.is_error:
+            route_stats.errors[str(response.status_code)] += 1
+        else:
+            route_stats.successes += 1
+            route_stats.queries += queries[0]
+
+    async def run(self, *, heartbeats: int, heartbeat_interval: float, ramp_up: float) -> None:
+        ti = self.ti
+        xcom_url = f"/xcoms/{ti.dag_id}/{ti.run_id}/{ti.task_id}/return_value"
+
+        await asyncio.sleep(random.uniform(0, ramp_up))
+        await self.call(
+            "ti_run",
+            "PATCH",
+            f"/task-instances/{ti.id}/run",
+            json={
+                "state": "running",
+                "hostname": socket.gethostname(),
+                "unixname": "airflow",
+                "pid": self.pid,
+                "start_date": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        await self.call("get_variable", "GET", f"/variables/{VARIABLE_KEY}")
+        for _ in range(heartbeats):
+            await asyncio.sleep(heartbeat_interval * random.uniform(0.9, 1.1))
+            await self.call(
+                "ti_heartbeat",
+                "PUT",
+                f"/task-instances/{ti.id}/heartbeat",
+                json={"hostname": socket.gethostname(), "pid": self.pid},
+            )
+        await self.call("set_xcom", "POST", xcom_url, json={"rows": 42})
+        await self.call("get_xcom", "GET", xcom_url)
+        await self.call(
+            "ti_update_state",
+            "PATCH",
+            f"/task-instances/{ti.id}/state",
+            json={"state": "success", "end_date": datetime.now(timezone.utc).isoformat()},
+        )
+
+
+async def run_load(
+    tis: list[LoadTI], *, heartbeats: int, heartbeat_interval: float, ramp_up: float, threads: int
+) -> tuple[dict[str, RouteStats], float]:
+    """
+    Run one simulated supervisor per task instance against the in-process Execution API.
+    """
+    import anyio.to_thread
+    import httpx
+
+    from airflow.api_fastapi.execution_api.app import InProcessExecutionAPI
+
+    # Sync routes are run in a thread pool, its size is the main knob on how much concurrency the server has
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+    count_request_queries()
+
+    api = InProcessExecutionAPI()
+    async with (
+        api.app.router.lifespan_context(api.app),
+        httpx.AsyncClient(transport=api.atransport, base_url="http://in-process.invalid.") as client,
+    ):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                Supervisor(ti, client, stats).run(
+                    heartbeats=heartbeats, heartbeat_interval=heartbeat_interval, ramp_up=ramp_up
+                )
+                for ti in tis
+            )
+        )
+        elapsed = time.perf_counter() - start
+    return stats, elapsed
+
+
+def print_report(results: dict, console: Console) -> None:
+    print_table(
+        console,
+        f"Execution API load: {results['supervisors']} supervisors",
+        ("Route", "Requests", "Errors", "p50 (ms)", "p99 (ms)", "max (ms)", "Queries/req"),
+        (
+            [
+                route,
+                str(route_stats["requests"]),
+                ", ".join(f"{code}: {n}" for code, n in route_stats["errors"].items()) or "0",
+                f"{route_stats['p50_ms']:.2f}",
+                f"{route_stats['p99_ms']:.2f}",
+                f"{route_stats['max_ms']:.2f}",
+                f"{route_stats['queries_per_request']:.1f}",
+            ]
+            for route, route_stats in results["routes"].items()
+        ),
+    )
+    console.print(
+        f"{results['total_requests']} requests in {results['elapsed_s']:.2f}s: "
+        f"{results['throughput_rps']:.1f} requests/s"
+    )
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Return a description of every route that regressed compared to the baseline run.
+    """
+    regressions = []
+    for route, route_stats in results["routes"].items():
+        if not (before := baseline["routes"].get(route)):
+            continue
+        if route_stats["queries_per_request"] > before["queries_per_request"]:
+            regressions.append(
+                f"{route}: {route_stats['queries_per_request']:.1f} queries per request "
+                f"(was {before['queries_per_request']:.1f})"
+            )
+        if route_stats["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{route}: p99 {route_stats['p99_ms']:.2f}ms (was {before['p99_ms']:.2f}ms, "
+                f"tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+@click.command()
+@click.option("--supervisors", default=1000, help="Number of concurrently running tasks to simulate")
+@click.option("--tasks-per-run", default=10, help="Number of tasks in each seeded DagRun")
+@click.option("--heartbeats", default=5, help="Number of heartbeats each supervisor sends")
+@click.option("--heartbeat-interval", default=1.0, help="Seconds between heartbeats of a supervisor")
+@click.option("--ramp-up", default=1.0, help="Supervisors start at random over this many seconds")
+@click.option("--threads", default=40, help="Size of the thread pool running the (sync) API routes")
+@benchmark_options
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON results of an earlier run to compare against",
+)
+@click.option(
+    "--tolerance",
+    default=0.2,
+    help="How much slower (as a fraction) the p99 of a route can be than the baseline before failing",
+)
+def main(
+    supervisors,
+    tasks_per_run,
+    heartbeats,
+    heartbeat_interval,
+    ramp_up,
+    threads,
+    verbose,
+    reset_db,
+    output,
+    baseline,
+    tolerance,
+):
+    """
+    Measure the latency and DB load of the Execution API routes every task calls.
+
+    Example:
+
+        AIRFLOW__DATABASE__SQL_ALCHEMY_CONN=postgresql+psycopg2://... \\
+            python dev/airflow_perf/execution_api_load.py --supervisors 5000 --output before.json
+    """
+    # Auth is bypassed by the in-process API, but the app still needs a key to start up
+    os.environ.setdefault("AIRFLOW__API_AUTH__JWT_SECRET", secrets.token_urlsafe(32))
+    # Failed requests are counted in the report. Rendering a traceback for each of them on the event loop the
+    # supervisors share with the app would make the numbers meaningless, hence no logs unless --verbose.
+    prepare(verbose=verbose, reset_db=reset_db)
+
+    from airflow import settings
+
+    console = Console()
+    console.print(f"Seeding {supervisors} task instances")
+    tis = seed(supervisors, tasks_per_run)
+
+    console.print(f"Running {len(tis)} supervisors")
+    stats, elapsed = asyncio.run(
+        run_load(
+            tis,
+            heartbeats=heartbeats,
+            heartbeat_interval=heartbeat_interval,
+            ramp_up=ramp_up,
+            threads=threads,
+        )
+    )
+
+    total_requests = sum(len(route_stats.latencies) for route_stats in stats.values())
+    results = {
+        "supervisors": len(tis),
+        "database": settings.engine.dialect.name,
+        "elapsed_s": elapsed,
+        "total_requests": total_requests,
+        "throughput_rps": total_requests / elapsed if elapsed else 0.0,
+        "routes": {route: route_stats.to_dict() for route, route_stats in sorted(stats.items())},
+    }
+    print_report(results, console)
+    save_results(results, output, console)
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare_with_baseline(results, json.load(f), tolerance)
+        if regressions:
+            console.print("[red]Regressions compared to baseline:[/]")
+            for regression in regressions:
+                console.print(f"  {regression}")
+            sys.exit(1)
+        console.print("[green]No regressions compared to baseline[/]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Throughput benchmark for the scheduler, against an executor with simulated behaviour.
+
+This script writes synthetic DAGs generated by ``performance/src/performance_dags`` to the configured metadata
+DB (``AIRFLOW__DATABASE__SQL_ALCHEMY_CONN`` - SQLite works for a quick check, but use Postgres or MySQL for
+numbers that mean anything), pauses every other DAG, and runs the scheduler (``SchedulerJobRunner``, in this
+process) with a ``SimulatedExecutor`` until every DAG has run the requested number of times.
+
+The simulated executor doesn't run anything: it holds as many tasks as it has slots, takes a configurable time
+to accept them and to sync with its (imaginary) workers, and reports each task as started then finished (or
+failed, at random) after a configurable delay. It updates the task instances in the DB as the workers would
+through the Task Execution API, which isn't counted as scheduler work below.
+
+Once every DAG run is done it reports:
+
+* the number of task instances queued and finished per second;
+* the time from a task instance being scheduled to being queued, from being queued to being handed to the
+  executor, and from being queued to running;
+* how long the scheduler spent on the executor heartbeat, and on processing each executor event;
+* the number of SQL queries the scheduler made per task instance, and per executor event processed.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import os
+import random
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import rich_click as click
+from benchmark_utils import (
+    benchmark_options,
+    count_queries,
+    percentiles,
+    prepare,
+    print_table,
+    save_results,
+    sync_dags,
+)
+from rich.console import Console
+
+from airflow.executors.base_executor import BaseExecutor
+from airflow.executors.executor_utils import ExecutorName
+from airflow.utils.state import DagRunState, TaskInstanceState
+
+if TYPE_CHECKING:
+    from airflow.executors import workloads
+    from airflow.models.taskinstancekey import TaskInstanceKey
+
+BUNDLE_NAME = "scheduler_benchmark"
+
+PERFORMANCE_DAGS_DIR = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "performance", "src")
+
+SHAPES = ("no_structure", "linear", "binary_tree", "star", "grid")
+
+
+class SimulatedExecutor(BaseExecutor):
+    """
+    Executor that doesn't run tasks, but behaves as if it did.
+
+    :param parallelism: Number of tasks the executor can hold at once.
+    :param submit_latency: Seconds taken to accept each batch of tasks.
+    :param sync_latency: Seconds taken by each sync with the workers.
+    :param start_delay: Seconds from a task being accepted to it running.
+    :param task_duration: Seconds a task runs for.
+    :param failure_rate: Fraction of the tasks that fail.
+    """
+
+    def __init__(
+        self,
+        parallelism: int,
+        *,
+        submit_latency: float = 0.0,
+        sync_latency: float = 0.0,
+        start_delay: float = 0.0,
+        task_duration: float = 0.0,
+        failure_rate: float = 0.0,
+    ):
+        super().__init__(parallelism=parallelism)
+        self.name = ExecutorName(module_path=f"{__name__}.SimulatedExecutor", alias="simulated")
+        self.submit_latency = submit_latency
+        self.sync_latency = sync_latency
+        self.start_delay = start_delay
+        self.task_duration = task_duration
+        self.failure_rate = failure_rate
+
+        # Simulated worker events, as (due at, sequence, event, key)
+        self.worker_events: list[tuple[float, int, str, TaskInstanceKey]] = []
+        self.ti_ids: dict[TaskInstanceKey, str] = {}
+        self.submitted_at: dict[TaskInstanceKey, float] = {}
+        self.heartbeat_durations: list[float] = []
+        # Set while the executor does what the workers would, so that isn't counted as scheduler work
+        self.simulating = False
+        self._sequence = 0
+
+    def _push_worker_event(self, due_at: float, event: str, key: TaskInstanceKey) -> None:
+        self._sequence += 1
+        heapq.heappush(self.worker_events, (due_at, self._sequence, event, key))
+
+    def _process_workloads(self, workload_list: Sequence[workloads.All]) -> None:
+        if self.submit_latency:
+            time.sleep(self.submit_latency)
+        now = time.time()
+        for workload in workload_list:
+            key = workload.ti.key
+            self.queued_tasks.pop(key, None)
+            self.running.add(key)
+            self.ti_ids[key] = str(workload.ti.id)
+            self.submitted_at[key] = now
+            self._push_worker_event(now + self.start_delay, "start", key)
+
+    def heartbeat(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().heartbeat()
+        finally:
+            self.heartbeat_durations.append(time.perf_counter() - start)
+
+    def sync(self) -> None:
+        if self.sync_latency:
+            time.sleep(self.sync_latency)
+
+        now = time.time()
+        started: list[dict] = []
+        finished: list[dict] = []
+        while self.worker_events and self.worker_events[0][0] <= now:
+            due_at, _, event, key = heapq.heappop(self.worker_events)
+            at = datetime.fromtimestamp(due_at, tz=timezone.utc)
+            if event == "start":
+                started.append({"ti_id": self.ti_ids[key], "ti_state": TaskInstanceState.RUNNING, "at": at})
+                self._push_worker_event(due_at + self.task_duration, "finish", key)
+            else:
+                state = (
+                    TaskInstanceState.FAILED
+                    if random.random() < self.failure_rate
+                    else TaskInstanceState.SUCCESS
+                )
+                finished.append({"ti_id": self.ti_ids.pop(key), "ti_state": state, "at": at, "key": key})
+
+        self._update_task_instances(started, finished)
+        for ti in finished:
+            self.change_state(ti["key"], ti["ti_state"])
+
+    def _update_task_instances(self, started: list[dict], finished: list[dict]) -> None:
+        """Update the task instances in the DB, as their workers would."""
+        if not started and not finished:
+            return
+
+        from sqlalchemy import bindparam, update
+
+        from airflow.models.taskinstance import TaskInstance
+        from airflow.utils.session import create_session
+
+        table = TaskInstance.__table__
+        self.simulating = True
+        try:
+            with create_session() as session:
+                for params, date_column in ((started, "start_date"), (finished, "end_date")):
+                    if params:
+                        session.execute(
+                            update(table)
+                            .where(table.c.id == bindparam("ti_id"))
+                            .values({"state": bindparam("ti_state"), date_column: bindparam("at")}),
+                            [{key: ti[key] for key in ("ti_id", "ti_state", "at")} for ti in params],
+                        )
+        finally:
+            self.simulating = False
+
+    def end(self) -> None:
+        pass
+
+    def terminate(self) -> None:
+        pass
+
+
+def create_dags(num_dags: int, num_tasks: int, shape: str, num_runs: int) -> list[str]:
+    """
+    Write the performance DAGs to the DB, unpaused, and pause every other DAG.
+
+    :return: The ids of the DAGs.
+    """
+    from sqlalchemy import update
+
+    from airflow.models.dag import DagModel
+    from airflow.models.dagbag import DagBag
+    from airflow.utils.session import create_session
+
+    os.environ.update(
+        PERF_DAGS_COUNT=str(num_dags),
+        PERF_TASKS_COUNT=str(num_tasks),
+        PERF_SHAPE=shape,
+        PERF_START_PAUSED="0",
+    )
+    if num_runs > 1:
+        # One run an hour, the first one early enough for all of them to be due already
+        start_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=num_runs)
+        os.environ.update(
+            PERF_START_DATE=start_date.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            PERF_SCHEDULE_INTERVAL="1h",
+            PERF_MAX_RUNS=str(num_runs),
+        )
+    else:
+        os.environ.update(PERF_START_DATE="", PERF_START_AGO="1h", PERF_SCHEDULE_INTERVAL="@once")
+        os.environ.pop("PERF_MAX_RUNS", None)
+
+    if PERFORMANCE_DAGS_DIR not in sys.path:
+        sys.path.append(PERFORMANCE_DAGS_DIR)
+    dag_file = os.path.join(PERFORMANCE_DAGS_DIR, "performance_dags", "performance_dag", "performance_dag.py")
+    dagbag = DagBag(dag_folder=dag_file, include_examples=False, safe_mode=False)
+    if dagbag.import_errors:
+        sys.exit(f"Unable to parse the performance DAGs: {dagbag.import_errors}")
+
+    dag_ids = list(dagbag.dag_ids)
+    with create_session() as session:
+        session.execute(update(DagModel).values(is_paused=True))
+        sync_dags(dagbag, BUNDLE_NAME, session)
+        session.execute(update(DagModel).where(DagModel.dag_id.in_(dag_ids)).values(is_paused=False))
+    return dag_ids
+
+
+def count_finished_runs(dag_ids: list[str]) -> int:
+    from sqlalchemy import func, select
+
+    from airflow.models.dagrun import DagRun
+    from airflow.utils.session import create_session
+
+    with create_session() as session:
+        return session.scalar(
+            select(func.count()).where(
+                DagRun.dag_id.in_(dag_ids), DagRun.state.in_((DagRunState.SUCCESS, DagRunState.FAILED))
+            )
+        )
+
+
+class Benchmark:
+    """Drive the scheduler until every DAG run is done, counting what it does on the way."""
+
+    def __init__(self, executor: SimulatedExecutor, dag_ids: list[str], *, num_runs: int, timeout: float):
+        self.executor = executor
+        self.dag_ids = dag_ids
+        self.expected_runs = len(dag_ids) * num_runs
+        self.timeout = timeout
+        self.job_runner = None
+        self.timed_out = False
+        self.queries = 0
+        self.event_queries = 0
+        self.events = 0
+        self.event_durations: list[float] = []
+        self._processing_events = False
+        self._checking = False
+
+    def count_queries(self) -> None:
+        """Count the SQL statements the scheduler executes, and those made while processing executor events."""
+        from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+
+        def on_query():
+            if threading.current_thread() is not threading.main_thread():
+                return
+            if self.executor.simulating or self._checking:
+                return
+            self.queries += 1
+            if self._processing_events:
+                self.event_queries += 1
+
+        count_queries(on_query)
+
+        process_executor_events = SchedulerJobRunner._process_executor_events
+
+        @functools.wraps(process_executor_events)
+        def counting_process_executor_events(job_runner, executor, session):
+            num_events = len(executor.event_buffer)
+            self._processing_events = True
+            start = time.perf_counter()
+            try:
+                return process_executor_events(job_runner, executor=executor, session=session)
+            finally:
+                self._processing_events = False
+                if num_events:
+                    self.events += num_events
+                    self.event_durations.append((time.perf_counter() - start) / num_events)
+
+        SchedulerJobRunner._process_executor_events = counting_process_executor_events  # type: ignore[method-assign]
+
+    def watch(self) -> None:
+        """Stop the scheduler once every DAG run is done, checking from the executor's sync."""
+        deadline = time.monotonic() + self.timeout
+        last_check = 0.0
+        sync = self.executor.sync
+
+        @functools.wraps(sync)
+        def watching_sync():
+            nonlocal last_check
+            sync()
+            if time.monotonic() - last_check < 1:
+                return
+            last_check = time.monotonic()
+            self._checking = True
+            try:
+                done = count_finished_runs(self.dag_ids) >= self.expected_runs
+            finally:
+                self._checking = False
+            if not done and time.monotonic() > deadline:
+                self.timed_out = done = True
+            if done:
+                self.job_runner.num_runs = 1
+
+        self.executor.sync = watching_sync  # type: ignore[method-assign]
+
+    def run(self) -> float:
+        from airflow.jobs.job import Job, run_job
+        from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+
+        self.watch()
+        job = Job(executor=self.executor)
+        self.job_runner = SchedulerJobRunner(job=job, num_runs=-1)
+        self.count_queries()
+        start = time.perf_counter()
+        run_job(job=job, execute_callable=self.job_runner._execute)
+        return time.perf_counter() - start
+
+
+def collect_results(benchmark: Benchmark, elapsed: float, options: dict) -> dict:
+    from sqlalchemy import select
+
+    from airflow import settings
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.session import create_session
+
+    with create_session() as session:
+        rows = session.execute(
+            select(
+                TaskInstance.dag_id,
+                TaskInstance.task_id,
+                TaskInstance.run_id,
+                TaskInstance.map_index,
+                TaskInstance.try_number,
+                TaskInstance.state,
+                TaskInstance.scheduled_dttm,
+                TaskInstance.queued_dttm,
+                TaskInstance.start_date,
+            ).where(TaskInstance.dag_id.in_(benchmark.dag_ids))
+        ).all()
+
+    submitted_at = {
+        (key.dag_id, key.task_id, key.run_id, key.map_index, key.try_number): at
+        for key, at in benchmark.executor.submitted_at.items()
+    }
+    time_to_queue, time_to_submit, time_to_running = [], [], []
+    queued = finished = 0
+    for (
+        dag_id,
+        task_id,
+        run_id,
+        map_index,
+        try_number,
+        state,
+        scheduled_dttm,
+        queued_dttm,
+        start_date,
+    ) in rows:
+        if state in (TaskInstanceState.SUCCESS, TaskInstanceState.FAILED):
+            finished += 1
+        if not queued_dttm:
+            continue
+        queued += 1
+        if scheduled_dttm:
+            time_to_queue.append((queued_dttm - scheduled_dttm).total_seconds())
+        if (at := submitted_at.get((dag_id, task_id, run_id, map_index, try_number))) is not None:
+            time_to_submit.append(at - queued_dttm.timestamp())
+        if start_date and state != TaskInstanceState.QUEUED:
+            time_to_running.append((start_date - queued_dttm).total_seconds())
+
+    return {
+        **options,
+        "database": settings.engine.dialect.name,
+        "task_instances": len(rows),
+        "elapsed_s": elapsed,
+        "timed_out": benchmark.timed_out,
+        "queued_per_s": queued / elapsed if elapsed else 0.0,
+        "finished_per_s": finished / elapsed if elapsed else 0.0,
+        "time_to_queue": percentiles(time_to_queue),
+        "time_to_submit": percentiles(time_to_submit),
+        "time_to_running": percentiles(time_to_running),
+        "executor_heartbeat": percentiles(benchmark.executor.heartbeat_durations),
+        "executor_event": percentiles(benchmark.event_durations),
+        "executor_events": benchmark.events,
+        "queries_per_ti": benchmark.queries / finished if finished else 0.0,
+        "queries_per_event": benchmark.event_queries / benchmark.events if benchmark.events else 0.0,
+    }
+
+
+def print_report(results: dict, console: Console) -> None:
+    print_table(
+        console,
+        (
+            f"Scheduler benchmark: {results['dags']} DAGs x {results['runs']} runs, "
+            f"{results['task_instances']} task instances (times in ms)"
+        ),
+        ("Measure", "p50", "p95", "p99", "max"),
+        (
+            [label, *(f"{results[measure][p]:.1f}" for p in ("p50_ms", "p95_ms", "p99_ms", "max_ms"))]
+            for measure, label in (
+                ("time_to_queue", "Scheduled to queued"),
+                ("time_to_submit", "Queued to submitted"),
+                ("time_to_running", "Queued to running"),
+                ("executor_heartbeat", "Executor heartbeat"),
+                ("executor_event", "Executor event processing"),
+            )
+        ),
+    )
+    console.print(
+        f"Task instances per second: {results['queued_per_s']:.1f} queued, "
+        f"{results['finished_per_s']:.1f} finished, in {results['elapsed_s']:.1f}s"
+    )
+    console.print(
+        f"SQL queries: {results['queries_per_ti']:.2f} per task instance, "
+        f"{results['queries_per_event']:.2f} per executor event ({results['executor_events']} events)"
+    )
+    if results["timed_out"]:
+        console.print("[red]Timed out before every DAG run was done[/]")
+
+
+@click.command()
+@click.option("--dags", default=1000, help="Number of DAGs")
+@click.option("--tasks", default=10, help="Number of tasks in each DAG")
+@click.option("--shape", type=click.Choice(SHAPES), default="no_structure", help="Shape of the DAGs")
+@click.option("--runs", default=1, help="Number of runs of each DAG")
+@click.option("--parallelism", default=512, help="Number of tasks the executor can hold at once")
+@click.option("--submit-latency-ms", default=0.0, help="Milliseconds the executor takes to accept tasks")
+@click.option("--sync-latency-ms", default=0.0, help="Milliseconds each sync of the executor takes")
+@click.option("--start-delay-ms", default=0.0, help="Milliseconds from a task being accepted to running")
+@click.option("--task-duration-ms", default=0.0, help="Milliseconds each task runs for")
+@click.option("--failure-rate", default=0.0, help="Fraction of the tasks that fail")
+@click.option("--seed", type=int, help="Seed of the random task failures")
+@click.option("--timeout", default=3600.0, help="Seconds to wait for all DAG runs to be done")
+@benchmark_options
+def main(
+    dags,
+    tasks,
+    shape,
+    runs,
+    parallelism,
+    submit_latency_ms,
+    sync_latency_ms,
+    start_delay_ms,
+    task_duration_ms,
+    failure_rate,
+    seed,
+    timeout,
+    verbose,
+    reset_db,
+    output,
+):
+    """
+    Measure how fast the scheduler gets tasks through an executor, and what it costs in SQL queries.
+
+    Example:
+
+        AIRFLOW__DATABASE__SQL_ALCHEMY_CONN=postgresql+psycopg2://... \\
+            python dev/airflow_perf/scheduler_benchmark.py --dags 2000 --tasks 10 --shape linear \\
+            --sync-latency-ms 50 --task-duration-ms 1000 --failure-rate 0.01
+    """
+    prepare(verbose=verbose, reset_db=reset_db)
+    if seed is not None:
+        random.seed(seed)
+
+    console = Console()
+    console.print(f"Creating {dags} DAGs with {tasks} tasks")
+    dag_ids = create_dags(dags, tasks, shape, runs)
+
+    executor = SimulatedExecutor(
+        parallelism,
+        submit_latency=submit_latency_ms / 1000,
+        sync_latency=sync_latency_ms / 1000,
+        start_delay=start_delay_ms / 1000,
+        task_duration=task_duration_ms / 1000,
+        failure_rate=failure_rate,
+    )
+    console.print(f"Running scheduler until {len(dag_ids) * runs} DAG runs are done")
+    benchmark = Benchmark(executor, dag_ids, num_runs=runs, timeout=timeout)
+    elapsed = benchmark.run()
+
+    options = {
+        "dags": len(dag_ids),
+        "tasks": tasks,
+        "shape": shape,
+        "runs": runs,
+        "parallelism": parallelism,
+        "submit_latency_ms": submit_latency_ms,
+        "sync_latency_ms": sync_latency_ms,
+        "start_delay_ms": start_delay_ms,
+        "task_duration_ms": task_duration_ms,
+        "failure_rate": failure_rate,
+    }
+    results = collect_results(benchmark, elapsed, options)
+    print_report(results, console)
+    save_results(results, output, console)
+
+    if results["timed_out"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Capacity and latency benchmark for the triggerer.
+
+This script starts a triggerer (the same supervisor and trigger runner process(es) ``airflow triggerer`` runs)
+against the configured metadata DB (``AIRFLOW__DATABASE__SQL_ALCHEMY_CONN`` - SQLite works for a quick check,
+but use Postgres or MySQL for numbers that mean anything), then defers the requested number of task instances
+on synthetic triggers of three kinds:
+
+* sleepers, which wait in a single ``asyncio.sleep`` until they fire, at random over ``--duration``;
+* pollers, which wake up every ``--poll-interval`` seconds and hold the event loop for ``--poll-busy-ms`` each
+  time, like a trigger using a blocking client would, until they fire at random over ``--duration``;
+* a burst, which all fire at the same moment at the end of ``--duration``.
+
+Once every task instance has been resumed it reports, for each kind of trigger:
+
+* the latency from the trigger firing its event to its task instance being scheduled again;
+* the loop lag, i.e. how much later than they asked for the triggers' sleeps ended, which is how long they
+  waited for the event loop;
+
+and overall the memory used per trigger (the growth of the RSS of the trigger runner process(es) once the
+triggers are running, divided by their number) and the number of SQL queries the triggerer made per event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+import psutil
+import rich_click as click
+from benchmark_utils import (
+    benchmark_options,
+    count_queries,
+    create_dag,
+    percentiles,
+    prepare,
+    print_table,
+    save_results,
+)
+from rich.console import Console
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+BUNDLE_NAME = "triggerer_benchmark"
+DAG_ID = "triggerer_benchmark"
+
+KINDS = ("sleeper", "poller", "burst")
+
+
+class BenchmarkTrigger(BaseTrigger):
+    """
+    Synthetic trigger that fires at ``fire_at`` (a timestamp), waking up every ``interval`` seconds until then.
+
+    The trigger runner process is forked from this script, so it can import this class from ``__main__``.
+    """
+
+    def __init__(self, kind: str, fire_at: float, interval: float | None = None, busy: float = 0.0):
+        super().__init__()
+        self.kind = kind
+        self.fire_at = fire_at
+        self.interval = interval
+        self.busy = busy
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            {"kind": self.kind, "fire_at": self.fire_at, "interval": self.interval, "busy": self.busy},
+        )
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        lags = []
+        while (remaining := self.fire_at - time.time()) > 0:
+            delay = min(self.interval, remaining) if self.interval else remaining
+            wake_at = time.monotonic() + delay
+            await asyncio.sleep(delay)
+            lags.append(time.monotonic() - wake_at)
+            if self.busy:
+                # Hold the event loop, as a trigger calling a blocking client would
+                busy_until = time.perf_counter() + self.busy
+                while time.perf_counter() < busy_until:
+                    pass
+        yield TriggerEvent({"kind": self.kind, "fired_at": time.time(), "lags": lags})
+
+
+def defer_tasks(triggers: list[BenchmarkTrigger], tasks_per_run: int) -> None:
+    """Create task instances deferred on the given triggers."""
+    from airflow._shared.timezones import timezone
+    from airflow.models.dagbag import DBDagBag
+    from airflow.models.trigger import Trigger
+    from airflow.utils.session import create_session
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    with create_session() as session:
+        dag = DBDagBag().get_latest_version_of_dag(DAG_ID, session=session)
+        if dag is None:
+            sys.exit(f"DAG {DAG_ID} was not written to the DB")
+
+        now = timezone.utcnow()
+        tis = []
+        for run_no in range(-(-len(triggers) // tasks_per_run)):
+            dag_run = dag.create_dagrun(
+                run_id=f"benchmark__{run_no}",
+                run_after=now,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                start_date=now,
+                session=session,
+            )
+            tis.extend(dag_run.task_instances)
+
+        trigger_rows = [Trigger.from_object(trigger) for trigger in triggers]
+        session.add_all(trigger_rows)
+        session.flush()
+        for ti, trigger_row in zip(tis, trigger_rows):
+            ti.state = TaskInstanceState.DEFERRED
+            ti.trigger_id = trigger_row.id
+            ti.next_method = "execute"
+
+
+def count_deferred() -> int:
+    from sqlalchemy import func, select
+
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.session import create_session
+    from airflow.utils.state import TaskInstanceState
+
+    with create_session() as session:
+        return session.scalar(
+            select(func.count()).where(
+                TaskInstance.dag_id == DAG_ID, TaskInstance.state == TaskInstanceState.DEFERRED
+            )
+        )
+
+
+class Benchmark:
+    """
+    Drive a triggerer through one benchmark run, from a thread next to its supervisor loop.
+    """
+
+    def __init__(self, triggers: list[BenchmarkTrigger], *, tasks_per_run: int, timeout: float):
+        self.triggers = triggers
+        self.tasks_per_run = tasks_per_run
+        self.timeout = timeout
+        self.supervisor = None
+        self.baseline_rss = 0
+        self.peak_rss = 0
+        self.timed_out = False
+        self.queries = 0
+        self.submit_queries = 0
+        self.submitted_events = 0
+        self._submitting = False
+
+    def count_queries(self) -> None:
+        """Count the SQL statements the triggerer executes, and those made while submitting events."""
+        from airflow.jobs.triggerer_job_runner import TriggerRunnerSupervisor
+
+        def on_query():
+            if threading.current_thread() is threading.main_thread():
+                self.queries += 1
+                if self._submitting:
+                    self.submit_queries += 1
+
+        count_queries(on_query)
+
+        handle_events = TriggerRunnerSupervisor.handle_events
+
+        @functools.wraps(handle_events)
+        def counting_handle_events(supervisor):
+            self._submitting = True
+            self.submitted_events += len(supervisor.events)
+            try:
+                return handle_events(supervisor)
+            finally:
+                self._submitting = False
+
+        TriggerRunnerSupervisor.handle_events = counting_handle_events  # type: ignore[method-assign]
+
+    def runner_rss(self) -> int:
+        runners = getattr(self.supervisor, "runners", [self.supervisor])
+        rss = 0
+        for runner in runners:
+            try:
+                rss += psutil.Process(runner.pid).memory_info().rss
+            except psutil.Error:
+                pass
+        return rss
+
+    def execute(self, runner_processes: int, capacity: int, job) -> int | None:
+        """Run the triggerer in this thread, and the benchmark itself in another one."""
+        from airflow.jobs.triggerer_job_runner import ShardedTriggerRunnerSupervisor, TriggerRunnerSupervisor
+
+        if runner_processes > 1:
+            self.supervisor = ShardedTriggerRunnerSupervisor.start(
+                job=job, capacity=capacity, num_runners=runner_processes
+            )
+        else:
+            self.supervisor = TriggerRunnerSupervisor.start(job=job, capacity=capacity)
+        self.count_queries()
+        driver = threading.Thread(target=self.drive, name="benchmark")
+        driver.start()
+        try:
+            self.supervisor.run()
+        finally:
+            self.supervisor.stop = True
+            driver.join()
+            self.supervisor.kill(escalation_delay=10, force=True)
+        return None
+
+    def drive(self) -> None:
+        try:
+            # Let the trigger runner(s) settle before measuring how much memory they use without triggers
+            time.sleep(3)
+            self.baseline_rss = self.peak_rss = self.runner_rss()
+            defer_tasks(self.triggers, self.tasks_per_run)
+
+            deadline = time.monotonic() + self.timeout
+            last_check = 0.0
+            while not self.supervisor.stop:
+                self.peak_rss = max(self.peak_rss, self.runner_rss())
+                if time.monotonic() - last_check >= 1:
+                    if not count_deferred():
+                        break
+                    last_check = time.monotonic()
+                if time.monotonic() > deadline:
+                    self.timed_out = True
+                    break
+                time.sleep(0.2)
+        finally:
+            self.supervisor.stop = True
+
+
+def collect_results(benchmark: Benchmark, elapsed: float) -> dict:
+    from sqlalchemy import select
+
+    from airflow import settings
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.session import create_session
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    lags: dict[str, list[float]] = defaultdict(list)
+    counts: dict[str, int] = defaultdict(int)
+    with create_session() as session:
+        rows = session.execute(
+            select(TaskInstance.scheduled_dttm, TaskInstance.next_kwargs).where(
+                TaskInstance.dag_id == DAG_ID, TaskInstance.trigger_id.is_(None)
+            )
+        ).all()
+    for scheduled_dttm, next_kwargs in rows:
+        if not next_kwargs or not isinstance(event := next_kwargs.get("event"), dict):
+            continue
+        kind = event["kind"]
+        counts[kind] += 1
+        latencies[kind].append(scheduled_dttm.timestamp() - event["fired_at"])
+        lags[kind].extend(event["lags"])
+
+    num_triggers = len(benchmark.triggers)
+    events = sum(counts.values())
+    return {
+        "triggers": num_triggers,
+        "database": settings.engine.dialect.name,
+        "elapsed_s": elapsed,
+        "timed_out": benchmark.timed_out,
+        "kinds": {
+            kind: {
+                "triggers": sum(1 for trigger in benchmark.triggers if trigger.kind == kind),
+                "events": counts[kind],
+                "latency": percentiles(latencies[kind]),
+                "loop_lag": percentiles(lags[kind]),
+            }
+            for kind in KINDS
+            if any(trigger.kind == kind for trigger in benchmark.triggers)
+        },
+        "memory_per_trigger_kib": (benchmark.peak_rss - benchmark.baseline_rss) / num_triggers / 1024,
+        "queries_per_event": benchmark.submit_queries / benchmark.submitted_events
+        if benchmark.submitted_events
+        else 0.0,
+        "total_queries_per_event": benchmark.queries / events if events else 0.0,
+    }
+
+
+def print_report(results: dict, console: Console) -> None:
+    columns = ["Kind", "Triggers", "Events"]
+    for measure in ("Latency", "Lag"):
+        columns += [f"{measure} p50", f"{measure} p99", f"{measure} max"]
+    rows = []
+    for kind, kind_results in results["kinds"].items():
+        row = [kind, str(kind_results["triggers"]), str(kind_results["events"])]
+        for measure in ("latency", "loop_lag"):
+            row += [f"{kind_results[measure][p]:.1f}" for p in ("p50_ms", "p99_ms", "max_ms")]
+        rows.append(row)
+    print_table(console, f"Triggerer benchmark: {results['triggers']} triggers (times in ms)", columns, rows)
+    console.print(f"Memory per trigger: {results['memory_per_trigger_kib']:.1f} KiB")
+    console.print(
+        f"SQL queries per event: {results['queries_per_event']:.2f} to submit it, "
+        f"{results['total_queries_per_event']:.2f} in total"
+    )
+    if results["timed_out"]:
+        console.print("[red]Timed out before every trigger fired[/]")
+
+
+@click.command()
+@click.option("--sleepers", default=1000, help="Number of triggers sleeping until they fire")
+@click.option("--pollers", default=1000, help="Number of triggers polling until they fire")
+@click.option("--burst", default=1000, help="Number of triggers all firing at the same moment")
+@click.option("--duration", default=60.0, help="Seconds over which the triggers fire")
+@click.option("--poll-interval", default=1.0, help="Seconds between the wakeups of a poller")
+@click.option(
+    "--poll-busy-ms", default=1.0, help="Milliseconds a poller holds the event loop when it wakes up"
+)
+@click.option("--capacity", default=100_000, help="Capacity of the triggerer")
+@click.option("--runner-processes", default=1, help="Number of trigger runner processes")
+@click.option("--tasks-per-run", default=100, help="Number of tasks in each seeded DagRun")
+@click.option("--timeout", default=600.0, help="Seconds to wait for all triggers to fire")
+@benchmark_options
+def main(
+    sleepers,
+    pollers,
+    burst,
+    duration,
+    poll_interval,
+    poll_busy_ms,
+    capacity,
+    runner_processes,
+    tasks_per_run,
+    timeout,
+    verbose,
+    reset_db,
+    output,
+):
+    """
+    Measure how many triggers a triggerer can hold, and how fast their events resume tasks.
+
+    Example:
+
+        AIRFLOW__DATABASE__SQL_ALCHEMY_CONN=postgresql+psycopg2://... \\
+            python dev/airflow_perf/triggerer_benchmark.py --sleepers 20000 --pollers 0 --burst 5000
+    """
+    prepare(verbose=verbose, reset_db=reset_db)
+
+    from airflow.jobs.job import Job, run_job
+    from airflow.jobs.triggerer_job_runner import TriggererJobRunner
+
+    console = Console()
+    start = time.time()
+    triggers = [
+        BenchmarkTrigger("sleeper", start + duration * random.uniform(0.5, 1)) for _ in range(sleepers)
+    ]
+    triggers += [
+        BenchmarkTrigger(
+            "poller",
+            start + duration * random.uniform(0.5, 1),
+            interval=poll_interval,
+            busy=poll_busy_ms / 1000,
+        )
+        for _ in range(pollers)
+    ]
+    triggers += [BenchmarkTrigger("burst", start + duration) for _ in range(burst)]
+    if not triggers:
+        sys.exit("Nothing to benchmark")
+
+    console.print(f"Creating DAG with {min(tasks_per_run, len(triggers))} tasks")
+    create_dag(DAG_ID, min(tasks_per_run, len(triggers)), BUNDLE_NAME)
+
+    console.print(f"Running triggerer with {len(triggers)} triggers")
+    benchmark = Benchmark(triggers, tasks_per_run=tasks_per_run, timeout=timeout)
+    job = Job()
+    job_runner = TriggererJobRunner(job=job, capacity=capacity)
+    run_job(
+        job=job,
+        execute_callable=functools.partial(benchmark.execute, runner_processes, job_runner.capacity, job),
+    )
+    results = collect_results(benchmark, time.time() - start)
+    print_report(results, console)
+    save_results(results, output, console)
+
+    if results["timed_out"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -241,7 +241,7 @@ for dag_no in range(1, DAG_COUNT + 1):
             )
         ),
         default_args=args,
-        schedule_interval=SCHEDULE_INTERVAL,
+        schedule=SCHEDULE_INTERVAL,
         is_paused_upon_creation=START_PAUSED,
         catchup=True,
     )
@@ -30,7 +30,8 @@ import math
 import operator
 import time
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from multiprocessing import cpu_count
 from typing import TYPE_CHECKING, Any
 
@@ -72,7 +73,11 @@ if TYPE_CHECKING:
     from airflow.executors import workloads
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
-    from airflow.providers.celery.executors.celery_executor_utils import TaskInstanceInCelery, TaskTuple
+    from airflow.providers.celery.executors.celery_executor_utils import (
+        CeleryTaskEventReceiver,
+        TaskInstanceInCelery,
+        TaskTuple,
+    )
 
 
 # PEP562
@@ -302,12 +307,32 @@ class CeleryExecutor(BaseExecutor):
         from airflow.providers.celery.executors.celery_executor_utils import BulkStateFetcher
 
         self.bulk_state_fetcher = BulkStateFetcher(self._sync_parallelism)
+        # When task events are enabled, task state is tracked from the events sent by the workers, and the
+        # result backend is only polled, every reconciliation interval, for tasks without a recent event.
+        self.task_event_receiver: CeleryTaskEventReceiver | None = None
+        self._task_events = conf.getboolean("celery", "task_events", fallback=False)
+        self._task_events_reconciliation_interval = conf.getfloat(
+            "celery", "task_events_reconciliation_interval", fallback=300.0
+        )
+        # Reconcile on the first sync, for the tasks adopted from another scheduler
+        self._last_reconciliation = -math.inf
+        # Pool of processes sending tasks to Celery, kept for the lifetime of the executor so that they
+        # don't have to be started, and to connect to the broker, on every heartbeat.
+        self._send_pool: ProcessPoolExecutor | None = None
         self.tasks = {}
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint("celery", "task_publish_max_retries")
 
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        if self._task_events:
+            from airflow.providers.celery.executors.celery_executor_utils import (
+                CeleryTaskEventReceiver,
+                app,
+            )
+
+            self.task_event_receiver = CeleryTaskEventReceiver(app)
+            self.task_event_receiver.start()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -382,8 +407,26 @@ class CeleryExecutor(BaseExecutor):
                 # which point we don't need the ID anymore anyway
                 self.event_buffer[key] = (TaskInstanceState.QUEUED, result.task_id)
 
+    def _get_send_pool(self) -> ProcessPoolExecutor:
+        from airflow.providers.celery.executors.celery_executor_utils import init_send_task_process
+
+        if self._send_pool is None:
+            self._send_pool = ProcessPoolExecutor(
+                max_workers=self._sync_parallelism, initializer=init_send_task_process
+            )
+        return self._send_pool
+
+    def _shutdown_send_pool(self) -> None:
+        if self._send_pool is not None:
+            self._send_pool.shutdown(wait=True, cancel_futures=True)
+            self._send_pool = None
+
     def _send_tasks_to_celery(self, task_tuples_to_send: Sequence[TaskInstanceInCelery]):
-        from airflow.providers.celery.executors.celery_executor_utils import send_task_to_executor
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            ExceptionWithTraceback,
+            send_task_to_executor,
+            send_tasks_to_executor,
+        )
 
         if len(task_tuples_to_send) == 1 or self._sync_parallelism == 1:
             # One tuple, or max one process -> send it in the main thread.
@@ -392,13 +435,43 @@ class CeleryExecutor(BaseExecutor):
         # Use chunks instead of a work queue to reduce context switching
         # since tasks are roughly uniform in size
         chunksize = self._num_tasks_per_send_process(len(task_tuples_to_send))
-        num_processes = min(len(task_tuples_to_send), self._sync_parallelism)
-
-        with ProcessPoolExecutor(max_workers=num_processes) as send_pool:
-            key_and_async_results = list(
-                send_pool.map(send_task_to_executor, task_tuples_to_send, chunksize=chunksize)
-            )
-        return key_and_async_results
+        chunks = [
+            task_tuples_to_send[i : i + chunksize] for i in range(0, len(task_tuples_to_send), chunksize)
+        ]
+        pool = self._get_send_pool()
+        futures: list[Future | None] = []
+        for chunk in chunks:
+            try:
+                futures.append(pool.submit(send_tasks_to_executor, chunk))
+            except BrokenProcessPool:
+                futures.append(None)
+
+        results = []
+        pool_broken = False
+        for chunk, future in zip(chunks, futures):
+            if future is None:
+                # The pool was already broken, nothing of this chunk was sent
+                pool_broken = True
+                results.extend(map(send_task_to_executor, chunk))
+                continue
+            try:
+                results.extend(future.result())
+            except BrokenProcessPool as e:
+                # A process of the pool died (e.g. it was OOM killed) before reporting whether it sent the
+                # tasks of this chunk. It may have sent some of them, and sending them again could run them
+                # twice, so fail them back to the scheduler instead.
+                pool_broken = True
+                self.log.warning(
+                    "The pool sending tasks to Celery broke while sending %s tasks, failing them", len(chunk)
+                )
+                results.extend(
+                    (key, args, ExceptionWithTraceback(e, f"Celery Task ID: {key}\n{e!r}"))
+                    for key, args, _, _ in chunk
+                )
+        if pool_broken:
+            # Start a new pool on the next heartbeat
+            self._shutdown_send_pool()
+        return results
 
     def sync(self) -> None:
         if not self.tasks:
@@ -415,20 +488,50 @@ class CeleryExecutor(BaseExecutor):
 
     def update_all_task_states(self) -> None:
         """Update states of the tasks."""
-        self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
-        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+        if self.task_event_receiver:
+            state_and_info_by_celery_task_id = self._get_task_states_from_events()
+        else:
+            self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
+            state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+            self.log.debug("Inquiries completed.")
 
-        self.log.debug("Inquiries completed.")
         for key, async_result in list(self.tasks.items()):
-            state, info = state_and_info_by_celery_task_id.get(async_result.task_id)
+            state, info = state_and_info_by_celery_task_id.get(async_result.task_id, (None, None))
             if state:
                 self.update_task_state(key, state, info)
 
+    def _get_task_states_from_events(self) -> dict[str, tuple[str, Any]]:
+        """Get the state of the tasks from their events, and poll the ones without a recent event."""
+        if TYPE_CHECKING:
+            assert self.task_event_receiver
+
+        now = time.monotonic()
+        reconcile = now - self._last_reconciliation >= self._task_events_reconciliation_interval
+        if reconcile:
+            self._last_reconciliation = now
+            self.task_event_receiver.prune(max_age=self._task_events_reconciliation_interval)
+
+        state_and_info_by_celery_task_id = self.task_event_receiver.get_states(
+            async_result.task_id for async_result in self.tasks.values()
+        )
+        if reconcile:
+            without_events = [
+                async_result
+                for async_result in self.tasks.values()
+                if async_result.task_id not in state_and_info_by_celery_task_id
+            ]
+            if without_events:
+                self.log.debug("Inquiring about %s celery task(s) without recent events", len(without_events))
+                state_and_info_by_celery_task_id.update(self.bulk_state_fetcher.get_many(without_events))
+        return state_and_info_by_celery_task_id
+
     def change_state(
         self, key: TaskInstanceKey, state: TaskInstanceState, info=None, remove_running=True
     ) -> None:
         super().change_state(key, state, info, remove_running=remove_running)
-        self.tasks.pop(key, None)
+        async_result = self.tasks.pop(key, None)
+        if async_result is not None and self.task_event_receiver:
+            self.task_event_receiver.forget(async_result.task_id)
 
     def update_task_state(self, key: TaskInstanceKey, state: str, info: Any) -> None:
         """Update state of a single task."""
@@ -449,9 +552,17 @@ class CeleryExecutor(BaseExecutor):
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
         self.sync()
+        self._shutdown_send_pool()
+        self._stop_task_event_receiver()
 
     def terminate(self):
-        pass
+        self._shutdown_send_pool()
+        self._stop_task_event_receiver()
+
+    def _stop_task_event_receiver(self) -> None:
+        if self.task_event_receiver:
+            self.task_event_receiver.stop()
+            self.task_event_receiver = None
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
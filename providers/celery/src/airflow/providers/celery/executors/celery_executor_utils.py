@@ -26,11 +26,14 @@ import contextlib
 import logging
 import math
 import os
+import signal
 import subprocess
 import sys
+import threading
+import time
 import traceback
 import warnings
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
@@ -265,6 +268,18 @@ class ExceptionWithTraceback:
         self.traceback = exception_traceback
 
 
+def init_send_task_process() -> None:
+    """
+    Initialize a process of the pool sending tasks to Celery.
+
+    These processes live as long as the executor, so they drop the signal handlers inherited from the
+    scheduler (which ignore signals in child processes) and leave the handling of SIGINT to the scheduler.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGUSR2, signal.SIG_IGN)
+
+
 def send_task_to_executor(
     task_tuple: TaskInstanceInCelery,
 ) -> tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]:
@@ -289,6 +304,13 @@ def send_task_to_executor(
     return key, args, result
 
 
+def send_tasks_to_executor(
+    task_tuples: Sequence[TaskInstanceInCelery],
+) -> list[tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]]:
+    """Send a chunk of tasks to executor, from a process of the pool sending them."""
+    return [send_task_to_executor(task_tuple) for task_tuple in task_tuples]
+
+
 def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | ExceptionWithTraceback, Any]:
     """
     Fetch and return the state of the given celery task.
@@ -400,3 +422,91 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class CeleryTaskEventReceiver(LoggingMixin):
+    """
+    Track the state of Celery tasks from the task events sent by the Celery workers.
+
+    The events are consumed from the broker by a background thread, and the latest state of each task is kept
+    in memory, so that the executor doesn't have to query the result backend for every running task.
+    Workers only send these events when ``worker_send_task_events`` is set in their Celery config.
+
+    :param celery_app: The Celery app to receive the events of.
+    """
+
+    EVENT_STATES = {
+        "task-started": celery_states.STARTED,
+        "task-retried": celery_states.RETRY,
+        "task-succeeded": celery_states.SUCCESS,
+        "task-failed": celery_states.FAILURE,
+        "task-revoked": celery_states.REVOKED,
+    }
+
+    def __init__(self, celery_app: Celery):
+        super().__init__()
+        self.celery_app = celery_app
+        # Celery task id -> (state, info, monotonic time of the event)
+        self._states: dict[str, tuple[str, Any, float]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._receiver = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._receive_events, name="celery-task-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _receive_events(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                with self.celery_app.connection_for_read() as connection:
+                    self._receiver = self.celery_app.events.Receiver(
+                        connection, handlers=dict.fromkeys(self.EVENT_STATES, self.on_event)
+                    )
+                    if self._stopped.is_set():
+                        return
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Error receiving Celery task events, reconnecting")
+                self._stopped.wait(5)
+
+    def on_event(self, event: dict[str, Any]) -> None:
+        state = self.EVENT_STATES[event["type"]]
+        info = event.get("exception") if state == celery_states.FAILURE else None
+        with self._lock:
+            previous = self._states.get(event["uuid"])
+            # Events can be received out of order, don't let a late event override the final state of a task
+            if (
+                previous
+                and previous[0] in celery_states.READY_STATES
+                and state not in celery_states.READY_STATES
+            ):
+                return
+            self._states[event["uuid"]] = (state, info, time.monotonic())
+
+    def get_states(self, task_ids: Iterable[str]) -> dict[str, tuple[str, Any]]:
+        """Return the state and info of the tasks that an event was received for."""
+        with self._lock:
+            return {task_id: self._states[task_id][:2] for task_id in task_ids if task_id in self._states}
+
+    def forget(self, task_id: str) -> None:
+        """Stop tracking a task that the executor is done with."""
+        with self._lock:
+            self._states.pop(task_id, None)
+
+    def prune(self, max_age: float) -> None:
+        """Forget the state of the tasks that haven't had an event for ``max_age`` seconds."""
+        oldest = time.monotonic() - max_age
+        with self._lock:
+            self._states = {
+                task_id: state_info for task_id, state_info in self._states.items() if state_info[2] >= oldest
+            }
@@ -154,6 +154,20 @@ def get_provider_info():
                         "example": None,
                         "default": "0",
                     },
+                    "task_events": {
+                        "description": "Track the state of the Celery tasks from the task events sent by the workers, instead of\nquerying the result backend for every running task on each executor sync. The result backend\nis then only queried, every ``task_events_reconciliation_interval`` seconds, for the tasks\nthat haven't had an event in that interval. This also makes the workers send task events.\n",
+                        "version_added": "3.13.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "task_events_reconciliation_interval": {
+                        "description": "How often (in seconds) CeleryExecutor queries the result backend for the state of the tasks\nwithout a recent task event, when ``task_events`` is enabled.\n",
+                        "version_added": "3.13.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "300.0",
+                    },
                     "celery_config_options": {
                         "description": "Import path for celery configuration options\n",
                         "version_added": None,
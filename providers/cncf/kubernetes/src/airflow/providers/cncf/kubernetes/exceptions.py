@@ -27,3 +27,7 @@ class PodMutationHookException(AirflowException):
 
 class PodReconciliationError(AirflowException):
     """Raised when an error is encountered while trying to merge pod configs."""
+
+
+class PodCreationRateLimited(AirflowException):
+    """Raised when a pod cannot be created yet, because of the pod creation rate limit of its namespace."""
@@ -31,6 +31,7 @@ import multiprocessing
 import time
 from collections import Counter, defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime
 from queue import Empty, Queue
@@ -62,9 +63,14 @@ from airflow.cli.cli_config import (
 from airflow.configuration import conf
 from airflow.exceptions import AirflowProviderDeprecationWarning
 from airflow.executors.base_executor import BaseExecutor
-from airflow.providers.cncf.kubernetes.exceptions import PodMutationHookException, PodReconciliationError
+from airflow.providers.cncf.kubernetes.exceptions import (
+    PodCreationRateLimited,
+    PodMutationHookException,
+    PodReconciliationError,
+)
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
+    ALL_NAMESPACES,
     POD_EXECUTOR_DONE_KEY,
 )
 from airflow.providers.cncf.kubernetes.kube_config import KubeConfig
@@ -91,6 +97,7 @@ if TYPE_CHECKING:
     )
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
+        KubernetesPodInformer,
     )
 
 
@@ -167,24 +174,37 @@ class KubernetesExecutor(BaseExecutor):
         self.task_publish_max_retries = conf.getint(
             "kubernetes_executor", "task_publish_max_retries", fallback=0
         )
+        self.pod_informers: list[KubernetesPodInformer] = []
+        self._pod_creation_pool: ThreadPoolExecutor | None = None
         super().__init__(parallelism=self.kube_config.parallelism)
 
+    def _get_namespaces(self) -> list[str | None]:
+        """Return the namespaces of the worker pods, None meaning all namespaces."""
+        if self.kube_config.multi_namespace_mode:
+            if self.kube_config.multi_namespace_mode_namespace_list:
+                return self.kube_config.multi_namespace_mode_namespace_list
+            return [None]
+        return [self.kube_config.kube_namespace]
+
     def _list_pods(self, query_kwargs):
+        if self.pod_informers and all(informer.synced for informer in self.pod_informers):
+            return [
+                pod
+                for informer in self.pod_informers
+                for pod in informer.list_pods(
+                    label_selector=query_kwargs.get("label_selector"),
+                    field_selector=query_kwargs.get("field_selector"),
+                )
+            ]
+
         query_kwargs["header_params"] = {
             "Accept": "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io"
         }
         dynamic_client = DynamicClient(self.kube_client.api_client)
         pod_resource = dynamic_client.resources.get(api_version="v1", kind="Pod")
-        if self.kube_config.multi_namespace_mode:
-            if self.kube_config.multi_namespace_mode_namespace_list:
-                namespaces = self.kube_config.multi_namespace_mode_namespace_list
-            else:
-                namespaces = [None]
-        else:
-            namespaces = [self.kube_config.kube_namespace]
 
         pods = []
-        for namespace in namespaces:
+        for namespace in self._get_namespaces():
             pods.extend(dynamic_client.get(resource=pod_resource, namespace=namespace, **query_kwargs).items)
 
         return pods
@@ -240,6 +260,7 @@ class KubernetesExecutor(BaseExecutor):
         self.log.debug("Start with scheduler_job_id: %s", self.scheduler_job_id)
         from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
             AirflowKubernetesScheduler,
+            KubernetesPodInformer,
         )
         from airflow.providers.cncf.kubernetes.kube_client import get_kube_client
 
@@ -250,6 +271,18 @@ class KubernetesExecutor(BaseExecutor):
             kube_client=self.kube_client,
             scheduler_job_id=self.scheduler_job_id,
         )
+        if self.kube_config.use_pod_informer:
+            # Pods are listed from the API server until the informers have listed them
+            self.pod_informers = [
+                KubernetesPodInformer(
+                    namespace=namespace or ALL_NAMESPACES,
+                    kube_client=self.kube_client,
+                    kube_config=self.kube_config,
+                )
+                for namespace in self._get_namespaces()
+            ]
+            for informer in self.pod_informers:
+                informer.start()
 
     def execute_async(
         self,
@@ -354,56 +387,97 @@ class KubernetesExecutor(BaseExecutor):
                 last_resource_version[ns] or resource_instance.resource_version[ns]
             )
 
-        from kubernetes.client.rest import ApiException
-
+        tasks: list[KubernetesJobType] = []
         with contextlib.suppress(Empty):
             for _ in range(self.kube_config.worker_pods_creation_batch_size):
-                task = self.task_queue.get_nowait()
+                tasks.append(self.task_queue.get_nowait())
 
-                try:
-                    key, command, kube_executor_config, pod_template_file = task
-                    self.kube_scheduler.run_next(task)
-                    self.task_publish_retries.pop(key, None)
-                except PodReconciliationError as e:
-                    self.log.exception(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-                    body = json.loads(e.body)
-                    retries = self.task_publish_retries[key]
-                    # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
-                    if (
-                        str(e.status) == "403"
-                        and "exceeded quota" in body["message"]
-                        and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
-                    ):
-                        self.log.warning(
-                            "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
-                            self.task_publish_retries[key] + 1,
-                            self.task_publish_max_retries,
-                            key,
-                            e.reason,
-                            body["message"],
-                        )
-                        self.task_queue.put(task)
-                        self.task_publish_retries[key] = retries + 1
-                    else:
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
-                        self.fail(key, e)
-                        self.task_publish_retries.pop(key, None)
-                except PodMutationHookException as e:
-                    key, _, _, _ = task
-                    self.log.error(
-                        "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
-                        key,
-                        e.__cause__,
-                    )
-                    self.fail(key, e)
-                finally:
-                    self.task_queue.task_done()
+        unexpected_error: Exception | None = None
+        for task, error in zip(tasks, self._create_pods(tasks)):
+            try:
+                if error is None:
+                    self.task_publish_retries.pop(task[0], None)
+                elif not self._handle_pod_creation_error(task, error):
+                    unexpected_error = unexpected_error or error
+            finally:
+                self.task_queue.task_done()
+        if unexpected_error:
+            raise unexpected_error
+
+    def _create_pods(self, tasks: list[KubernetesJobType]) -> list[Exception | None]:
+        """Create the pods of the tasks, concurrently if configured so, and return the error of each."""
+        if TYPE_CHECKING:
+            assert self.kube_scheduler
+
+        def create_pod(task: KubernetesJobType) -> Exception | None:
+            try:
+                self.kube_scheduler.run_next(task)
+            except Exception as e:
+                return e
+            return None
+
+        if len(tasks) <= 1 or self.kube_config.worker_pods_creation_concurrency <= 1:
+            return list(map(create_pod, tasks))
+        if self._pod_creation_pool is None:
+            self._pod_creation_pool = ThreadPoolExecutor(
+                max_workers=self.kube_config.worker_pods_creation_concurrency,
+                thread_name_prefix="kubernetes-pod-creation",
+            )
+        return list(self._pod_creation_pool.map(create_pod, tasks))
+
+    def _handle_pod_creation_error(self, task: KubernetesJobType, e: Exception) -> bool:
+        """Fail or re-queue a task whose pod could not be created, return False if the error is unexpected."""
+        from kubernetes.client.rest import ApiException
+
+        key, _, _, _ = task
+        if isinstance(e, PodReconciliationError):
+            self.log.error(
+                "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                "Try clearing the task to re-run.",
+                exc_info=e,
+            )
+            self.fail(key, e)
+        elif isinstance(e, PodCreationRateLimited):
+            # Left for the next scheduler loop, when the rate limit allows more pods to be created
+            self.log.debug("Pod creation for task %s is rate limited, re-queueing the task.", key)
+            self.task_queue.put(task)
+        elif isinstance(e, ApiException) and str(e.status) == "429":
+            # The API server is throttling pod creation, which is no reason to fail the task
+            self.log.warning("Pod creation for task %s was throttled, re-queueing the task.", key)
+            self.task_queue.put(task)
+        elif isinstance(e, ApiException):
+            body = json.loads(e.body)
+            retries = self.task_publish_retries[key]
+            # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
+            if (
+                str(e.status) == "403"
+                and "exceeded quota" in body["message"]
+                and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
+            ):
+                self.log.warning(
+                    "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
+                    self.task_publish_retries[key] + 1,
+                    self.task_publish_max_retries,
+                    key,
+                    e.reason,
+                    body["message"],
+                )
+                self.task_queue.put(task)
+                self.task_publish_retries[key] = retries + 1
+            else:
+                self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+                self.fail(key, e)
+                self.task_publish_retries.pop(key, None)
+        elif isinstance(e, PodMutationHookException):
+            self.log.error(
+                "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                key,
+                e.__cause__,
+            )
+            self.fail(key, e)
+        else:
+            return False
+        return True
 
     @provide_session
     def _change_state(
@@ -737,11 +811,20 @@ class KubernetesExecutor(BaseExecutor):
                 self.kube_scheduler.terminate()
             except Exception:
                 self.log.exception("Unknown error while flushing task queue and result queue.")
+        self._stop_pod_informers()
+        if self._pod_creation_pool:
+            self._pod_creation_pool.shutdown(wait=True)
+            self._pod_creation_pool = None
         self._manager.shutdown()
 
     def terminate(self):
         """Terminate the executor is not doing anything."""
 
+    def _stop_pod_informers(self) -> None:
+        for informer in self.pod_informers:
+            informer.stop()
+        self.pod_informers = []
+
     @staticmethod
     def get_cli_commands() -> list[GroupCommand]:
         return [
@@ -17,9 +17,13 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import json
 import multiprocessing
+import os
+import threading
 import time
+from collections import OrderedDict
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any
 
@@ -29,6 +33,7 @@ from urllib3.exceptions import ReadTimeoutError
 
 from airflow.exceptions import AirflowException
 from airflow.providers.cncf.kubernetes.backcompat import get_logical_date_key
+from airflow.providers.cncf.kubernetes.exceptions import PodCreationRateLimited, PodMutationHookException
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
     ALL_NAMESPACES,
@@ -42,6 +47,7 @@ from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import (
     create_unique_id,
 )
 from airflow.providers.cncf.kubernetes.pod_generator import PodGenerator, workload_to_command_args
+from airflow.stats import Stats
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.singleton import Singleton
 from airflow.utils.state import TaskInstanceState
@@ -302,6 +308,319 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             )
 
 
+def _matches_selector(values: dict[str, str | None], selector: str | None) -> bool:
+    """Check values against an equality-based Kubernetes selector, e.g. ``a=b,c!=d``."""
+    if not selector:
+        return True
+    for requirement in selector.split(","):
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if values.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.split("=", 1)
+            if values.get(key.strip()) != value.lstrip("=").strip():
+                return False
+        else:
+            raise ValueError(f"Only equality-based selectors are supported, got {requirement!r}")
+    return True
+
+
+class KubernetesPodInformer(threading.Thread, LoggingMixin):
+    """
+    Keep an in-memory cache of the Airflow worker pods of a namespace, up to date with a watch.
+
+    The pods are listed once, then kept up to date from the events of a watch started at the resource
+    version of the list (and of the bookmarks sent by the API server), so that the API server only has to
+    send the changes. The pods are listed again if that resource version is too old.
+
+    Unlike the ``KubernetesJobWatcher``, this runs as a thread of the scheduler, so that the cached pods can
+    be used by the executor, and it watches the worker pods of all schedulers, for adoption.
+
+    :param namespace: The namespace to watch, or ``ALL_NAMESPACES``.
+    :param kube_client: Client of the Kubernetes API.
+    :param kube_config: The Kubernetes executor config.
+    """
+
+    label_selector = "kubernetes_executor=True"
+
+    def __init__(self, namespace: str, kube_client: client.CoreV1Api, kube_config: Any):
+        super().__init__(name=f"kubernetes-pod-informer-{namespace}", daemon=True)
+        self.namespace = namespace
+        self.kube_client = kube_client
+        self.kube_config = kube_config
+        self.resource_version: str | None = None
+        # (namespace, name) -> pod, with only the metadata and phase of the pod
+        self._pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher: watch.Watch | None = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the pods have been listed, i.e. the cache can be used."""
+        return self._synced.is_set()
+
+    def list_pods(
+        self, label_selector: str | None = None, field_selector: str | None = None
+    ) -> list[k8s.V1Pod]:
+        """List the cached pods matching equality-based label and field selectors."""
+        with self._lock:
+            pods = list(self._pods.values())
+        return [
+            pod
+            for pod in pods
+            if _matches_selector(pod.metadata.labels or {}, label_selector)
+            and _matches_selector(
+                {
+                    "metadata.name": pod.metadata.name,
+                    "metadata.namespace": pod.metadata.namespace,
+                    "status.phase": pod.status.phase,
+                },
+                field_selector,
+            )
+        ]
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                self._watch()
+            except ReadTimeoutError:
+                self.log.debug(
+                    "Kubernetes pod informer watch timed out waiting for events. Restarting watch."
+                )
+            except ApiException as e:
+                if str(e.status) == "410":
+                    self.log.info("Kubernetes resource version is too old, listing the pods again.")
+                else:
+                    self.log.exception("Error watching the pods, listing them again.")
+                    self._stopped.wait(1)
+                self.resource_version = None
+            except Exception:
+                self.log.exception("Unknown error in the Kubernetes pod informer, listing the pods again.")
+                self.resource_version = None
+                self._stopped.wait(1)
+
+    def _list_function(self):
+        if self.namespace == ALL_NAMESPACES:
+            return self.kube_client.list_pod_for_all_namespaces, ()
+        return self.kube_client.list_namespaced_pod, (self.namespace,)
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"_request_timeout": 30, "timeout_seconds": 3600}
+        kwargs.update(self.kube_config.kube_client_request_args or {})
+        kwargs["label_selector"] = self.label_selector
+        return kwargs
+
+    def _list(self) -> None:
+        list_function, args = self._list_function()
+        kwargs = self._request_kwargs()
+        kwargs.pop("timeout_seconds")
+        pod_list = list_function(*args, **kwargs)
+        pods = {(pod.metadata.namespace, pod.metadata.name): self._trim(pod) for pod in pod_list.items}
+        with self._lock:
+            self._pods = pods
+        self.resource_version = pod_list.metadata.resource_version
+        self._synced.set()
+        self.log.info(
+            "Listed %d pods in %s at resource version %s", len(pods), self.namespace, self.resource_version
+        )
+
+    def _watch(self) -> None:
+        list_function, args = self._list_function()
+        self._watcher = watch.Watch()
+        for event in self._watcher.stream(
+            list_function,
+            *args,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            **self._request_kwargs(),
+        ):
+            if self._stopped.is_set():
+                return
+            self.process_event(event)
+
+    def process_event(self, event: dict[str, Any]) -> None:
+        """Apply a watch event to the cached pods."""
+        if event["type"] == "BOOKMARK":
+            # Bookmarks are not deserialized, and only carry a resource version
+            self.resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+            return
+        pod = event["object"]
+        pod_key = (pod.metadata.namespace, pod.metadata.name)
+        with self._lock:
+            if event["type"] == "DELETED":
+                self._pods.pop(pod_key, None)
+            else:
+                self._pods[pod_key] = self._trim(pod)
+        self.resource_version = pod.metadata.resource_version
+
+    @staticmethod
+    def _trim(pod: k8s.V1Pod) -> k8s.V1Pod:
+        """Only keep the parts of the pod used by the executor, the spec of the pods can be large."""
+        return client.V1Pod(
+            metadata=client.V1ObjectMeta(
+                name=pod.metadata.name,
+                namespace=pod.metadata.namespace,
+                labels=pod.metadata.labels,
+                annotations=pod.metadata.annotations,
+                resource_version=pod.metadata.resource_version,
+                deletion_timestamp=pod.metadata.deletion_timestamp,
+            ),
+            status=client.V1PodStatus(phase=pod.status.phase if pod.status else None),
+        )
+
+
+class PodCreationRateLimiter:
+    """
+    Token bucket limiting the rate of the pod creation requests sent to a namespace.
+
+    It is shared by all the threads creating pods in the namespace. On top of the rate limit, pod creation
+    can be paused for a while when the API server throttles requests. It never waits for a token, so that
+    the scheduler loop is not held up: pods that cannot be created yet are left for the next loop.
+
+    :param rate: Maximum number of pods created per second, 0 for no limit.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a token if a pod can be created now, return whether it can."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+            if now < self._paused_until:
+                return False
+            if not self.rate:
+                return True
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def pause(self, seconds: float) -> None:
+        """Stop creating pods for a while, e.g. when the API server throttles requests."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class PodTemplateCache:
+    """
+    Cache of the reconciled worker pods, without what is specific to each task instance.
+
+    Reconciling the pod template file, the executor defaults and the ``pod_override`` of the executor
+    config with ``PodGenerator.construct_pod`` is slow, but only depends on the template file and the
+    executor config. It is done once per combination of them, and the pod of each task instance is a copy
+    of the cached pod with the name, labels, annotations and command of the task instance set by
+    ``PodGenerator.apply_task_fields``, i.e. still overridden by the ones set in the executor config.
+
+    :param kube_config: The Kubernetes executor config.
+    :param namespace: The namespace of the worker pods.
+    :param maxsize: Maximum number of reconciled pods to keep.
+    """
+
+    # Task instance specific values used to build the cached pods, all replaced in the pods of the tasks
+    _PLACEHOLDER = "placeholder"
+
+    def __init__(self, kube_config: Any, namespace: str, maxsize: int = 128):
+        self.kube_config = kube_config
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self._pods: OrderedDict[tuple[str, float, str], k8s.V1Pod] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_pod(self, pod_template_file: str | None, pod_override_object: k8s.V1Pod | None) -> k8s.V1Pod:
+        template_file = pod_template_file or self.kube_config.pod_template_file
+        try:
+            template_mtime = os.path.getmtime(template_file)
+        except (OSError, TypeError):
+            template_mtime = 0.0
+        cache_key = (
+            template_file,
+            template_mtime,
+            json.dumps(PodGenerator.serialize_pod(pod_override_object), sort_keys=True),
+        )
+        with self._lock:
+            if cache_key in self._pods:
+                self._pods.move_to_end(cache_key)
+                return self._pods[cache_key]
+
+        base_worker_pod = get_base_pod_from_template(pod_template_file, self.kube_config)
+        if not base_worker_pod:
+            raise AirflowException(
+                f"could not find a valid worker template yaml at {self.kube_config.pod_template_file}"
+            )
+        pod = PodGenerator.construct_pod(
+            namespace=self.namespace,
+            scheduler_job_id=self._PLACEHOLDER,
+            pod_id=self._PLACEHOLDER,
+            dag_id=self._PLACEHOLDER,
+            task_id=self._PLACEHOLDER,
+            kube_image=self.kube_config.kube_image,
+            try_number=0,
+            date=None,
+            args=[self._PLACEHOLDER],
+            pod_override_object=pod_override_object,
+            base_worker_pod=base_worker_pod,
+        )
+        with self._lock:
+            self._pods[cache_key] = pod
+            while len(self._pods) > self.maxsize:
+                self._pods.popitem(last=False)
+        return pod
+
+    def construct_pod(
+        self,
+        *,
+        pod_template_file: str | None,
+        pod_override_object: k8s.V1Pod | None,
+        scheduler_job_id: str,
+        pod_id: str,
+        dag_id: str,
+        task_id: str,
+        try_number: int,
+        map_index: int,
+        run_id: str | None,
+        args: list[str],
+    ) -> k8s.V1Pod:
+        """Create the worker pod of a task instance, like ``PodGenerator.construct_pod`` does."""
+        pod = copy.deepcopy(self._get_pod(pod_template_file, pod_override_object))
+        task_metadata = PodGenerator.build_task_metadata(
+            dag_id=dag_id,
+            task_id=task_id,
+            pod_id=pod_id,
+            try_number=try_number,
+            scheduler_job_id=scheduler_job_id,
+            run_id=run_id,
+            map_index=map_index,
+        )
+        PodGenerator.apply_task_fields(pod, task_metadata, args, pod_override_object)
+
+        from airflow.settings import pod_mutation_hook
+
+        try:
+            pod_mutation_hook(pod)
+        except Exception as e:
+            raise PodMutationHookException from e
+        return pod
+
+
 class AirflowKubernetesScheduler(LoggingMixin):
     """Airflow Scheduler for Kubernetes."""
 
@@ -323,6 +642,17 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
         self.kube_watchers = self._make_kube_watchers()
+        self._pod_creation_rate_limiters: dict[str, PodCreationRateLimiter] = {}
+        self.pod_template_cache = PodTemplateCache(kube_config=self.kube_config, namespace=self.namespace)
+        self._pod_creation_rate_limiters_lock = threading.Lock()
+
+    def _get_pod_creation_rate_limiter(self, namespace: str) -> PodCreationRateLimiter:
+        with self._pod_creation_rate_limiters_lock:
+            if namespace not in self._pod_creation_rate_limiters:
+                self._pod_creation_rate_limiters[namespace] = PodCreationRateLimiter(
+                    rate=self.kube_config.worker_pods_creation_rate_limit
+                )
+            return self._pod_creation_rate_limiters[namespace]
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
         """Run POD asynchronously."""
@@ -330,11 +660,27 @@ class AirflowKubernetesScheduler(LoggingMixin):
         json_pod = json.dumps(sanitized_pod, indent=2)
 
         self.log.debug("Pod Creation Request: \n%s", json_pod)
-        try:
-            resp = self.kube_client.create_namespaced_pod(
-                body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
+        rate_limiter = self._get_pod_creation_rate_limiter(pod.metadata.namespace)
+        if not rate_limiter.try_acquire():
+            raise PodCreationRateLimited(
+                f"Pod creation in namespace {pod.metadata.namespace} is rate limited"
             )
+        try:
+            with Stats.timer("kubernetes_executor.pod_creation.duration"):
+                resp = self.kube_client.create_namespaced_pod(
+                    body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
+                )
             self.log.debug("Pod Creation Response: %s", resp)
+        except ApiException as e:
+            if str(e.status) == "429":
+                # The API server is throttling requests, back off before creating more pods in the namespace
+                Stats.incr("kubernetes_executor.pod_creation.throttled")
+                retry_after = (e.headers or {}).get("Retry-After")
+                rate_limiter.pause(float(retry_after) if retry_after and retry_after.isdigit() else 1.0)
+                self.log.warning("Pod creation was throttled by the Kubernetes API server: %s", e.reason)
+            else:
+                self.log.exception("Exception when attempting to create Namespaced Pod: %s", json_pod)
+            raise e
         except Exception as e:
             self.log.exception("Exception when attempting to create Namespaced Pod: %s", json_pod)
             raise e
@@ -400,28 +746,17 @@ class AirflowKubernetesScheduler(LoggingMixin):
         elif command[0:3] != ["airflow", "tasks", "run"]:
             raise ValueError('The command must start with ["airflow", "tasks", "run"].')
 
-        base_worker_pod = get_base_pod_from_template(pod_template_file, self.kube_config)
-
-        if not base_worker_pod:
-            raise AirflowException(
-                f"could not find a valid worker template yaml at {self.kube_config.pod_template_file}"
-            )
-
-        pod = PodGenerator.construct_pod(
-            namespace=self.namespace,
+        pod = self.pod_template_cache.construct_pod(
+            pod_template_file=pod_template_file,
+            pod_override_object=kube_executor_config,
             scheduler_job_id=self.scheduler_job_id,
             pod_id=create_unique_id(dag_id, task_id),
             dag_id=dag_id,
             task_id=task_id,
-            kube_image=self.kube_config.kube_image,
             try_number=try_number,
             map_index=map_index,
-            date=None,
             run_id=run_id,
             args=list(command),
-            pod_override_object=kube_executor_config,
-            base_worker_pod=base_worker_pod,
-            with_mutation_hook=True,
         )
         # Reconcile the pod generated by the Operator and the Pod
         # generated by the .cfg file
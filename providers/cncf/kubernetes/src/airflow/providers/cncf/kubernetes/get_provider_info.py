@@ -178,6 +178,20 @@ def get_provider_info():
                         "example": None,
                         "default": "1",
                     },
+                    "worker_pods_creation_concurrency": {
+                        "description": "Number of Kubernetes Worker Pods created concurrently, by as many threads, within the\npod creation calls of a scheduler loop (see ``worker_pods_creation_batch_size``).\n",
+                        "version_added": "10.7.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "1",
+                    },
+                    "worker_pods_creation_rate_limit": {
+                        "description": "Maximum number of Kubernetes Worker Pods created per second in each namespace, 0 for no limit.\nRegardless of this limit, pod creation in a namespace is paused for the time requested by the\nKubernetes API server when it throttles requests. The tasks whose pods cannot be created yet are\nleft in the queue for the next scheduler loop.\n",
+                        "version_added": "10.7.0",
+                        "type": "float",
+                        "example": "20.0",
+                        "default": "0",
+                    },
                     "multi_namespace_mode": {
                         "description": "Allows users to launch pods in multiple namespaces.\nWill require creating a cluster-role for the scheduler,\nor use multi_namespace_mode_namespace_list configuration.\n",
                         "version_added": None,
@@ -192,6 +206,13 @@ def get_provider_info():
                         "example": None,
                         "default": "",
                     },
+                    "use_pod_informer": {
+                        "description": "Keep an in-memory cache of the worker pods, up to date with a watch, to find pods to adopt or\nrevoke without listing all worker pods from the Kubernetes API server, which can be slow\nand load the control plane when there are many pods. The cache requires permission to\nlist and watch pods in the namespaces of the worker pods.\n",
+                        "version_added": "10.7.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
                     "in_cluster": {
                         "description": "Use the service account kubernetes gives to pods to connect to kubernetes cluster.\nIt's intended for clients that expect to be running inside a pod running on kubernetes.\nIt will raise an exception if called from a process not running in a kubernetes environment.\n",
                         "version_added": None,
@@ -52,6 +52,12 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, "worker_pods_creation_batch_size"
         )
+        self.worker_pods_creation_concurrency = conf.getint(
+            self.kubernetes_section, "worker_pods_creation_concurrency", fallback=1
+        )
+        self.worker_pods_creation_rate_limit = conf.getfloat(
+            self.kubernetes_section, "worker_pods_creation_rate_limit", fallback=0
+        )
         self.worker_container_repository = conf.get(self.kubernetes_section, "worker_container_repository")
         self.worker_container_tag = conf.get(self.kubernetes_section, "worker_container_tag")
         if self.worker_container_repository and self.worker_container_tag:
@@ -73,6 +79,7 @@ class KubeConfig:
             ).split(",")
         else:
             self.multi_namespace_mode_namespace_list = None
+        self.use_pod_informer = conf.getboolean(self.kubernetes_section, "use_pod_informer", fallback=False)
         # The Kubernetes Namespace in which pods will be created by the executor. Note
         # that if your
         # cluster has RBAC enabled, your workers may need service account permissions to
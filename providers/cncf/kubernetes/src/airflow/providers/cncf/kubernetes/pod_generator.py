@@ -337,14 +337,6 @@ class PodGenerator:
             - executor_config
             - dynamic arguments
         """
-        if len(pod_id) > POD_NAME_MAX_LENGTH:
-            warnings.warn(
-                f"pod_id supplied is longer than {POD_NAME_MAX_LENGTH} characters; "
-                f"truncating and adding unique suffix.",
-                UserWarning,
-                stacklevel=2,
-            )
-            pod_id = add_unique_suffix(name=pod_id, max_len=POD_NAME_MAX_LENGTH)
         try:
             image = pod_override_object.spec.containers[0].image  # type: ignore
             if not image:
@@ -352,18 +344,6 @@ class PodGenerator:
         except Exception:
             image = kube_image
 
-        annotations = {
-            "dag_id": dag_id,
-            "task_id": task_id,
-            "try_number": str(try_number),
-        }
-        if map_index >= 0:
-            annotations["map_index"] = str(map_index)
-        if date:
-            annotations[get_logical_date_key()] = date.isoformat()
-        if run_id:
-            annotations["run_id"] = run_id
-
         main_container = k8s.V1Container(
             name="base",
             args=args,
@@ -373,19 +353,16 @@ class PodGenerator:
             ],
         )
         dynamic_pod = k8s.V1Pod(
-            metadata=k8s.V1ObjectMeta(
+            metadata=cls.build_task_metadata(
+                dag_id=dag_id,
+                task_id=task_id,
+                pod_id=pod_id,
+                try_number=try_number,
+                scheduler_job_id=scheduler_job_id,
+                date=date,
+                run_id=run_id,
+                map_index=map_index,
                 namespace=namespace,
-                annotations=annotations,
-                name=pod_id,
-                labels=cls.build_labels_for_k8s_executor_pod(
-                    dag_id=dag_id,
-                    task_id=task_id,
-                    try_number=try_number,
-                    airflow_worker=scheduler_job_id,
-                    map_index=map_index,
-                    logical_date=date,
-                    run_id=run_id,
-                ),
             ),
         )
 
@@ -414,6 +391,97 @@ class PodGenerator:
 
         return pod
 
+    @classmethod
+    def build_task_metadata(
+        cls,
+        *,
+        dag_id: str,
+        task_id: str,
+        pod_id: str,
+        try_number: int,
+        scheduler_job_id: str,
+        date: datetime.datetime | None = None,
+        run_id: str | None = None,
+        map_index: int = -1,
+        namespace: str | None = None,
+    ) -> k8s.V1ObjectMeta:
+        """
+        Build the name, annotations and labels of the worker pod of a task instance.
+
+        ``pod_id`` is truncated, and given a unique suffix, if it is too long for a pod name.
+        """
+        if len(pod_id) > POD_NAME_MAX_LENGTH:
+            warnings.warn(
+                f"pod_id supplied is longer than {POD_NAME_MAX_LENGTH} characters; "
+                f"truncating and adding unique suffix.",
+                UserWarning,
+                stacklevel=3,
+            )
+            pod_id = add_unique_suffix(name=pod_id, max_len=POD_NAME_MAX_LENGTH)
+
+        annotations = {
+            "dag_id": dag_id,
+            "task_id": task_id,
+            "try_number": str(try_number),
+        }
+        if map_index >= 0:
+            annotations["map_index"] = str(map_index)
+        if date:
+            annotations[get_logical_date_key()] = date.isoformat()
+        if run_id:
+            annotations["run_id"] = run_id
+
+        return k8s.V1ObjectMeta(
+            namespace=namespace,
+            annotations=annotations,
+            name=pod_id,
+            labels=cls.build_labels_for_k8s_executor_pod(
+                dag_id=dag_id,
+                task_id=task_id,
+                try_number=try_number,
+                airflow_worker=scheduler_job_id,
+                map_index=map_index,
+                logical_date=date,
+                run_id=run_id,
+            ),
+        )
+
+    @staticmethod
+    def apply_task_fields(
+        pod: k8s.V1Pod,
+        task_metadata: k8s.V1ObjectMeta,
+        args: list[str],
+        pod_override_object: k8s.V1Pod | None,
+    ) -> None:
+        """
+        Set the name, annotations, labels and args of a task instance on an already reconciled pod.
+
+        This is the part of ``construct_pod`` that differs for every task instance, for a pod that was
+        reconciled with ``pod_override_object`` beforehand. As in ``construct_pod``, what
+        ``pod_override_object`` sets still takes precedence.
+
+        :param pod: The reconciled pod, modified in place.
+        :param task_metadata: The metadata of the task instance, from ``build_task_metadata``.
+        :param args: The args of the base container.
+        :param pod_override_object: The pod override the pod was reconciled with.
+        """
+        override_metadata = pod_override_object.metadata if pod_override_object else None
+        override_containers = (
+            pod_override_object.spec.containers if pod_override_object and pod_override_object.spec else None
+        )
+        pod.metadata.name = (override_metadata and override_metadata.name) or task_metadata.name
+        pod.metadata.labels = {
+            **(pod.metadata.labels or {}),
+            **task_metadata.labels,
+            **((override_metadata and override_metadata.labels) or {}),
+        }
+        pod.metadata.annotations = {
+            **(pod.metadata.annotations or {}),
+            **task_metadata.annotations,
+            **((override_metadata and override_metadata.annotations) or {}),
+        }
+        pod.spec.containers[0].args = (override_containers and override_containers[0].args) or args
+
     @classmethod
     def build_selector_for_k8s_executor_pod(
         cls,
@@ -24,7 +24,7 @@ from unittest import mock
 
 import pytest
 import yaml
-from kubernetes.client import models as k8s
+from kubernetes.client import ApiClient, models as k8s
 from kubernetes.client.rest import ApiException
 from urllib3 import HTTPResponse
 
@@ -32,6 +32,7 @@ from airflow import __version__
 from airflow.exceptions import AirflowException
 from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.providers.cncf.kubernetes import pod_generator
+from airflow.providers.cncf.kubernetes.exceptions import PodCreationRateLimited
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor import (
     KubernetesExecutor,
     PodReconciliationError,
@@ -42,6 +43,9 @@ from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types impor
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
     AirflowKubernetesScheduler,
     KubernetesJobWatcher,
+    KubernetesPodInformer,
+    PodCreationRateLimiter,
+    PodTemplateCache,
     ResourceVersion,
     get_base_pod_from_template,
 )
@@ -179,6 +183,48 @@ class TestAirflowKubernetesScheduler:
         finally:
             kube_executor.end()
 
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.Stats")
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    def test_run_pod_async_throttled(self, mock_watcher, mock_stats):
+        kube_client = mock.MagicMock()
+        kube_client.api_client.sanitize_for_serialization.return_value = {}
+        kube_client.create_namespaced_pod.side_effect = ApiException(
+            http_resp=HTTPResponse(body="{}", status=429, headers={"Retry-After": "3"})
+        )
+        kube_scheduler = AirflowKubernetesScheduler(
+            kube_config=mock.MagicMock(worker_pods_creation_rate_limit=0, multi_namespace_mode=False),
+            result_queue=mock.MagicMock(),
+            kube_client=kube_client,
+            scheduler_job_id="1",
+        )
+        pod = k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="pod", namespace="airflow"))
+
+        with mock.patch.object(PodCreationRateLimiter, "pause") as mock_pause, pytest.raises(ApiException):
+            kube_scheduler.run_pod_async(pod)
+
+        mock_pause.assert_called_once_with(3.0)
+        mock_stats.incr.assert_called_once_with("kubernetes_executor.pod_creation.throttled")
+        mock_stats.timer.assert_called_once_with("kubernetes_executor.pod_creation.duration")
+
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    def test_run_pod_async_rate_limited(self, mock_watcher):
+        kube_client = mock.MagicMock()
+        kube_client.api_client.sanitize_for_serialization.return_value = {}
+        kube_scheduler = AirflowKubernetesScheduler(
+            kube_config=mock.MagicMock(worker_pods_creation_rate_limit=1, multi_namespace_mode=False),
+            result_queue=mock.MagicMock(),
+            kube_client=kube_client,
+            scheduler_job_id="1",
+        )
+        pod = k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="pod", namespace="airflow"))
+
+        kube_scheduler.run_pod_async(pod)
+        # Out of tokens, the pod is not created (rather than waiting for the next token)
+        with pytest.raises(PodCreationRateLimited):
+            kube_scheduler.run_pod_async(pod)
+
+        kube_client.create_namespaced_pod.assert_called_once()
+
     @pytest.mark.skipif(
         AirflowKubernetesScheduler is None, reason="kubernetes python package is not installed"
     )
@@ -1818,3 +1864,286 @@ class TestKubernetesJobWatcher:
             executor = KubernetesExecutor()
 
         assert executor.kube_config.worker_pod_pending_fatal_container_state_reasons == expected_result
+
+
+def _informer_pod(name, phase="Running", **labels):
+    return k8s.V1Pod(
+        metadata=k8s.V1ObjectMeta(
+            name=name,
+            namespace="airflow",
+            labels={"kubernetes_executor": "True", "airflow-worker": "1", **labels},
+            annotations={"dag_id": "dag", "task_id": name},
+            resource_version="1",
+        ),
+        spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base")]),
+        status=k8s.V1PodStatus(phase=phase),
+    )
+
+
+class TestKubernetesPodInformer:
+    def setup_method(self):
+        self.kube_client = mock.MagicMock()
+        self.kube_client.list_namespaced_pod.return_value = k8s.V1PodList(
+            metadata=k8s.V1ListMeta(resource_version="10"),
+            items=[_informer_pod("running"), _informer_pod("succeeded", phase="Succeeded")],
+        )
+        self.informer = KubernetesPodInformer(
+            namespace="airflow",
+            kube_client=self.kube_client,
+            kube_config=mock.MagicMock(kube_client_request_args={}),
+        )
+
+    def _pod_names(self, **selectors):
+        return sorted(pod.metadata.name for pod in self.informer.list_pods(**selectors))
+
+    def test_list(self):
+        assert not self.informer.synced
+
+        self.informer._list()
+
+        assert self.informer.synced
+        assert self.informer.resource_version == "10"
+        self.kube_client.list_namespaced_pod.assert_called_once_with(
+            "airflow", _request_timeout=30, label_selector="kubernetes_executor=True"
+        )
+        (pod,) = self.informer.list_pods(field_selector="status.phase=Succeeded")
+        assert pod.metadata.annotations == {"dag_id": "dag", "task_id": "succeeded"}
+        assert pod.spec is None
+
+    @pytest.mark.parametrize(
+        "label_selector, field_selector, expected",
+        [
+            (None, None, ["running", "succeeded"]),
+            ("kubernetes_executor=True,airflow-worker=1", "status.phase!=Succeeded", ["running"]),
+            ("airflow-worker!=1", None, []),
+            ("airflow_executor_done!=True", "metadata.name=succeeded", ["succeeded"]),
+        ],
+    )
+    def test_list_pods_with_selectors(self, label_selector, field_selector, expected):
+        self.informer._list()
+
+        assert self._pod_names(label_selector=label_selector, field_selector=field_selector) == expected
+
+    def test_list_pods_with_set_based_selector(self):
+        self.informer._list()
+
+        with pytest.raises(ValueError, match="Only equality-based selectors are supported"):
+            self.informer.list_pods(label_selector="airflow-worker in (1,2)")
+
+    def test_process_event(self):
+        self.informer._list()
+        adopted_pod = _informer_pod("running", **{"airflow-worker": "2"})
+        adopted_pod.metadata.resource_version = "11"
+        deleted_pod = _informer_pod("succeeded")
+        deleted_pod.metadata.resource_version = "12"
+
+        self.informer.process_event({"type": "MODIFIED", "object": adopted_pod})
+        self.informer.process_event({"type": "DELETED", "object": deleted_pod})
+        assert self.informer.resource_version == "12"
+        self.informer.process_event(
+            {"type": "BOOKMARK", "object": {}, "raw_object": {"metadata": {"resourceVersion": "20"}}}
+        )
+
+        assert self.informer.resource_version == "20"
+        assert self._pod_names() == ["running"]
+        assert self._pod_names(label_selector="airflow-worker=2") == ["running"]
+
+    def test_run_lists_pods_again_when_resource_version_is_too_old(self):
+        def watch():
+            if self.informer._watch.call_count == 1:
+                raise ApiException(status=410)
+            self.informer.stop()
+
+        with mock.patch.object(self.informer, "_watch", side_effect=watch):
+            self.informer.run()
+
+        assert self.kube_client.list_namespaced_pod.call_count == 2
+
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
+    def test_executor_lists_pods_from_synced_informers(self, mock_dynamic_client):
+        executor = KubernetesExecutor()
+        executor.pod_informers = [self.informer]
+        query_kwargs = {"label_selector": "airflow-worker=1", "field_selector": "status.phase=Running"}
+
+        self.informer._list()
+        pods = executor._list_pods(query_kwargs)
+
+        assert [pod.metadata.name for pod in pods] == ["running"]
+        mock_dynamic_client.assert_not_called()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestPodCreationRateLimiter:
+    @pytest.fixture(autouse=True)
+    def clock(self):
+        clock = FakeClock()
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.time.monotonic",
+            clock.monotonic,
+        ):
+            yield clock
+
+    def test_rate_limit(self, clock):
+        rate_limiter = PodCreationRateLimiter(rate=4)
+
+        # The 4 first pods are created in a burst, the next ones at the rate limit
+        assert [rate_limiter.try_acquire() for _ in range(5)] == [True, True, True, True, False]
+        clock.now += 0.25
+        assert [rate_limiter.try_acquire() for _ in range(2)] == [True, False]
+
+    def test_no_rate_limit(self, clock):
+        rate_limiter = PodCreationRateLimiter(rate=0)
+
+        assert all(rate_limiter.try_acquire() for _ in range(100))
+
+    def test_pause(self, clock):
+        rate_limiter = PodCreationRateLimiter(rate=0)
+
+        rate_limiter.pause(5)
+        assert not rate_limiter.try_acquire()
+        clock.now += 5
+        assert rate_limiter.try_acquire()
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_sync_creates_pods_concurrently(concurrency):
+    executor = KubernetesExecutor()
+    executor.kube_config.worker_pods_creation_batch_size = 3
+    executor.kube_config.worker_pods_creation_concurrency = concurrency
+    executor.kube_scheduler = mock.MagicMock()
+    keys = [TaskInstanceKey("dag", f"task_{i}", "run_id", 1) for i in range(4)]
+    throttled = ApiException(http_resp=HTTPResponse(body="{}", status=429))
+
+    def run_next(task):
+        if task[0] == keys[1]:
+            raise throttled
+        if task[0] == keys[2]:
+            raise PodCreationRateLimited("rate limited")
+
+    executor.kube_scheduler.run_next.side_effect = run_next
+    for key in keys:
+        executor.task_queue.put((key, ["airflow", "tasks", "run"], None, None))
+
+    try:
+        with mock.patch.object(executor, "fail") as mock_fail:
+            executor.sync()
+
+        assert executor.kube_scheduler.run_next.call_count == 3
+        mock_fail.assert_not_called()
+        assert (executor._pod_creation_pool is not None) == (concurrency > 1)
+        # The throttled and rate limited tasks are re-queued after the task left in the queue
+        queued_keys = []
+        while not executor.task_queue.empty():
+            queued_keys.append(executor.task_queue.get_nowait()[0])
+            executor.task_queue.task_done()
+        assert queued_keys == [keys[3], keys[1], keys[2]]
+    finally:
+        executor.end()
+
+
+class TestPodTemplateCache:
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, data_file):
+        self.kube_config = mock.MagicMock(
+            pod_template_file=data_file("pods/generator_base_with_secrets.yaml").as_posix(),
+            kube_image="airflow:latest",
+        )
+        self.cache = PodTemplateCache(kube_config=self.kube_config, namespace="airflow")
+
+    def _pod_kwargs(self, task_id, map_index=-1):
+        return {
+            "scheduler_job_id": "5",
+            "pod_id": f"dag-{task_id}-abc",
+            "dag_id": "dag",
+            "task_id": task_id,
+            "try_number": 2,
+            "map_index": map_index,
+            "run_id": "run_id",
+            "args": ["airflow", "tasks", "run", task_id],
+        }
+
+    @pytest.mark.parametrize(
+        "pod_override",
+        [
+            pytest.param(None, id="no override"),
+            pytest.param(
+                k8s.V1Pod(
+                    metadata=k8s.V1ObjectMeta(
+                        labels={"team": "data", "dag_id": "custom"}, annotations={"owner": "me"}
+                    )
+                ),
+                id="metadata override",
+            ),
+            pytest.param(
+                k8s.V1Pod(
+                    spec=k8s.V1PodSpec(
+                        containers=[
+                            k8s.V1Container(
+                                name="base",
+                                image="custom:1",
+                                env=[k8s.V1EnvVar(name="FOO", value="bar")],
+                            )
+                        ]
+                    )
+                ),
+                id="container override",
+            ),
+            pytest.param(
+                k8s.V1Pod(
+                    metadata=k8s.V1ObjectMeta(name="custom-name"),
+                    spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base", args=["custom"])]),
+                ),
+                id="name and args override",
+            ),
+        ],
+    )
+    def test_construct_pod_like_pod_generator(self, pod_override):
+        sanitize = ApiClient().sanitize_for_serialization
+        # The second pod is built from the cached one
+        for task_id, map_index in (("task_1", -1), ("task_2", 3)):
+            pod_kwargs = self._pod_kwargs(task_id, map_index)
+
+            pod = self.cache.construct_pod(
+                pod_template_file=None, pod_override_object=pod_override, **pod_kwargs
+            )
+
+            expected_pod = pod_generator.PodGenerator.construct_pod(
+                namespace="airflow",
+                kube_image="airflow:latest",
+                date=None,
+                pod_override_object=pod_override,
+                base_worker_pod=get_base_pod_from_template(None, self.kube_config),
+                with_mutation_hook=True,
+                **pod_kwargs,
+            )
+            assert sanitize(pod) == sanitize(expected_pod)
+
+    def test_long_pod_id_is_truncated(self):
+        pod_kwargs = {**self._pod_kwargs("task_1"), "pod_id": "a" * 100}
+
+        with pytest.warns(UserWarning, match="truncating and adding unique suffix"):
+            pod = self.cache.construct_pod(pod_template_file=None, pod_override_object=None, **pod_kwargs)
+
+        assert len(pod.metadata.name) == 63
+        assert pod.metadata.name.startswith("a" * 50)
+
+    def test_reconciled_pods_are_cached(self):
+        pod_override = k8s.V1Pod(metadata=k8s.V1ObjectMeta(labels={"team": "data"}))
+
+        with mock.patch.object(
+            pod_generator.PodGenerator, "construct_pod", wraps=pod_generator.PodGenerator.construct_pod
+        ) as mock_construct_pod:
+            for task_id in ("task_1", "task_2"):
+                for override in (None, pod_override):
+                    self.cache.construct_pod(
+                        pod_template_file=None, pod_override_object=override, **self._pod_kwargs(task_id)
+                    )
+
+        assert mock_construct_pod.call_count == 2
@@ -16,9 +16,11 @@
 # under the License.
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import os
+import zlib
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
@@ -34,11 +36,16 @@ from airflow.providers.edge3.models.edge_worker import EdgeWorkerVersionExceptio
 from airflow.providers.edge3.version_compat import AIRFLOW_V_3_0_PLUS
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobLogChunk,
+    EdgeJobsFetched,
+    EdgeJobStateUpdate,
     PushLogsBody,
+    WorkerJobsPollBody,
     WorkerQueuesBody,
     WorkerRegistrationReturn,
     WorkerSetStateReturn,
     WorkerStateBody,
+    WorkerSyncBody,
 )
 from airflow.utils.state import TaskInstanceState  # noqa: TC001
 
@@ -158,6 +165,52 @@ def worker_set_state(
     return WorkerSetStateReturn(**result)
 
 
+def worker_sync(
+    hostname: str,
+    state: EdgeWorkerState,
+    jobs_active: int,
+    queues: list[str] | None,
+    sysinfo: dict,
+    maintenance_comments: str | None = None,
+    job_states: list[tuple[TaskInstanceKey, TaskInstanceState]] | None = None,
+    log_chunks: list[tuple[TaskInstanceKey, datetime, str]] | None = None,
+) -> WorkerSetStateReturn:
+    """
+    Report the state changes and log chunks of the jobs along with the state of the worker in one request.
+
+    This heartbeats like ``worker_set_state``. Log chunks are sent compressed.
+    """
+    try:
+        result = _make_generic_request(
+            "POST",
+            f"worker/sync/{quote(hostname)}",
+            WorkerSyncBody(
+                state=state,
+                jobs_active=jobs_active,
+                queues=queues,
+                sysinfo=sysinfo,
+                maintenance_comments=maintenance_comments,
+                job_states=[
+                    EdgeJobStateUpdate(**key._asdict(), state=job_state)
+                    for key, job_state in job_states or []
+                ],
+                log_chunks=[
+                    EdgeJobLogChunk(
+                        **key._asdict(),
+                        log_chunk_time=log_chunk_time,
+                        log_chunk_data=base64.b64encode(zlib.compress(log_chunk_data.encode())).decode(),
+                    )
+                    for key, log_chunk_time, log_chunk_data in log_chunks or []
+                ],
+            ).model_dump_json(exclude_unset=True),
+        )
+    except requests.HTTPError as e:
+        if e.response.status_code == 400:
+            raise EdgeWorkerVersionException(str(e))
+        raise e
+    return WorkerSetStateReturn(**result)
+
+
 def jobs_fetch(hostname: str, queues: list[str] | None, free_concurrency: int) -> EdgeJobFetched | None:
     """Fetch a job to execute on the edge worker."""
     result = _make_generic_request(
@@ -172,6 +225,20 @@ def jobs_fetch(hostname: str, queues: list[str] | None, free_concurrency: int) -
     return None
 
 
+def jobs_poll(
+    hostname: str, queues: list[str] | None, free_concurrency: int, max_jobs: int, wait_timeout: float
+) -> list[EdgeJobFetched]:
+    """Fetch jobs to execute on the edge worker, waiting on the central site for one if there is none."""
+    result = _make_generic_request(
+        "POST",
+        f"jobs/poll/{quote(hostname)}",
+        WorkerJobsPollBody(
+            queues=queues, free_concurrency=free_concurrency, max_jobs=max_jobs, wait_timeout=wait_timeout
+        ).model_dump_json(exclude_unset=True),
+    )
+    return EdgeJobsFetched(**result).jobs
+
+
 def jobs_set_state(key: TaskInstanceKey, state: TaskInstanceState) -> None:
     """Set the state of a job."""
     _make_generic_request(
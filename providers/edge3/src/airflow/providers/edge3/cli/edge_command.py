@@ -97,6 +97,8 @@ def _launch_worker(args):
         job_poll_interval=conf.getint("edge", "job_poll_interval"),
         heartbeat_interval=conf.getint("edge", "heartbeat_interval"),
         daemon=args.daemon,
+        job_long_poll_timeout=conf.getint("edge", "job_long_poll_timeout", fallback=0),
+        batched_sync=conf.getboolean("edge", "batched_sync", fallback=False),
     )
     edge_worker.start()
 
@@ -36,11 +36,13 @@ from airflow.configuration import conf
 from airflow.providers.edge3 import __version__ as edge_provider_version
 from airflow.providers.edge3.cli.api_client import (
     jobs_fetch,
+    jobs_poll,
     jobs_set_state,
     logs_logfile_path,
     logs_push,
     worker_register,
     worker_set_state,
+    worker_sync,
 )
 from airflow.providers.edge3.cli.dataclasses import Job, MaintenanceMarker, WorkerStatus
 from airflow.providers.edge3.cli.signalling import (
@@ -51,11 +53,13 @@ from airflow.providers.edge3.cli.signalling import (
 )
 from airflow.providers.edge3.models.edge_worker import EdgeWorkerState, EdgeWorkerVersionException
 from airflow.providers.edge3.version_compat import AIRFLOW_V_3_0_PLUS
+from airflow.providers.edge3.worker_api.datamodels import MAX_WAIT_TIMEOUT
 from airflow.utils import timezone
 from airflow.utils.net import getfqdn
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
+    from airflow.models.taskinstancekey import TaskInstanceKey
     from airflow.providers.edge3.worker_api.datamodels import EdgeJobFetched
 
 logger = logging.getLogger(__name__)
@@ -91,9 +95,24 @@ class EdgeWorker:
         job_poll_interval: int,
         heartbeat_interval: int,
         daemon: bool = False,
+        job_long_poll_timeout: int = 0,
+        batched_sync: bool = False,
     ):
         self.pid_file_path = pid_file_path
         self.job_poll_interval = job_poll_interval
+        if job_long_poll_timeout > MAX_WAIT_TIMEOUT:
+            logger.warning(
+                "job_long_poll_timeout of %s seconds is above the maximum of %s seconds, using the maximum.",
+                job_long_poll_timeout,
+                MAX_WAIT_TIMEOUT,
+            )
+            job_long_poll_timeout = MAX_WAIT_TIMEOUT
+        self.job_long_poll_timeout = job_long_poll_timeout
+        self.batched_sync = batched_sync
+        self.pending_job_states: list[tuple[TaskInstanceKey, TaskInstanceState]] = []
+        """Job state changes to report with the next sync, if ``batched_sync``."""
+        self.pending_log_chunks: list[tuple[TaskInstanceKey, datetime, str]] = []
+        """Log chunks to push with the next sync, if ``batched_sync``."""
         self.hb_interval = heartbeat_interval
         self.hostname = hostname
         self.queues = queues
@@ -117,7 +136,7 @@ class EdgeWorker:
                 marker_path.unlink()
                 # send heartbeat immediately to update state
                 if EdgeWorker.edge_instance:
-                    EdgeWorker.edge_instance.heartbeat(EdgeWorker.maintenance_comments)
+                    EdgeWorker.edge_instance.heartbeat(EdgeWorker.maintenance_comments, send_pending=False)
             else:
                 logger.info("Request to get status of Edge Worker received.")
             status_path = Path(status_file_path(None))
@@ -289,9 +308,15 @@ class EdgeWorker:
     def loop(self):
         """Run a loop of scheduling and monitoring tasks."""
         new_job = False
+        waited = False
         previous_jobs = EdgeWorker.jobs
         if not any((EdgeWorker.drain, EdgeWorker.maintenance_mode)) and self.free_concurrency > 0:
-            new_job = self.fetch_job()
+            if self.use_long_poll:
+                # The central site waits for new jobs in place of sleeping between polls
+                new_job = self.poll_jobs()
+                waited = True
+            else:
+                new_job = self.fetch_job()
         self.check_running_jobs()
 
         if (
@@ -299,13 +324,64 @@ class EdgeWorker:
             or datetime.now().timestamp() - self.last_hb.timestamp() > self.hb_interval
             or self.worker_state_changed  # send heartbeat immediately if the state is different in db
             or bool(previous_jobs) != bool(EdgeWorker.jobs)  # when number of jobs changes from/to 0
+            or self.pending_job_states  # with batched sync, job states and logs are sent with the heartbeat
+            or self.pending_log_chunks
         ):
             self.worker_state_changed = self.heartbeat()
             self.last_hb = datetime.now()
 
-        if not new_job:
+        if not new_job and not waited:
             self.interruptible_sleep()
 
+    @property
+    def use_batched_sync(self) -> bool:
+        """Whether job states and logs are sent with the heartbeat, which is only available in Airflow 3."""
+        return AIRFLOW_V_3_0_PLUS and self.batched_sync
+
+    def _set_job_state(self, key: TaskInstanceKey, state: TaskInstanceState) -> None:
+        if self.use_batched_sync:
+            self.pending_job_states.append((key, state))
+        else:
+            jobs_set_state(key, state)
+
+    def _push_log_chunk(self, key: TaskInstanceKey, log_chunk_time: datetime, log_chunk_data: str) -> None:
+        if self.use_batched_sync:
+            self.pending_log_chunks.append((key, log_chunk_time, log_chunk_data))
+        else:
+            logs_push(task=key, log_chunk_time=log_chunk_time, log_chunk_data=log_chunk_data)
+
+    @property
+    def use_long_poll(self) -> bool:
+        """Whether jobs are fetched by long-polling the central site, which is only available in Airflow 3."""
+        return AIRFLOW_V_3_0_PLUS and self.job_long_poll_timeout > 0
+
+    def poll_jobs(self) -> bool:
+        """Fetch and start as many new jobs as fit in the free concurrency, waiting for them if there is none."""
+        # Don't hold back reporting on the running jobs, or the next heartbeat, for longer than without long-poll
+        wait_timeout = self.job_poll_interval if EdgeWorker.jobs else self.job_long_poll_timeout
+        if self.last_hb:
+            next_hb = self.hb_interval - (datetime.now().timestamp() - self.last_hb.timestamp())
+            wait_timeout = max(0, min(wait_timeout, next_hb))
+        logger.debug("Polling for new jobs for up to %s seconds...", wait_timeout)
+        edge_jobs = jobs_poll(
+            self.hostname,
+            self.queues,
+            self.free_concurrency,
+            max_jobs=self.free_concurrency,
+            wait_timeout=wait_timeout,
+        )
+        for edge_job in edge_jobs:
+            logger.info("Received job: %s", edge_job)
+            self._launch_job(edge_job)
+            self._set_job_state(edge_job.key, TaskInstanceState.RUNNING)
+            self.free_concurrency -= edge_job.concurrency_slots
+        if not edge_jobs:
+            logger.info(
+                "No new job to process%s",
+                f", {len(EdgeWorker.jobs)} still running" if EdgeWorker.jobs else "",
+            )
+        return bool(edge_jobs)
+
     def fetch_job(self) -> bool:
         """Fetch and start a new job from central site."""
         logger.debug("Attempting to fetch a new job...")
@@ -313,7 +389,7 @@ class EdgeWorker:
         if edge_job:
             logger.info("Received job: %s", edge_job)
             self._launch_job(edge_job)
-            jobs_set_state(edge_job.key, TaskInstanceState.RUNNING)
+            self._set_job_state(edge_job.key, TaskInstanceState.RUNNING)
             return True
 
         logger.info(
@@ -331,10 +407,10 @@ class EdgeWorker:
                 EdgeWorker.jobs.remove(job)
                 if job.is_success:
                     logger.info("Job completed: %s", job.edge_job)
-                    jobs_set_state(job.edge_job.key, TaskInstanceState.SUCCESS)
+                    self._set_job_state(job.edge_job.key, TaskInstanceState.SUCCESS)
                 else:
                     logger.error("Job failed: %s", job.edge_job)
-                    jobs_set_state(job.edge_job.key, TaskInstanceState.FAILED)
+                    self._set_job_state(job.edge_job.key, TaskInstanceState.FAILED)
             else:
                 used_concurrency += job.edge_job.concurrency_slots
 
@@ -353,28 +429,55 @@ class EdgeWorker:
                         if not chunk_data:
                             break
 
-                        logs_push(
-                            task=job.edge_job.key,
-                            log_chunk_time=timezone.utcnow(),
-                            log_chunk_data=chunk_data,
-                        )
+                        self._push_log_chunk(job.edge_job.key, timezone.utcnow(), chunk_data)
 
         self.free_concurrency = self.concurrency - used_concurrency
 
-    def heartbeat(self, new_maintenance_comments: str | None = None) -> bool:
-        """Report liveness state of worker to central site with stats."""
+    def heartbeat(self, new_maintenance_comments: str | None = None, send_pending: bool = True) -> bool:
+        """
+        Report liveness state of worker to central site with stats.
+
+        :param new_maintenance_comments: New maintenance comments of the worker.
+        :param send_pending: Whether to send the pending job states and log chunks, if ``batched_sync``. The
+            heartbeat sent from the signal handler does not, as it can interrupt the heartbeat of the loop
+            while that one is sending them.
+        """
         state = EdgeWorker._get_state()
         sysinfo = self._get_sysinfo()
         worker_state_changed: bool = False
         try:
-            worker_info = worker_set_state(
-                self.hostname,
-                state,
-                len(EdgeWorker.jobs),
-                self.queues,
-                sysinfo,
-                new_maintenance_comments,
-            )
+            if self.use_batched_sync:
+                job_states, log_chunks = (
+                    (list(self.pending_job_states), list(self.pending_log_chunks))
+                    if send_pending
+                    else ([], [])
+                )
+                try:
+                    worker_info = worker_sync(
+                        self.hostname,
+                        state,
+                        len(EdgeWorker.jobs),
+                        self.queues,
+                        sysinfo,
+                        new_maintenance_comments,
+                        job_states=job_states,
+                        log_chunks=log_chunks,
+                    )
+                except EdgeWorkerVersionException:
+                    # Also applied by the central site on a version mismatch, don't send them twice
+                    self._drop_pending(job_states, log_chunks)
+                    raise
+                # On any other error they were rolled back, so they are kept to be sent with the next sync
+                self._drop_pending(job_states, log_chunks)
+            else:
+                worker_info = worker_set_state(
+                    self.hostname,
+                    state,
+                    len(EdgeWorker.jobs),
+                    self.queues,
+                    sysinfo,
+                    new_maintenance_comments,
+                )
             self.queues = worker_info.queues
             if worker_info.state == EdgeWorkerState.MAINTENANCE_REQUEST:
                 logger.info("Maintenance mode requested!")
@@ -399,6 +502,11 @@ class EdgeWorker:
             EdgeWorker.drain = True
         return worker_state_changed
 
+    def _drop_pending(self, job_states: list, log_chunks: list) -> None:
+        """Drop the job states and log chunks sent to the central site from the pending ones."""
+        del self.pending_job_states[: len(job_states)]
+        del self.pending_log_chunks[: len(log_chunks)]
+
     def interruptible_sleep(self):
         """Sleeps but stops sleeping if drain is made."""
         drain_before_sleep = EdgeWorker.drain
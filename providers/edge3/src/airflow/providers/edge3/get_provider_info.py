@@ -58,6 +58,27 @@ def get_provider_info():
                         "example": "5",
                         "default": "5",
                     },
+                    "job_long_poll_timeout": {
+                        "description": "If greater than zero, the Edge Worker long-polls for new jobs: the central site holds its request\nfor up to this many seconds until a job for the worker is queued, and hands out as many jobs as fit in\nthe free concurrency of the worker at once. This replaces the sleep of ``job_poll_interval`` between\npolls, so jobs are dispatched as soon as they are queued. While jobs are running, the worker waits for\nno longer than ``job_poll_interval`` (and the next heartbeat) to keep reporting on them.\nThe maximum is 300 seconds; higher values are capped to it.\nRequires the same version of this provider on the central site, and Airflow 3.\n",
+                        "version_added": "1.2.0",
+                        "type": "integer",
+                        "example": "30",
+                        "default": "0",
+                    },
+                    "job_poll_check_interval": {
+                        "description": "How often (in seconds) the API server checks for newly queued jobs on behalf of all the Edge Workers\nlong-polling it (see ``job_long_poll_timeout``). This is a single query for all of them.\n",
+                        "version_added": "1.2.0",
+                        "type": "float",
+                        "example": "1.0",
+                        "default": "1.0",
+                    },
+                    "batched_sync": {
+                        "description": "If enabled, the Edge Worker reports the state changes and pushes the log chunks of its jobs along with\nits heartbeat, in a single request per loop that the central site applies in one transaction, rather\nthan in a request per state change and per log chunk. Log chunks are sent compressed.\nRequires the same version of this provider on the central site, and Airflow 3.\n",
+                        "version_added": "1.2.0",
+                        "type": "boolean",
+                        "example": "True",
+                        "default": "False",
+                    },
                     "heartbeat_interval": {
                         "description": "Edge Worker continuously reports status to the central site. This parameter defines\nhow often a status with heartbeat should be sent.\nDuring heartbeat status is reported as well as it is checked if a running task is to be terminated.\n",
                         "version_added": None,
@@ -27,6 +27,10 @@ from pydantic import BaseModel, Field
 from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.providers.edge3.models.edge_worker import EdgeWorkerState  # noqa: TCH001
 from airflow.providers.edge3.worker_api.routes._v2_compat import ExecuteTask, Path
+from airflow.utils.state import TaskInstanceState  # noqa: TCH001
+
+MAX_WAIT_TIMEOUT = 300
+"""Maximum number of seconds a worker may wait for jobs in one poll request."""
 
 
 class WorkerApiDocs:
@@ -117,6 +121,28 @@ class WorkerQueuesBody(WorkerQueuesBase):
     free_concurrency: Annotated[int, Field(description="Number of free concurrency slots on the worker.")]
 
 
+class WorkerJobsPollBody(WorkerQueuesBody):
+    """Queues and capacity of a worker polling for jobs, and how long it is willing to wait for them."""
+
+    max_jobs: Annotated[
+        int, Field(ge=1, description="Maximum number of jobs to fetch. They all fit in the free concurrency.")
+    ] = 1
+    wait_timeout: Annotated[
+        float,
+        Field(
+            ge=0,
+            le=MAX_WAIT_TIMEOUT,
+            description="Number of seconds the request waits for a job to be queued if there is none yet.",
+        ),
+    ] = 0
+
+
+class EdgeJobsFetched(BaseModel):
+    """Jobs that are to be executed on the edge worker."""
+
+    jobs: Annotated[list[EdgeJobFetched], Field(description="Jobs fetched, empty if there was none.")]
+
+
 class WorkerStateBody(WorkerQueuesBase):
     """Details of the worker state sent to the scheduler."""
 
@@ -148,6 +174,34 @@ class WorkerStateBody(WorkerQueuesBase):
     ] = None
 
 
+class EdgeJobStateUpdate(EdgeJobBase):
+    """Change of the state of a job running on the edge worker."""
+
+    state: Annotated[TaskInstanceState, Field(description="State of the job.")]
+
+
+class EdgeJobLogChunk(EdgeJobBase):
+    """Incremental log chunk of a job running on the edge worker."""
+
+    log_chunk_time: Annotated[datetime, Field(description="Time of the log chunk at point of sending.")]
+    log_chunk_data: Annotated[
+        str, Field(description="Log chunk data as incremental log text, zlib compressed and base64 encoded.")
+    ]
+
+
+class WorkerSyncBody(WorkerStateBody):
+    """State of the worker, with the changes of the states and the log chunks of its jobs since the last sync."""
+
+    job_states: Annotated[
+        list[EdgeJobStateUpdate],
+        Field(description="Changes of the states of jobs, in the order they happened."),
+    ] = []
+    log_chunks: Annotated[
+        list[EdgeJobLogChunk],
+        Field(description="Log chunks of jobs, in the order they were read."),
+    ] = []
+
+
 class WorkerQueueUpdateBody(BaseModel):
     """Changed queues for the worker."""
 
@@ -17,15 +17,22 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Annotated
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 
+from airflow.configuration import conf
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
 from airflow.providers.edge3.worker_api.auth import jwt_token_authorization_rest
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobsFetched,
     WorkerApiDocs,
+    WorkerJobsPollBody,
     WorkerQueuesBody,
 )
 from airflow.providers.edge3.worker_api.routes._v2_compat import (
@@ -39,12 +46,127 @@ from airflow.providers.edge3.worker_api.routes._v2_compat import (
 )
 from airflow.stats import Stats
 from airflow.utils import timezone
+from airflow.utils.session import create_session
 from airflow.utils.sqlalchemy import with_row_locks
 from airflow.utils.state import TaskInstanceState
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+log = logging.getLogger(__name__)
+
 jobs_router = AirflowRouter(tags=["Jobs"], prefix="/jobs")
 
 
+def _fetch_jobs(
+    worker_name: str, body: WorkerQueuesBody, max_jobs: int, session: Session
+) -> list[EdgeJobFetched]:
+    """Assign the oldest queued jobs that fit in the free concurrency of the worker to it."""
+    query = (
+        select(EdgeJobModel)
+        .where(
+            EdgeJobModel.state == TaskInstanceState.QUEUED,
+            EdgeJobModel.concurrency_slots <= body.free_concurrency,
+        )
+        .order_by(EdgeJobModel.queued_dttm)
+    )
+    if body.queues:
+        query = query.where(EdgeJobModel.queue.in_(body.queues))
+    query = query.limit(max_jobs)
+    query = with_row_locks(query, of=EdgeJobModel, session=session, skip_locked=True)
+    jobs: list[EdgeJobModel] = []
+    free_concurrency = body.free_concurrency
+    for job in session.scalars(query):
+        if job.concurrency_slots > free_concurrency:
+            continue
+        job.state = TaskInstanceState.RUNNING
+        job.edge_worker = worker_name
+        job.last_update = timezone.utcnow()
+        free_concurrency -= job.concurrency_slots
+        jobs.append(job)
+    if not jobs:
+        return []
+    session.commit()
+    fetched = []
+    for job in jobs:
+        # Edge worker does not backport emitted Airflow metrics, so export some metrics
+        tags = {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue}
+        Stats.incr(f"edge_worker.ti.start.{job.queue}.{job.dag_id}.{job.task_id}", tags=tags)
+        Stats.incr("edge_worker.ti.start", tags=tags)
+        fetched.append(
+            EdgeJobFetched(
+                dag_id=job.dag_id,
+                task_id=job.task_id,
+                run_id=job.run_id,
+                map_index=job.map_index,
+                try_number=job.try_number,
+                command=parse_command(job.command),
+                concurrency_slots=job.concurrency_slots,
+            )
+        )
+    return fetched
+
+
+def _get_queued_job_slots() -> dict[str, int]:
+    """Return the queues with queued jobs, and the fewest concurrency slots one of their jobs needs."""
+    with create_session() as session:
+        query = (
+            select(EdgeJobModel.queue, func.min(EdgeJobModel.concurrency_slots))
+            .where(EdgeJobModel.state == TaskInstanceState.QUEUED)
+            .group_by(EdgeJobModel.queue)
+        )
+        return {queue: slots for queue, slots in session.execute(query)}
+
+
+class _QueuedJobsWatcher:
+    """
+    Wait for jobs to be queued on behalf of all the ``poll`` requests parked in this API server process.
+
+    Rather than each parked request looking for jobs, a single query every ``[edge] job_poll_check_interval``
+    seconds checks which queues have jobs, and wakes up the requests that could fetch one of them.
+    """
+
+    def __init__(self):
+        self._waiters: dict[asyncio.Future, tuple[list[str] | None, int]] = {}
+        self._task: asyncio.Task | None = None
+
+    async def wait(self, queues: list[str] | None, free_concurrency: int, timeout: float) -> None:
+        """Wait until a job the worker could fetch is queued, or for ``timeout`` seconds."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters[waiter] = (queues, free_concurrency)
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._watch())
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters.pop(waiter, None)
+
+    async def _watch(self) -> None:
+        from fastapi.concurrency import run_in_threadpool
+
+        check_interval = conf.getfloat("edge", "job_poll_check_interval", fallback=1.0)
+        while self._waiters:
+            try:
+                queued_job_slots = await run_in_threadpool(_get_queued_job_slots)
+            except Exception:
+                log.exception("Failed to check for queued jobs")
+                queued_job_slots = {}
+            for waiter, (queues, free_concurrency) in list(self._waiters.items()):
+                if not waiter.done() and any(
+                    slots <= free_concurrency
+                    for queue, slots in queued_job_slots.items()
+                    if not queues or queue in queues
+                ):
+                    waiter.set_result(None)
+            await asyncio.sleep(check_interval)
+
+
+_queued_jobs_watcher = _QueuedJobsWatcher()
+
+
 @jobs_router.post(
     "/fetch/{worker_name}",
     dependencies=[Depends(jwt_token_authorization_rest)],
@@ -67,38 +189,48 @@ def fetch(
     session: SessionDep,
 ) -> EdgeJobFetched | None:
     """Fetch a job to execute on the edge worker."""
-    query = (
-        select(EdgeJobModel)
-        .where(
-            EdgeJobModel.state == TaskInstanceState.QUEUED,
-            EdgeJobModel.concurrency_slots <= body.free_concurrency,
-        )
-        .order_by(EdgeJobModel.queued_dttm)
-    )
-    if body.queues:
-        query = query.where(EdgeJobModel.queue.in_(body.queues))
-    query = query.limit(1)
-    query = with_row_locks(query, of=EdgeJobModel, session=session, skip_locked=True)
-    job: EdgeJobModel = session.scalar(query)
-    if not job:
-        return None
-    job.state = TaskInstanceState.RUNNING
-    job.edge_worker = worker_name
-    job.last_update = timezone.utcnow()
-    session.commit()
-    # Edge worker does not backport emitted Airflow metrics, so export some metrics
-    tags = {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue}
-    Stats.incr(f"edge_worker.ti.start.{job.queue}.{job.dag_id}.{job.task_id}", tags=tags)
-    Stats.incr("edge_worker.ti.start", tags=tags)
-    return EdgeJobFetched(
-        dag_id=job.dag_id,
-        task_id=job.task_id,
-        run_id=job.run_id,
-        map_index=job.map_index,
-        try_number=job.try_number,
-        command=parse_command(job.command),
-        concurrency_slots=job.concurrency_slots,
-    )
+    jobs = _fetch_jobs(worker_name, body, max_jobs=1, session=session)
+    return jobs[0] if jobs else None
+
+
+@jobs_router.post(
+    "/poll/{worker_name}",
+    dependencies=[Depends(jwt_token_authorization_rest)],
+    responses=create_openapi_http_exception_doc(
+        [
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_403_FORBIDDEN,
+        ]
+    ),
+)
+async def poll(
+    worker_name: str,
+    body: Annotated[
+        WorkerJobsPollBody,
+        Body(
+            title="Poll parameters",
+            description="The queues and capacity from which the worker can fetch jobs, and how long to wait.",
+        ),
+    ],
+) -> EdgeJobsFetched:
+    """
+    Fetch jobs to execute on the edge worker, waiting for up to ``wait_timeout`` seconds if there is none.
+
+    Up to ``max_jobs`` jobs are fetched, as long as they fit in the free concurrency of the worker.
+    """
+    from fastapi.concurrency import run_in_threadpool
+
+    def fetch_jobs() -> list[EdgeJobFetched]:
+        with create_session() as session:
+            return _fetch_jobs(worker_name, body, max_jobs=body.max_jobs, session=session)
+
+    deadline = time.monotonic() + body.wait_timeout
+    while True:
+        jobs = await run_in_threadpool(fetch_jobs)
+        remaining = deadline - time.monotonic()
+        if jobs or remaining <= 0:
+            return EdgeJobsFetched(jobs=jobs)
+        await _queued_jobs_watcher.wait(body.queues, body.free_concurrency, remaining)
 
 
 @jobs_router.patch(
@@ -121,6 +253,14 @@ def state(
     session: SessionDep,
 ) -> None:
     """Update the state of a job running on the edge worker."""
+    _set_job_state(
+        TaskInstanceKey(dag_id, task_id, run_id, try_number, map_index), state=state, session=session
+    )
+
+
+def _set_job_state(key: TaskInstanceKey, state: TaskInstanceState, session: Session) -> None:
+    """Update the state of a job running on an edge worker, without committing."""
+    dag_id, task_id, run_id, try_number, map_index = key
     # execute query to catch the queue and check if state toggles to success or failed
     # otherwise possible that Executor resets orphaned jobs and stats are exported 2 times
     if state in [TaskInstanceState.SUCCESS, state == TaskInstanceState.FAILED]:
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
@@ -38,6 +39,9 @@ from airflow.providers.edge3.worker_api.routes._v2_compat import (
 from airflow.utils.log.file_task_handler import FileTaskHandler
 from airflow.utils.session import NEW_SESSION, provide_session
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 logs_router = AirflowRouter(tags=["Logs"], prefix="/logs")
 
 
@@ -108,20 +112,31 @@ def push_logs(
     session: SessionDep,
 ) -> None:
     """Push an incremental log chunk from Edge Worker to central site."""
-    log_chunk = EdgeLogsModel(
-        dag_id=dag_id,
-        task_id=task_id,
-        run_id=run_id,
-        map_index=map_index,
-        try_number=try_number,
-        log_chunk_time=body.log_chunk_time,
-        log_chunk_data=body.log_chunk_data,
-    )
-    session.add(log_chunk)
-    # Write logs to local file to make them accessible
     task = TaskInstanceKey(
         dag_id=dag_id, task_id=task_id, run_id=run_id, try_number=try_number, map_index=map_index
     )
+    _push_log_chunk(task, body.log_chunk_time, body.log_chunk_data, session=session)
+    _write_log_chunk(task, body.log_chunk_data)
+
+
+def _push_log_chunk(
+    task: TaskInstanceKey, log_chunk_time: datetime, log_chunk_data: str, session: Session
+) -> None:
+    """Store an incremental log chunk of a job, without committing."""
+    log_chunk = EdgeLogsModel(
+        dag_id=task.dag_id,
+        task_id=task.task_id,
+        run_id=task.run_id,
+        map_index=task.map_index,
+        try_number=task.try_number,
+        log_chunk_time=log_chunk_time,
+        log_chunk_data=log_chunk_data,
+    )
+    session.add(log_chunk)
+
+
+def _write_log_chunk(task: TaskInstanceKey, log_chunk_data: str) -> None:
+    """Append an incremental log chunk of a job to its log file, to make it accessible."""
     base_log_folder = conf.get("logging", "base_log_folder", fallback="NOT AVAILABLE")
     logfile_path = Path(base_log_folder, _logfile_path(task))
     if not logfile_path.exists():
@@ -130,4 +145,4 @@ def push_logs(
         )
         logfile_path.parent.mkdir(parents=True, exist_ok=True, mode=new_folder_permissions)
     with logfile_path.open("a") as logfile:
-        logfile.write(body.log_chunk_data)
+        logfile.write(log_chunk_data)
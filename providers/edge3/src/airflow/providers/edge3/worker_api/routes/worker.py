@@ -17,8 +17,10 @@
 
 from __future__ import annotations
 
+import base64
 import json
-from typing import Annotated
+import zlib
+from typing import TYPE_CHECKING, Annotated
 
 from sqlalchemy import select
 
@@ -29,6 +31,7 @@ from airflow.providers.edge3.worker_api.datamodels import (
     WorkerRegistrationReturn,
     WorkerSetStateReturn,
     WorkerStateBody,
+    WorkerSyncBody,
 )
 from airflow.providers.edge3.worker_api.routes._v2_compat import (
     AirflowRouter,
@@ -40,9 +43,16 @@ from airflow.providers.edge3.worker_api.routes._v2_compat import (
     create_openapi_http_exception_doc,
     status,
 )
+from airflow.providers.edge3.worker_api.routes.jobs import _set_job_state
+from airflow.providers.edge3.worker_api.routes.logs import _push_log_chunk, _write_log_chunk
 from airflow.stats import Stats
 from airflow.utils import timezone
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from airflow.models.taskinstancekey import TaskInstanceKey
+
 worker_router = AirflowRouter(
     tags=["Worker"],
     prefix="/worker",
@@ -193,6 +203,10 @@ def set_state(
     session: SessionDep,
 ) -> WorkerSetStateReturn:
     """Set state of worker and returns the current assigned queues."""
+    return _set_worker_state(worker_name, body, session)
+
+
+def _set_worker_state(worker_name: str, body: WorkerStateBody, session: Session) -> WorkerSetStateReturn:
     query = select(EdgeWorkerModel).where(EdgeWorkerModel.worker_name == worker_name)
     worker: EdgeWorkerModel = session.scalar(query)
     worker.state = redefine_state(worker.state, body.state)
@@ -219,6 +233,44 @@ def set_state(
     )
 
 
+@worker_router.post("/sync/{worker_name}", dependencies=[Depends(jwt_token_authorization_rest)])
+def sync(
+    worker_name: Annotated[str, _worker_name_doc],
+    body: Annotated[
+        WorkerSyncBody,
+        Body(
+            title="Worker State, job states and logs",
+            description="State of the worker, with the changes of the states and the log chunks of its jobs",
+        ),
+    ],
+    session: SessionDep,
+) -> WorkerSetStateReturn:
+    """
+    Apply the changes of the states and the log chunks of the jobs of a worker, and set its state.
+
+    Everything is applied in a single transaction. Returns the current assigned queues.
+    """
+    for job_state in body.job_states:
+        _set_job_state(job_state.key, job_state.state, session=session)
+    log_chunks: list[tuple[TaskInstanceKey, str]] = []
+    for log_chunk in body.log_chunks:
+        log_chunk_data = zlib.decompress(base64.b64decode(log_chunk.log_chunk_data)).decode()
+        _push_log_chunk(log_chunk.key, log_chunk.log_chunk_time, log_chunk_data, session=session)
+        log_chunks.append((log_chunk.key, log_chunk_data))
+    # Commits the job states and log chunks along with the state of the worker. The log chunks are only
+    # appended to the log files once committed, as the worker sends them again if the sync fails.
+    try:
+        worker_state = _set_worker_state(worker_name, body, session)
+    except HTTPException:
+        # A version mismatch is only rejected once everything is committed
+        for key, log_chunk_data in log_chunks:
+            _write_log_chunk(key, log_chunk_data)
+        raise
+    for key, log_chunk_data in log_chunks:
+        _write_log_chunk(key, log_chunk_data)
+    return worker_state
+
+
 @worker_router.patch(
     "/queues/{worker_name}",
     dependencies=[Depends(jwt_token_authorization_rest)],
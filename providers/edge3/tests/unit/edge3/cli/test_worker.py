@@ -28,7 +28,7 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 import time_machine
-from requests import HTTPError, Response
+from requests import ConnectionError, HTTPError, Response
 
 from airflow.cli import cli_parser
 from airflow.executors import executor_loader
@@ -257,6 +257,75 @@ class TestEdgeWorker:
             assert mock_logfile_path.call_count == logfile_path_call_count
         assert mock_set_state.call_count == set_state_call_count
 
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Long-poll is only available in Airflow 3")
+    @pytest.mark.parametrize(
+        ("running_jobs", "expected_wait_timeout"),
+        [pytest.param(0, 60, id="idle"), pytest.param(1, 5, id="running_jobs")],
+    )
+    @patch("airflow.providers.edge3.cli.worker.jobs_poll")
+    @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker._launch_job")
+    def test_poll_jobs(
+        self,
+        mock_launch_job,
+        mock_set_state,
+        mock_jobs_poll,
+        running_jobs,
+        expected_wait_timeout,
+        worker_with_job: EdgeWorker,
+    ):
+        EdgeWorker.jobs = EdgeWorker.jobs[:running_jobs]
+        worker_with_job.job_long_poll_timeout = 60
+        worker_with_job.hb_interval = 120
+        worker_with_job.last_hb = datetime.now()
+        worker_with_job.free_concurrency = 4
+        edge_jobs = [
+            EdgeJobFetched(
+                dag_id="test",
+                task_id=f"test_{i}",
+                run_id="test",
+                map_index=-1,
+                try_number=1,
+                concurrency_slots=2,
+                command=MOCK_COMMAND,  # type: ignore[arg-type]
+            )
+            for i in range(2)
+        ]
+        mock_jobs_poll.return_value = edge_jobs
+
+        assert worker_with_job.poll_jobs()
+
+        mock_jobs_poll.assert_called_once_with(
+            "mock", None, 4, max_jobs=4, wait_timeout=pytest.approx(expected_wait_timeout, abs=1)
+        )
+        assert mock_launch_job.mock_calls == [call(edge_job) for edge_job in edge_jobs]
+        assert mock_set_state.mock_calls == [
+            call(edge_job.key, TaskInstanceState.RUNNING) for edge_job in edge_jobs
+        ]
+        assert worker_with_job.free_concurrency == 0
+
+    def test_long_poll_timeout_is_capped(self, tmp_path: Path):
+        test_worker = EdgeWorker(str(tmp_path / "mock.pid"), "mock", None, 8, 5, 5, job_long_poll_timeout=600)
+        assert test_worker.job_long_poll_timeout == 300
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Long-poll is only available in Airflow 3")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.poll_jobs", return_value=False)
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.fetch_job")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.check_running_jobs")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.interruptible_sleep")
+    def test_loop_long_poll_does_not_sleep(
+        self, mock_sleep, mock_check_running_jobs, mock_fetch_job, mock_poll_jobs, worker_with_job: EdgeWorker
+    ):
+        worker_with_job.job_long_poll_timeout = 30
+        worker_with_job.last_hb = datetime.now()
+        worker_with_job.worker_state_changed = False
+
+        worker_with_job.loop()
+
+        mock_poll_jobs.assert_called_once()
+        mock_fetch_job.assert_not_called()
+        mock_sleep.assert_not_called()
+
     def test_check_running_jobs_running(self, worker_with_job: EdgeWorker):
         assert worker_with_job.free_concurrency == worker_with_job.concurrency
         with conf_vars({("edge", "api_url"): "https://invalid-api-test-endpoint"}):
@@ -382,6 +451,103 @@ class TestEdgeWorker:
         assert "queue1" in (queue_list)
         assert "queue2" in (queue_list)
 
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Batched sync is only available in Airflow 3")
+    @patch("airflow.providers.edge3.cli.worker.logs_push")
+    @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
+    @patch("airflow.providers.edge3.cli.worker.worker_set_state")
+    @patch("airflow.providers.edge3.cli.worker.worker_sync")
+    def test_batched_sync(
+        self, mock_sync, mock_set_state, mock_jobs_set_state, mock_logs_push, worker_with_job: EdgeWorker
+    ):
+        worker_with_job.batched_sync = True
+        EdgeWorker.drain = False
+        EdgeWorker.maintenance_mode = False
+        job = EdgeWorker.jobs[0]
+        job.logfile.write_text("some log")
+        job.process.generated_returncode = 0  # type: ignore[union-attr]
+        mock_sync.return_value = WorkerSetStateReturn(state=EdgeWorkerState.IDLE, queues=None)
+
+        with conf_vars({("edge", "push_log_chunk_size"): "4"}):
+            worker_with_job.check_running_jobs()
+
+        assert worker_with_job.pending_job_states == [(job.edge_job.key, TaskInstanceState.SUCCESS)]
+        assert [(key, data) for key, _, data in worker_with_job.pending_log_chunks] == [
+            (job.edge_job.key, "some"),
+            (job.edge_job.key, " log"),
+        ]
+        job_states, log_chunks = (
+            list(worker_with_job.pending_job_states),
+            list(worker_with_job.pending_log_chunks),
+        )
+
+        worker_with_job.heartbeat()
+
+        mock_sync.assert_called_once_with(
+            "mock",
+            EdgeWorkerState.IDLE,
+            0,
+            None,
+            worker_with_job._get_sysinfo(),
+            None,
+            job_states=job_states,
+            log_chunks=log_chunks,
+        )
+        assert worker_with_job.pending_job_states == []
+        assert worker_with_job.pending_log_chunks == []
+        mock_set_state.assert_not_called()
+        mock_jobs_set_state.assert_not_called()
+        mock_logs_push.assert_not_called()
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Batched sync is only available in Airflow 3")
+    @patch("airflow.providers.edge3.cli.worker.worker_sync")
+    def test_batched_sync_error_keeps_pending(self, mock_sync, worker_with_job: EdgeWorker):
+        worker_with_job.batched_sync = True
+        EdgeWorker.drain = False
+        key = EdgeWorker.jobs[0].edge_job.key
+        worker_with_job.pending_job_states = [(key, TaskInstanceState.SUCCESS)]
+        worker_with_job.pending_log_chunks = [(key, timezone.utcnow(), "some log")]
+        job_states, log_chunks = (
+            list(worker_with_job.pending_job_states),
+            list(worker_with_job.pending_log_chunks),
+        )
+        mock_sync.side_effect = ConnectionError("Connection refused")
+
+        with pytest.raises(ConnectionError):
+            worker_with_job.heartbeat()
+
+        assert worker_with_job.pending_job_states == job_states
+        assert worker_with_job.pending_log_chunks == log_chunks
+
+        mock_sync.side_effect = EdgeWorkerVersionException("")
+        worker_with_job.heartbeat()
+
+        assert EdgeWorker.drain
+        assert worker_with_job.pending_job_states == []
+        assert worker_with_job.pending_log_chunks == []
+        EdgeWorker.drain = False
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Batched sync is only available in Airflow 3")
+    @patch("airflow.providers.edge3.cli.worker.worker_sync")
+    def test_batched_sync_without_pending(self, mock_sync, worker_with_job: EdgeWorker):
+        worker_with_job.batched_sync = True
+        EdgeWorker.drain = False
+        EdgeWorker.maintenance_mode = False
+        key = EdgeWorker.jobs[0].edge_job.key
+        worker_with_job.pending_job_states = [(key, TaskInstanceState.SUCCESS)]
+        worker_with_job.pending_log_chunks = [(key, timezone.utcnow(), "some log")]
+        job_states, log_chunks = (
+            list(worker_with_job.pending_job_states),
+            list(worker_with_job.pending_log_chunks),
+        )
+        mock_sync.return_value = WorkerSetStateReturn(state=EdgeWorkerState.IDLE, queues=None)
+
+        # As the heartbeat of the signal handler does
+        worker_with_job.heartbeat(send_pending=False)
+
+        assert mock_sync.call_args.kwargs == {"job_states": [], "log_chunks": []}
+        assert worker_with_job.pending_job_states == job_states
+        assert worker_with_job.pending_log_chunks == log_chunks
+
     @patch("airflow.providers.edge3.cli.worker.worker_set_state")
     def test_version_mismatch(self, mock_set_state, worker_with_job):
         mock_set_state.side_effect = EdgeWorkerVersionException("")
@@ -16,16 +16,23 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
-from airflow.providers.edge3.worker_api.routes.jobs import state
+from airflow.providers.edge3.worker_api.datamodels import WorkerJobsPollBody
+from airflow.providers.edge3.worker_api.routes.jobs import _queued_jobs_watcher, poll, state
+from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import TaskInstanceState
 
+from tests_common.test_utils.config import conf_vars
+from tests_common.test_utils.version_compat import AIRFLOW_V_3_0_PLUS
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -38,6 +45,46 @@ RUN_ID = "manual__2024-11-24T21:03:01+01:00"
 QUEUE = "test"
 
 
+def _queue_job(task_id: str, queue: str = QUEUE, concurrency_slots: int = 1) -> None:
+    from uuid6 import uuid7
+
+    from airflow.executors.workloads import ExecuteTask, TaskInstance
+
+    command = ExecuteTask(
+        token="",
+        ti=TaskInstance(
+            id=uuid7(),
+            dag_version_id=uuid7(),
+            task_id=task_id,
+            dag_id=DAG_ID,
+            run_id=RUN_ID,
+            try_number=1,
+            map_index=-1,
+            pool_slots=1,
+            queue=queue,
+            priority_weight=1,
+        ),
+        dag_rel_path="dag.py",
+        bundle_info={"name": "bundle", "version": None},
+        log_path=None,
+    )
+    with create_session() as session:
+        session.add(
+            EdgeJobModel(
+                dag_id=DAG_ID,
+                task_id=task_id,
+                run_id=RUN_ID,
+                try_number=1,
+                map_index=-1,
+                state=TaskInstanceState.QUEUED,
+                queue=queue,
+                concurrency_slots=concurrency_slots,
+                command=command.model_dump_json(),
+                queued_dttm=timezone.utcnow(),
+            )
+        )
+
+
 class TestJobsApiRoutes:
     @pytest.fixture(autouse=True)
     def setup_test_cases(self, dag_maker, session: Session):
@@ -94,3 +141,61 @@ class TestJobsApiRoutes:
             mock_stats_incr.call_count == 2
 
             assert session.query(EdgeJobModel).scalar().state == TaskInstanceState.SUCCESS
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Long-poll is only available in Airflow 3")
+    async def test_poll_fetches_jobs_fitting_in_free_concurrency(self):
+        _queue_job("task_1", concurrency_slots=2)
+        _queue_job("task_2", concurrency_slots=2)
+        _queue_job("task_3", concurrency_slots=1)
+        _queue_job("task_4", queue="other")
+
+        result = await poll(
+            "worker", WorkerJobsPollBody(queues=[QUEUE], free_concurrency=3, max_jobs=3, wait_timeout=0)
+        )
+
+        assert [job.task_id for job in result.jobs] == ["task_1", "task_3"]
+        with create_session() as session:
+            running = session.query(EdgeJobModel).filter_by(state=TaskInstanceState.RUNNING).all()
+            assert {(job.task_id, job.edge_worker) for job in running} == {
+                ("task_1", "worker"),
+                ("task_3", "worker"),
+            }
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Long-poll is only available in Airflow 3")
+    async def test_poll_waits_for_job_to_be_queued(self):
+        body = WorkerJobsPollBody(queues=[QUEUE], free_concurrency=1, max_jobs=1, wait_timeout=10)
+        with conf_vars({("edge", "job_poll_check_interval"): "0.05"}):
+            polls = [asyncio.create_task(poll(f"worker_{i}", body)) for i in range(2)]
+            await asyncio.sleep(0.2)
+            assert not any(p.done() for p in polls)
+
+            _queue_job("task_1", queue="other")
+            _queue_job("task_2", concurrency_slots=2)
+            await asyncio.sleep(0.2)
+            assert not any(p.done() for p in polls)
+
+            start = time.monotonic()
+            _queue_job("task_3")
+            done, pending = await asyncio.wait(polls, return_when=asyncio.FIRST_COMPLETED)
+
+        assert time.monotonic() - start < 5
+        assert [job.task_id for job in done.pop().result().jobs] == ["task_3"]
+        for p in pending:
+            p.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        # The watcher stops once no request waits anymore
+        await asyncio.wait_for(_queued_jobs_watcher._task, 5)
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Long-poll is only available in Airflow 3")
+    async def test_poll_times_out(self):
+        start = time.monotonic()
+
+        with conf_vars({("edge", "job_poll_check_interval"): "0.05"}):
+            result = await poll("worker", WorkerJobsPollBody(free_concurrency=1, wait_timeout=0.3))
+
+        assert result.jobs == []
+        assert 0.3 <= time.monotonic() - start < 5
+        await asyncio.wait_for(_queued_jobs_watcher._task, 5)
@@ -16,22 +16,37 @@
 # under the License.
 from __future__ import annotations
 
+import base64
+import zlib
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
 from airflow.providers.edge3.cli.worker import EdgeWorker
+from airflow.providers.edge3.models.edge_job import EdgeJobModel
+from airflow.providers.edge3.models.edge_logs import EdgeLogsModel
 from airflow.providers.edge3.models.edge_worker import EdgeWorkerModel, EdgeWorkerState
-from airflow.providers.edge3.worker_api.datamodels import WorkerQueueUpdateBody, WorkerStateBody
+from airflow.providers.edge3.worker_api.datamodels import (
+    EdgeJobLogChunk,
+    EdgeJobStateUpdate,
+    WorkerQueueUpdateBody,
+    WorkerStateBody,
+    WorkerSyncBody,
+)
 from airflow.providers.edge3.worker_api.routes._v2_compat import HTTPException
 from airflow.providers.edge3.worker_api.routes.worker import (
     _assert_version,
     register,
     set_state,
+    sync,
     update_queues,
 )
 from airflow.utils import timezone
+from airflow.utils.state import TaskInstanceState
+
+from tests_common.test_utils.config import conf_vars
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -196,6 +211,104 @@ class TestWorkerApiRoutes:
         assert worker[0].queues == queues
         assert return_queues == ["default", "default2"]
 
+    @patch("airflow.providers.edge3.worker_api.routes.logs._logfile_path", return_value="task.log")
+    def test_sync(self, mock_logfile_path, tmp_path: Path, session: Session, cli_worker: EdgeWorker):
+        session.query(EdgeJobModel).delete()
+        session.query(EdgeLogsModel).delete()
+        session.add(
+            EdgeWorkerModel(
+                worker_name="test2_worker",
+                state=EdgeWorkerState.IDLE,
+                queues=["default"],
+                first_online=timezone.utcnow(),
+            )
+        )
+        job_keys = {"dag_id": "dag", "run_id": "run", "map_index": -1, "try_number": 1}
+        for task_id in ("task_1", "task_2"):
+            session.add(
+                EdgeJobModel(
+                    **job_keys,
+                    task_id=task_id,
+                    state=TaskInstanceState.QUEUED,
+                    queue="default",
+                    concurrency_slots=1,
+                    command="execute",
+                )
+            )
+        session.commit()
+        log_chunk_time = timezone.utcnow()
+
+        body = WorkerSyncBody(
+            state=EdgeWorkerState.RUNNING,
+            jobs_active=1,
+            queues=["default"],
+            sysinfo=cli_worker._get_sysinfo(),
+            job_states=[
+                EdgeJobStateUpdate(**job_keys, task_id="task_1", state=TaskInstanceState.RUNNING),
+                EdgeJobStateUpdate(**job_keys, task_id="task_2", state=TaskInstanceState.RUNNING),
+                EdgeJobStateUpdate(**job_keys, task_id="task_1", state=TaskInstanceState.SUCCESS),
+            ],
+            log_chunks=[
+                EdgeJobLogChunk(
+                    **job_keys,
+                    task_id="task_2",
+                    log_chunk_time=log_chunk_time,
+                    log_chunk_data=base64.b64encode(zlib.compress(b"some log")).decode(),
+                )
+            ],
+        )
+        with conf_vars({("logging", "base_log_folder"): str(tmp_path)}):
+            result = sync("test2_worker", body, session)
+
+        session.expire_all()
+        assert result.queues == ["default"]
+        assert session.query(EdgeWorkerModel).one().state == EdgeWorkerState.RUNNING
+        assert {job.task_id: job.state for job in session.query(EdgeJobModel)} == {
+            "task_1": TaskInstanceState.SUCCESS,
+            "task_2": TaskInstanceState.RUNNING,
+        }
+        log_chunk = session.query(EdgeLogsModel).one()
+        assert (log_chunk.task_id, log_chunk.log_chunk_data) == ("task_2", "some log")
+        assert (tmp_path / "task.log").read_text() == "some log"
+
+    @patch("airflow.providers.edge3.worker_api.routes.logs._logfile_path", return_value="task.log")
+    @patch(
+        "airflow.providers.edge3.worker_api.routes.worker._set_worker_state",
+        side_effect=RuntimeError("commit failed"),
+    )
+    def test_sync_failure_does_not_write_logs(
+        self,
+        mock_set_worker_state,
+        mock_logfile_path,
+        tmp_path: Path,
+        session: Session,
+        cli_worker: EdgeWorker,
+    ):
+        body = WorkerSyncBody(
+            state=EdgeWorkerState.RUNNING,
+            jobs_active=1,
+            queues=["default"],
+            sysinfo=cli_worker._get_sysinfo(),
+            log_chunks=[
+                EdgeJobLogChunk(
+                    dag_id="dag",
+                    task_id="task",
+                    run_id="run",
+                    map_index=-1,
+                    try_number=1,
+                    log_chunk_time=timezone.utcnow(),
+                    log_chunk_data=base64.b64encode(zlib.compress(b"some log")).decode(),
+                )
+            ],
+        )
+        with conf_vars({("logging", "base_log_folder"): str(tmp_path)}):
+            with pytest.raises(RuntimeError):
+                sync("test2_worker", body, session)
+
+        # The worker sends the log chunk again, it is only written to the log file once committed
+        assert not (tmp_path / "task.log").exists()
+        session.rollback()
+
     @pytest.mark.parametrize(
         "add_queues, remove_queues, expected_queues",
         [
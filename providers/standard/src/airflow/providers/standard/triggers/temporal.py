@@ -57,6 +57,13 @@ class DateTimeTrigger(BaseTrigger):
             {"moment": self.moment, "end_from_trigger": self.end_from_trigger},
         )
 
+    def timer(self) -> tuple[datetime.datetime, TriggerEvent] | None:
+        """Let the triggerer fire the event from a timer, rather than running the trigger."""
+        if type(self).run is not DateTimeTrigger.run:
+            # A subclass that does more than wait
+            return None
+        return self.moment, TaskSuccessEvent() if self.end_from_trigger else TriggerEvent(self.moment)
+
     async def run(self) -> AsyncIterator[TriggerEvent]:
         """
         Loop until the relevant time is met.
@@ -143,3 +143,22 @@ async def test_datetime_trigger_mocked(mock_sleep, mock_utcnow):
     result = trigger_task.result()
     assert isinstance(result, TriggerEvent)
     assert result.payload == trigger_moment
+
+
+@pytest.mark.parametrize("end_from_trigger", [True, False])
+def test_datetime_trigger_timer(end_from_trigger):
+    moment = pendulum.instance(timezone.utcnow() + datetime.timedelta(seconds=60))
+
+    when, event = DateTimeTrigger(moment, end_from_trigger=end_from_trigger).timer()
+
+    assert when == moment
+    assert event.payload == (TaskInstanceState.SUCCESS if end_from_trigger else moment)
+
+
+def test_datetime_trigger_subclass_with_own_run_has_no_timer():
+    class CustomTrigger(DateTimeTrigger):
+        async def run(self):
+            yield TriggerEvent("custom")
+
+    assert TimeDeltaTrigger(datetime.timedelta(seconds=10)).timer() is not None
+    assert CustomTrigger(timezone.utcnow()).timer() is None
@@ -49,6 +49,10 @@ from airflow.sdk.api.datamodels._generated import (
     TaskInstanceState,
     TaskStatesResponse,
     TerminalStateNonSuccess,
+    TIBulkStateUpdate,
+    TIBulkStateUpdateItem,
+    TIBulkStateUpdateResponse,
+    TIBulkStateUpdateResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -153,6 +157,7 @@ def getuser() -> str:
 log = structlog.get_logger(logger_name=__name__)
 
 __all__ = [
+    "AsyncClient",
     "Client",
     "ConnectionOperations",
     "ServerResponseError",
@@ -233,6 +238,17 @@ class TaskInstanceOperations:
         )
         self.client.patch(f"task-instances/{id}/state", content=body.model_dump_json())
 
+    def bulk_update_state(self, updates: list[TIBulkStateUpdateItem]) -> list[TIBulkStateUpdateResult]:
+        """
+        Move many task instances to a terminal state in one request.
+
+        Each item carries the token of its own task instance. A result is returned for every item, in the
+        same order, with the status code the single-item state update would have responded with.
+        """
+        body = TIBulkStateUpdate(updates=updates)
+        resp = self.client.patch("task-instances/states", content=body.model_dump_json())
+        return TIBulkStateUpdateResponse.model_validate_json(resp.read()).results
+
     def defer(self, id: uuid.UUID, msg):
         """Tell the API server that this TI has been deferred."""
         body = TIDeferredStatePayload(**msg.model_dump(exclude_unset=True, exclude={"type"}))
@@ -342,6 +358,58 @@ class TaskInstanceOperations:
         return InactiveAssetsResponse.model_validate_json(resp.read())
 
 
+class BulkStateUpdater:
+    """
+    Collect terminal state updates for many task instances and send them together.
+
+    Updates are sent once ``max_batch_size`` of them have been added, or when :meth:`flush` is called
+    (including on leaving the ``with`` block). This is meant for processes that see many task instances
+    finish at once, to use one request and one database transaction for all of them instead of one each.
+    """
+
+    def __init__(self, client: Client, max_batch_size: int = 100):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.pending: list[TIBulkStateUpdateItem] = []
+        self.results: list[TIBulkStateUpdateResult] = []
+
+    def __enter__(self) -> BulkStateUpdater:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
+
+    def add(
+        self,
+        id: uuid.UUID,
+        token: str,
+        payload: TITerminalStatePayload | TISuccessStatePayload | TIRetryStatePayload,
+    ) -> None:
+        """Queue a state update, sending the batch if it is now full."""
+        self.pending.append(TIBulkStateUpdateItem(task_instance_id=id, token=token, payload=payload))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+
+    def flush(self) -> list[TIBulkStateUpdateResult]:
+        """Send all queued updates, returning their results."""
+        if not self.pending:
+            return []
+        batch, self.pending = self.pending, []
+        results = self.client.task_instances.bulk_update_state(batch)
+        for result in results:
+            if result.status_code >= 400:
+                log.warning(
+                    "Failed to update task instance state",
+                    ti_id=str(result.task_instance_id),
+                    status_code=result.status_code,
+                    detail=result.detail,
+                )
+        self.results.extend(results)
+        return results
+
+
 class ConnectionOperations:
     __slots__ = ("client",)
 
@@ -808,40 +876,56 @@ API_RETRY_WAIT_MAX = conf.getfloat("workers", "execution_api_retry_wait_max")
 API_SSL_CERT_PATH = conf.get("api", "ssl_cert")
 
 
+def _client_kwargs(
+    *, base_url: str | None, dry_run: bool, token: str, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    """Build the keyword arguments shared by the sync and async httpx clients."""
+    if (not base_url) ^ dry_run:
+        raise ValueError(f"Can only specify one of {base_url=} or {dry_run=}")
+
+    if dry_run:
+        # If dry run is requested, install a no op handler so that simple tasks can "heartbeat" using a
+        # real client, but just don't make any HTTP requests
+        kwargs.setdefault("transport", httpx.MockTransport(noop_handler))
+        kwargs.setdefault("base_url", "dry-run://server")
+    else:
+        kwargs["base_url"] = base_url
+        ctx = ssl.create_default_context(cafile=certifi.where())
+        if API_SSL_CERT_PATH:
+            ctx.load_verify_locations(API_SSL_CERT_PATH)
+        kwargs["verify"] = ctx
+    pyver = f"{'.'.join(map(str, sys.version_info[:3]))}"
+    return {
+        "auth": BearerAuth(token),
+        "headers": {
+            "user-agent": f"apache-airflow-task-sdk/{__version__} (Python/{pyver})",
+            "airflow-api-version": API_VERSION,
+        },
+        **kwargs,
+    }
+
+
+def _refresh_auth(client: httpx.Client | httpx.AsyncClient, response: httpx.Response) -> None:
+    if new_token := response.headers.get("Refreshed-API-Token"):
+        log.debug("Execution API issued us a refreshed Task token")
+        if isinstance(client.auth, BearerAuth):
+            # Update in place, so that every client sharing this auth object picks up the new token
+            client.auth.token = new_token
+        else:
+            client.auth = BearerAuth(new_token)
+
+
 class Client(httpx.Client):
     def __init__(self, *, base_url: str | None, dry_run: bool = False, token: str, **kwargs: Any):
-        if (not base_url) ^ dry_run:
-            raise ValueError(f"Can only specify one of {base_url=} or {dry_run=}")
-        auth = BearerAuth(token)
-
-        if dry_run:
-            # If dry run is requested, install a no op handler so that simple tasks can "heartbeat" using a
-            # real client, but just don't make any HTTP requests
-            kwargs.setdefault("transport", httpx.MockTransport(noop_handler))
-            kwargs.setdefault("base_url", "dry-run://server")
-        else:
-            kwargs["base_url"] = base_url
-            ctx = ssl.create_default_context(cafile=certifi.where())
-            if API_SSL_CERT_PATH:
-                ctx.load_verify_locations(API_SSL_CERT_PATH)
-            kwargs["verify"] = ctx
-        pyver = f"{'.'.join(map(str, sys.version_info[:3]))}"
         super().__init__(
-            auth=auth,
-            headers={
-                "user-agent": f"apache-airflow-task-sdk/{__version__} (Python/{pyver})",
-                "airflow-api-version": API_VERSION,
-            },
             event_hooks={"response": [self._update_auth, raise_on_4xx_5xx], "request": [add_correlation_id]},
-            **kwargs,
+            **_client_kwargs(base_url=base_url, dry_run=dry_run, token=token, kwargs=kwargs),
         )
 
     _default_wait = wait_random_exponential(min=API_RETRY_WAIT_MIN, max=API_RETRY_WAIT_MAX)
 
     def _update_auth(self, response: httpx.Response):
-        if new_token := response.headers.get("Refreshed-API-Token"):
-            log.debug("Execution API issued us a refreshed Task token")
-            self.auth = BearerAuth(new_token)
+        _refresh_auth(self, response)
 
     @retry(
         reraise=True,
@@ -909,6 +993,73 @@ class Client(httpx.Client):
         return HITLOperations(self)
 
 
+class AsyncTaskInstanceOperations:
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def heartbeat(self, id: uuid.UUID, pid: int):
+        body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
+        await self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
+
+
+async def _araise_on_4xx_5xx(response: httpx.Response):
+    if response.is_error:
+        # Unlike the sync client, the body hasn't been read yet when the response hooks run
+        await response.aread()
+    raise_on_4xx_5xx(response)
+
+
+async def _aadd_correlation_id(request: httpx.Request):
+    add_correlation_id(request)
+
+
+class AsyncClient(httpx.AsyncClient):
+    """
+    Asyncio counterpart of :class:`Client`, for talking to the Execution API from an event loop.
+
+    It is configured, authenticated and retries requests exactly as :class:`Client` does. Assigning the
+    ``auth`` of a sync client to it (``async_client.auth = client.auth``) makes both share one token, so a
+    token refreshed by a response to either of them is used by both.
+
+    Only the task instance heartbeat is implemented so far, the other requests go through :class:`Client`.
+    """
+
+    def __init__(self, *, base_url: str | None, dry_run: bool = False, token: str, **kwargs: Any):
+        super().__init__(
+            event_hooks={
+                "response": [self._update_auth, _araise_on_4xx_5xx],
+                "request": [_aadd_correlation_id],
+            },
+            **_client_kwargs(base_url=base_url, dry_run=dry_run, token=token, kwargs=kwargs),
+        )
+
+    _default_wait = wait_random_exponential(min=API_RETRY_WAIT_MIN, max=API_RETRY_WAIT_MAX)
+
+    async def _update_auth(self, response: httpx.Response):
+        _refresh_auth(self, response)
+
+    @retry(
+        reraise=True,
+        max_attempt_number=API_RETRIES,
+        wait_server_errors=_default_wait,
+        wait_network_errors=_default_wait,
+        wait_timeouts=_default_wait,
+        wait_rate_limited=wait_retry_after(fallback=_default_wait),  # No infinite timeout on HTTP 429
+        before_sleep=before_log(log, logging.WARNING),
+    )
+    async def request(self, *args, **kwargs):
+        """Implement a convenience for httpx.AsyncClient.request with a retry layer."""
+        return await super().request(*args, **kwargs)
+
+    @lru_cache()  # type: ignore[misc]
+    @property
+    def task_instances(self) -> AsyncTaskInstanceOperations:
+        """Operations related to TaskInstances."""
+        return AsyncTaskInstanceOperations(self)
+
+
 # This is only used for parsing. ServerResponseError is raised instead
 class _ErrorBody(BaseModel):
     detail: list[RemoteValidationError] | str
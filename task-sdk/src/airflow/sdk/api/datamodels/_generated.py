@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2025-08-10"
+API_VERSION: Final[str] = "2025-09-23"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -212,6 +212,16 @@ class PrevSuccessfulDagRunResponse(BaseModel):
     end_date: Annotated[AwareDatetime | None, Field(title="End Date")] = None
 
 
+class TIBulkStateUpdateResult(BaseModel):
+    """
+    Outcome of a single item in a bulk state update.
+    """
+
+    task_instance_id: Annotated[UUID, Field(title="Task Instance Id")]
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any] | str | None, Field(title="Detail")] = None
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -541,6 +551,14 @@ class HTTPValidationError(BaseModel):
     detail: Annotated[list[ValidationError] | None, Field(title="Detail")] = None
 
 
+class TIBulkStateUpdateResponse(BaseModel):
+    """
+    Response for a bulk state update, with one result per item in the order they were sent.
+    """
+
+    results: Annotated[list[TIBulkStateUpdateResult], Field(title="Results")]
+
+
 class TIRunContext(BaseModel):
     """
     Response schema for TaskInstance run context.
@@ -571,3 +589,29 @@ class TITerminalStatePayload(BaseModel):
     state: TerminalStateNonSuccess
     end_date: Annotated[AwareDatetime, Field(title="End Date")]
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
+
+
+class TIBulkStateUpdateItem(BaseModel):
+    """
+    A single TaskInstance state transition in a bulk state update.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    task_instance_id: Annotated[UUID, Field(title="Task Instance Id")]
+    token: Annotated[str, Field(title="Token")]
+    payload: Annotated[
+        TITerminalStatePayload | TISuccessStatePayload | TIRetryStatePayload, Field(title="Payload")
+    ]
+
+
+class TIBulkStateUpdate(BaseModel):
+    """
+    Schema for moving many running TaskInstances to a terminal state in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    updates: Annotated[list[TIBulkStateUpdateItem], Field(min_length=1, title="Updates")]
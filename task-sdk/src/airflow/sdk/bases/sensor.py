@@ -84,7 +84,7 @@ class BaseSensorOperator(BaseOperator):
         them are equivalent (as the sensor is never rescheduled), which is not
         the case in ``reschedule`` mode.
     :param mode: How the sensor operates.
-        Options are: ``{ poke | reschedule }``, default is ``poke``.
+        Options are: ``{ poke | reschedule | triggerer }``, default is ``poke``.
         When set to ``poke`` the sensor is taking up a worker slot for its
         whole execution time and sleeps between pokes. Use this mode if the
         expected runtime of the sensor is short or if a short poke interval
@@ -95,6 +95,16 @@ class BaseSensorOperator(BaseOperator):
         this mode if the time before the criteria is met is expected to be
         quite long. The poke interval should be more than one minute to
         prevent too much load on the scheduler.
+        When set to ``triggerer`` the sensor is poked once in the task, and if
+        the criteria is not met yet it defers to the triggerer, which runs the
+        ``poke`` method of the sensor in a thread pool from then on. This frees
+        the worker slot without rescheduling the task for every poke. The
+        triggerer re-creates the sensor from its class and the arguments it
+        was created with, so the class must be importable in the triggerer
+        (not defined in the DAG file), its arguments must be serializable (no
+        callables), and ``poke`` can only use the context entries that are
+        serializable (not ``ti``, ``task``, ``dag``, ``conn`` or ``var``).
+        Sensors that can't be run in the triggerer keep poking in the task.
     :param exponential_backoff: allow progressive longer waits between
         pokes by using exponential backoff algorithm
     :param max_wait: maximum wait interval between pokes, can be ``timedelta`` or ``float`` seconds
@@ -108,7 +118,7 @@ class BaseSensorOperator(BaseOperator):
     """
 
     ui_color: str = "#e6f1f2"
-    valid_modes: Iterable[str] = ["poke", "reschedule"]
+    valid_modes: Iterable[str] = ["poke", "reschedule", "triggerer"]
 
     _is_sensor: bool = True
 
@@ -200,6 +210,7 @@ class BaseSensorOperator(BaseOperator):
                 return time.monotonic() - start_monotonic
 
         poke_count = 1
+        poke_in_task = False
 
         xcom_value = None
         while True:
@@ -245,11 +256,46 @@ class BaseSensorOperator(BaseOperator):
                 next_poke_interval = self._get_next_poke_interval(started_at, run_duration, poke_count)
                 reschedule_date = timezone.utcnow() + timedelta(seconds=next_poke_interval)
                 raise AirflowRescheduleException(reschedule_date)
+            if self.mode == "triggerer" and not poke_in_task:
+                self._defer_to_triggerer(context, run_duration(), poke_count)
+                # The sensor can't be run in the triggerer if we get here
+                poke_in_task = True
             time.sleep(self._get_next_poke_interval(started_at, run_duration, poke_count))
             poke_count += 1
         self.log.info("Success criteria met. Exiting.")
         return xcom_value
 
+    def _defer_to_triggerer(self, context: Context, run_duration: float, poke_count: int) -> None:
+        """Defer the rest of the pokes to the triggerer, unless the sensor can't be run there."""
+        from airflow.triggers.sensor import SensorPokeTrigger
+
+        trigger = SensorPokeTrigger.from_sensor(
+            self, context, started_at=time.time() - run_duration, poke_count=poke_count
+        )
+        if trigger is None:
+            return
+        self.defer(
+            trigger=trigger,
+            method_name="_triggerer_poke_complete",
+            timeout=timedelta(seconds=max(self.timeout - run_duration, 0)),
+        )
+
+    def _triggerer_poke_complete(self, context: Context, event: dict[str, Any]) -> Any:
+        """Finish the sensor with the outcome of the pokes done by the triggerer."""
+        status, message = event["status"], event.get("message")
+        if status == "success":
+            self.log.info("Success criteria met. Exiting.")
+            return event.get("xcom_value")
+        if status == "skipped":
+            raise AirflowSkipException(message)
+        if self.never_fail or (status == "failed" and self.soft_fail):
+            raise AirflowSkipException(
+                f"Skipping due to {'never_fail' if self.never_fail else 'soft_fail'} is set to True: {message}"
+            )
+        if status == "failed":
+            raise AirflowFailException(message)
+        raise AirflowException(f"Sensor poke failed in the triggerer: {message}")
+
     def resume_execution(self, next_method: str, next_kwargs: dict[str, Any] | None, context: Context):
         try:
             return super().resume_execution(next_method, next_kwargs, context)
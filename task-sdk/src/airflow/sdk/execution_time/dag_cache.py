@@ -0,0 +1,151 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+On-disk, per-worker cache of DAGs parsed by the task runner.
+
+A versioned bundle never changes once it is checked out, so the DAG a task process gets from executing a DAG
+file is always the same for a given ``(bundle_name, bundle_version, relative_fileloc)``. The first task to run
+from it pickles the DAG it parsed next to the bundle storage, and later tasks from the same DAG unpickle it
+instead of executing the whole DAG file again. Unpickling only imports the modules that define the operators
+(and callables) the DAG actually uses, which for big generated DAG files is much cheaper than running their
+top-level code.
+
+Only DAGs that can be rebuilt without the DAG file itself are cached: if anything in the DAG references a
+function or class defined in the DAG file (a ``@task`` function, a ``python_callable`` or a custom operator
+for instance) the DAG is recorded as uncacheable and tasks keep parsing the file as before.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import dill
+import structlog
+
+from airflow.sdk import __version__ as sdk_version
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger
+
+    from airflow.sdk import DAG
+
+__all__ = ["load_dag", "store_dag"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="task")
+
+# Pickles are only valid for the same interpreter and Task SDK that wrote them
+CACHE_FORMAT = f"py{sys.version_info.major}{sys.version_info.minor}-sdk{sdk_version}"
+
+# See airflow.utils.file.MODIFIED_DAG_MODULE_NAME. Modules named like this only exist in the process that
+# parsed the DAG file, so anything pickled by reference to them can never be loaded again.
+_DAG_MODULE_PREFIX = "unusual_prefix_"
+
+
+class _DagFilePickler(dill.Pickler):
+    """
+    Pickler that refuses to pickle anything defined in the DAG file itself.
+
+    We use dill rather than plain pickle as operators commonly have lambdas as default arguments.
+    """
+
+    def reducer_override(self, obj):
+        try:
+            module = getattr(obj, "__module__", None)
+        except Exception:
+            module = None
+        if isinstance(module, str) and module.startswith(_DAG_MODULE_PREFIX):
+            raise pickle.PicklingError(f"{obj!r} is defined in the DAG file")
+        return NotImplemented
+
+
+def _cache_file(bundle_name: str, bundle_version: str, dag_rel_path: str, dag_id: str) -> Path:
+    from airflow.dag_processing.bundles.base import get_parsed_dag_cache_path
+
+    digest = hashlib.sha1(f"{dag_rel_path}\0{dag_id}".encode(), usedforsecurity=False).hexdigest()
+    return get_parsed_dag_cache_path(bundle_name, bundle_version) / CACHE_FORMAT / f"{digest}.pickle"
+
+
+def load_dag(*, bundle_name: str, bundle_version: str, dag_rel_path: str, dag_id: str) -> DAG | None:
+    """
+    Return the cached DAG, or None if we have not got it or it can't be cached.
+
+    The bundle root must already be on ``sys.path``, as the DAG may use modules from the bundle.
+    """
+    path = _cache_file(bundle_name, bundle_version, os.fspath(dag_rel_path), dag_id)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+
+    if not data:
+        # Marker written by store_dag for DAGs that can't be cached
+        return None
+
+    try:
+        dag = dill.loads(data)
+    except Exception:
+        log.warning("Unable to load cached DAG, parsing DAG file instead", path=str(path), exc_info=True)
+        with contextlib.suppress(OSError):
+            path.unlink()
+        return None
+    return dag
+
+
+def store_dag(dag: DAG, *, bundle_name: str, bundle_version: str, dag_rel_path: str) -> bool:
+    """
+    Store the DAG in the cache, unless there is already an entry for it.
+
+    :return: True if the DAG is now cached.
+    """
+    path = _cache_file(bundle_name, bundle_version, os.fspath(dag_rel_path), dag.dag_id)
+    if path.exists():
+        return path.stat().st_size > 0
+
+    buffer = io.BytesIO()
+    try:
+        _DagFilePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(dag)
+    except Exception as e:
+        log.debug("DAG can't be cached, it will be parsed by every task", dag_id=dag.dag_id, reason=str(e))
+        data = b""
+    else:
+        data = buffer.getvalue()
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and move it in place so that concurrent tasks never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError:
+        log.warning("Unable to write DAG cache", path=str(path), exc_info=True)
+        return False
+    return bool(data)
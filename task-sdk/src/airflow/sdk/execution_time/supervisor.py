@@ -19,8 +19,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 import contextlib
+import functools
 import io
 import logging
 import os
@@ -37,10 +39,12 @@ from http import HTTPStatus
 from socket import socket, socketpair
 from typing import (
     TYPE_CHECKING,
+    Any,
     BinaryIO,
     ClassVar,
     NoReturn,
     TextIO,
+    TypeGuard,
     cast,
 )
 from urllib.parse import urlparse
@@ -54,7 +58,7 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.configuration import conf
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import AsyncClient, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
@@ -119,6 +123,7 @@ from airflow.sdk.execution_time.comms import (
     _ResponseFrame,
 )
 from airflow.sdk.execution_time.secrets_masker import mask_secret
+from airflow.sdk.execution_time.warm_runner import get_warm_runner_pool, run_with_preloaded
 
 try:
     from socket import send_fds
@@ -442,6 +447,9 @@ class WatchedSubprocess:
 
     selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, repr=False)
 
+    _event_loop: asyncio.AbstractEventLoop | None = attrs.field(default=None, init=False, repr=False)
+    """The asyncio event loop reading from the sockets, if it is not ``_service_subprocess``."""
+
     _frame_encoder: msgspec.msgpack.Encoder = attrs.field(factory=comms._new_encoder, repr=False)
 
     process_log: FilteringBoundLogger = attrs.field(repr=False)
@@ -568,11 +576,31 @@ class WatchedSubprocess:
 
     def _on_socket_closed(self, sock: socket):
         # We want to keep servicing this process until we've read up to EOF from all the sockets.
+        self._call_in_selector_thread(self._unregister_socket, sock)
 
+    def _unregister_socket(self, sock: socket):
         with suppress(KeyError):
             self.selector.unregister(sock)
             del self._open_sockets[sock]
 
+    def _call_in_selector_thread(self, fn: Callable[..., Any], *args: Any) -> None:
+        """
+        Call ``fn``, which changes the registered sockets, from the thread reading from them.
+
+        When an event loop reads from the sockets, requests are handled in worker threads while the loop
+        thread reads the selector, so the change is handed over to the loop thread. It is made before the
+        loop is told that the request is handled, which is when the loop reads the selector again.
+        """
+        if (loop := self._event_loop) is not None:
+            try:
+                in_loop_thread = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                in_loop_thread = False
+            if not in_loop_thread:
+                loop.call_soon_threadsafe(fn, *args)
+                return
+        fn(*args)
+
     def send_msg(
         self, msg: BaseModel | None, request_id: int, error: ErrorResponse | None = None, **dump_opts
     ):
@@ -673,15 +701,7 @@ class WatchedSubprocess:
         if self._exit_code is not None:
             return
 
-        # Escalation sequence: SIGINT -> SIGTERM -> SIGKILL
-        escalation_path: list[signal.Signals] = [signal.SIGINT, signal.SIGTERM, signal.SIGKILL]
-
-        if force and signal_to_send in escalation_path:
-            # Start from `signal_to_send` and escalate to the end of the escalation path
-            escalation_path = escalation_path[escalation_path.index(signal_to_send) :]
-        else:
-            escalation_path = [signal_to_send]
-
+        escalation_path = self._escalation_path(signal_to_send, force)
         for sig in escalation_path:
             try:
                 self._process.send_signal(sig)
@@ -714,6 +734,53 @@ class WatchedSubprocess:
 
         log.error("Failed to terminate process after full escalation", pid=self.pid)
 
+    async def akill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ):
+        """
+        Attempt to terminate the subprocess like :meth:`kill`, from the event loop monitoring it.
+
+        The event loop keeps reading from the sockets meanwhile, so this only waits for the process to exit.
+        """
+        if self._exit_code is not None:
+            return
+
+        escalation_path = self._escalation_path(signal_to_send, force)
+        for sig in escalation_path:
+            try:
+                self._process.send_signal(sig)
+
+                end = time.monotonic() + escalation_delay
+                while (now := time.monotonic()) < end:
+                    if (exit_code := self._check_subprocess_exit(expect_signal=sig)) is not None:
+                        log.info("Process exited", pid=self.pid, exit_code=exit_code, signal_sent=sig.name)
+                        return
+                    await asyncio.sleep(min(0.05, end - now))
+
+                msg = "Process did not terminate in time"
+                if sig != escalation_path[-1]:
+                    msg += "; escalating"
+                log.warning(msg, pid=self.pid, signal=sig.name)
+            except psutil.NoSuchProcess:
+                log.debug("Process already terminated", pid=self.pid)
+                self._exit_code = -1
+                return
+
+        log.error("Failed to terminate process after full escalation", pid=self.pid)
+
+    @staticmethod
+    def _escalation_path(signal_to_send: signal.Signals, force: bool) -> list[signal.Signals]:
+        # Escalation sequence: SIGINT -> SIGTERM -> SIGKILL
+        escalation_path: list[signal.Signals] = [signal.SIGINT, signal.SIGTERM, signal.SIGKILL]
+
+        if force and signal_to_send in escalation_path:
+            # Start from `signal_to_send` and escalate to the end of the escalation path
+            return escalation_path[escalation_path.index(signal_to_send) :]
+        return [signal_to_send]
+
     def wait(self) -> int:
         raise NotImplementedError()
 
@@ -749,33 +816,44 @@ class WatchedSubprocess:
         """
         # Ensure minimum timeout to prevent CPU spike with tight loop when timeout is 0 or negative
         timeout = max(0.01, max_wait_time)
-        events = self.selector.select(timeout=timeout)
-        for key, _ in events:
-            # Retrieve the handler responsible for processing this file object (e.g., stdout, stderr)
-            socket_handler, on_close = key.data
-
-            # Example of handler behavior:
-            # If the subprocess writes "Hello, World!" to stdout:
-            # - `socket_handler` reads and processes the message.
-            # - If EOF is reached, the handler returns False to signal no more reads are expected.
-            # - BrokenPipeError should be caught and treated as if the handler returned false, similar
-            # to EOF case
-            try:
-                need_more = socket_handler(key.fileobj)
-            except (BrokenPipeError, ConnectionResetError):
-                need_more = False
-
-            # If the handler signals that the file object is no longer needed (EOF, closed, etc.)
-            # unregister it from the selector to stop monitoring; `wait()` blocks until all selectors
-            # are removed.
-            if not need_more:
-                sock: socket = key.fileobj  # type: ignore[assignment]
-                on_close(sock)
-                sock.close()
+        if self._event_loop is not None:
+            # The event loop is reading from the sockets (see ActivitySubprocess.amonitor_subprocess), so all
+            # we can do here is wait for the process to exit
+            with suppress(psutil.TimeoutExpired):
+                self._process.wait(timeout=timeout)
+        else:
+            events = self.selector.select(timeout=timeout)
+            for key, _ in events:
+                self._run_socket_handler(key)
 
         # Check if the subprocess has exited
         return self._check_subprocess_exit(raise_on_timeout=raise_on_timeout, expect_signal=expect_signal)
 
+    @staticmethod
+    def _run_socket_handler(key: selectors.SelectorKey) -> None:
+        """Process activity on one of the sockets connected to the subprocess."""
+        # Retrieve the handler responsible for processing this file object (e.g., stdout, stderr)
+        socket_handler, on_close = key.data
+
+        # Example of handler behavior:
+        # If the subprocess writes "Hello, World!" to stdout:
+        # - `socket_handler` reads and processes the message.
+        # - If EOF is reached, the handler returns False to signal no more reads are expected.
+        # - BrokenPipeError should be caught and treated as if the handler returned false, similar
+        # to EOF case
+        try:
+            need_more = socket_handler(key.fileobj)
+        except (BrokenPipeError, ConnectionResetError):
+            need_more = False
+
+        # If the handler signals that the file object is no longer needed (EOF, closed, etc.)
+        # unregister it from the selector to stop monitoring; `wait()` blocks until all selectors
+        # are removed.
+        if not need_more:
+            sock: socket = key.fileobj  # type: ignore[assignment]
+            on_close(sock)
+            sock.close()
+
     def _check_subprocess_exit(
         self, raise_on_timeout: bool = False, expect_signal: None | int = None
     ) -> int | None:
@@ -837,6 +915,12 @@ class ActivitySubprocess(WatchedSubprocess):
 
     ti: RuntimeTI | None = None
 
+    use_asyncio: bool = False
+    """Monitor the process from an asyncio event loop, see :meth:`amonitor_subprocess`."""
+
+    async_client: AsyncClient | None = None
+    """Client used to heartbeat when monitoring from an event loop; the sync client is used in a thread if unset."""
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -892,7 +976,10 @@ class ActivitySubprocess(WatchedSubprocess):
             return self._exit_code
 
         try:
-            self._monitor_subprocess()
+            if self.use_asyncio:
+                asyncio.run(self._amonitor_and_close_client())
+            else:
+                self._monitor_subprocess()
         finally:
             self.selector.close()
 
@@ -972,11 +1059,122 @@ class ActivitySubprocess(WatchedSubprocess):
 
                 self._handle_process_overtime_if_needed()
 
+    async def _amonitor_and_close_client(self):
+        try:
+            await self.amonitor_subprocess()
+        finally:
+            if self.async_client is not None:
+                await self.async_client.aclose()
+
+    async def amonitor_subprocess(self):
+        """
+        Monitor the subprocess until it exits, from an asyncio event loop.
+
+        This does the same as ``_monitor_subprocess``, but requests from the task are handled in a worker thread
+        and heartbeats are sent from their own asyncio task, so a slow API call for one of them never holds up
+        the other, or the forwarding of logs. Nothing here blocks the event loop, but ``supervise`` still runs
+        one event loop per task process: monitoring several processes from one loop is up to the caller.
+        """
+        loop = asyncio.get_running_loop()
+        activity = asyncio.Event()
+        # The selector is still where the sockets (and their handlers) are registered, we mirror it into the
+        # event loop. Sockets with a request being handled in a thread are left out until it is done.
+        watched: dict[int, selectors.SelectorKey] = {}
+        busy: set[int] = set()
+        request_handlers: set[asyncio.Future] = set()
+        errors: list[BaseException] = []
+
+        def sync_readers():
+            current = {key.fd: key for key in (self.selector.get_map() or {}).values()}
+            for fd, key in list(watched.items()):
+                if current.get(fd) is not key:
+                    loop.remove_reader(fd)
+                    del watched[fd]
+            for fd, key in current.items():
+                if fd not in watched and fd not in busy:
+                    loop.add_reader(fd, on_readable, key)
+                    watched[fd] = key
+
+        def on_readable(key: selectors.SelectorKey):
+            if self._open_sockets.get(key.fileobj) == "requests":  # type: ignore[call-overload]
+                # Handling a request can block on the API server, so do it in a thread. We stop watching the
+                # socket until it's done, so that we never handle two frames from it at once.
+                loop.remove_reader(key.fd)
+                del watched[key.fd]
+                busy.add(key.fd)
+                handler = asyncio.ensure_future(asyncio.to_thread(self._run_socket_handler, key))
+                request_handlers.add(handler)
+                handler.add_done_callback(functools.partial(on_request_handled, key.fd))
+            else:
+                try:
+                    self._run_socket_handler(key)
+                except BaseException as e:
+                    errors.append(e)
+                sync_readers()
+                activity.set()
+
+        def on_request_handled(fd: int, handler: asyncio.Future):
+            request_handlers.discard(handler)
+            busy.discard(fd)
+            if not handler.cancelled() and (exc := handler.exception()) is not None:
+                errors.append(exc)
+            sync_readers()
+            activity.set()
+
+        heartbeat: asyncio.Task | None = None
+        self._event_loop = loop
+        sync_readers()
+        try:
+            while self._exit_code is None or self._open_sockets:
+                if errors:
+                    raise errors[0]
+
+                last_heartbeat_ago = time.monotonic() - self._last_successful_heartbeat
+                max_wait_time = max(
+                    0.01,
+                    min(HEARTBEAT_TIMEOUT - last_heartbeat_ago * 0.75, MIN_HEARTBEAT_INTERVAL),
+                )
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(activity.wait(), timeout=max_wait_time)
+                activity.clear()
+
+                alive = self._check_subprocess_exit() is None
+
+                if self._exit_code is not None and self._open_sockets:
+                    if (
+                        self._process_exit_monotonic
+                        and time.monotonic() - self._process_exit_monotonic > SOCKET_CLEANUP_TIMEOUT
+                    ):
+                        for fd in list(watched):
+                            loop.remove_reader(fd)
+                        watched.clear()
+                        self._cleanup_open_sockets()
+
+                if alive:
+                    if heartbeat is None or heartbeat.done():
+                        heartbeat = asyncio.create_task(self._asend_heartbeat_if_needed())
+                    if self._process_overtime_reached():
+                        await self.akill(signal.SIGTERM, force=True)
+        finally:
+            for fd in watched:
+                loop.remove_reader(fd)
+            if heartbeat is not None:
+                heartbeat.cancel()
+            if request_handlers:
+                # We can't interrupt a thread, but let it finish before we go on to clean up the process
+                await asyncio.wait(request_handlers)
+            self._event_loop = None
+
     def _handle_process_overtime_if_needed(self):
         """Handle termination of auxiliary processes if the task exceeds the configured overtime."""
+        if self._process_overtime_reached():
+            self.kill(signal.SIGTERM, force=True)
+
+    def _process_overtime_reached(self) -> bool:
+        """Check if the process should be terminated for running too long after the task finished."""
         # If the task has reached a terminal state, we can start monitoring the overtime
         if not self._terminal_state:
-            return
+            return False
         if (
             self._task_end_time_monotonic
             and (time.monotonic() - self._task_end_time_monotonic) > TASK_OVERTIME_THRESHOLD
@@ -987,7 +1185,8 @@ class ActivitySubprocess(WatchedSubprocess):
                 "Airflow configuration to change this limit.",
                 ti_id=self.id,
             )
-            self.kill(signal.SIGTERM, force=True)
+            return True
+        return False
 
     def _send_heartbeat_if_needed(self):
         """Send a heartbeat to the client if heartbeat interval has passed."""
@@ -1003,34 +1202,80 @@ class ActivitySubprocess(WatchedSubprocess):
         self._last_heartbeat_attempt = time.monotonic()
         try:
             self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
-            # Update the last heartbeat time on success
-            self._last_successful_heartbeat = time.monotonic()
+        except Exception as e:
+            self._on_heartbeat_error(e)
+        else:
+            self._on_heartbeat_success()
 
-            # Reset the counter on success
-            self.failed_heartbeats = 0
-        except ServerResponseError as e:
-            if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
+    async def _asend_heartbeat_if_needed(self):
+        """Send a heartbeat without blocking the event loop, see ``_send_heartbeat_if_needed``."""
+        if (time.monotonic() - self._last_heartbeat_attempt) < MIN_HEARTBEAT_INTERVAL:
+            return
+
+        if self._terminal_state:
+            return
+
+        self._last_heartbeat_attempt = time.monotonic()
+        try:
+            if self.async_client is not None:
+                await self.async_client.task_instances.heartbeat(self.id, pid=self._process.pid)
             else:
-                # If we get any other error, we'll just log it and try again next time
-                self._handle_heartbeat_failures(e)
+                await asyncio.to_thread(self.client.task_instances.heartbeat, self.id, pid=self._process.pid)
         except Exception as e:
-            self._handle_heartbeat_failures(e)
+            # Handled here rather than in a thread: killing the process must leave the sockets to the loop
+            if self._heartbeat_error_needs_kill(e):
+                try:
+                    await self.akill(signal.SIGTERM, force=True)
+                finally:
+                    # Monitoring stops, cancelling this, as soon as it sees the process exit
+                    if self._exit_code is not None:
+                        self._on_killed_after_heartbeat_error(e)
+        else:
+            self._on_heartbeat_success()
 
-    def _handle_heartbeat_failures(self, exc: Exception | None):
-        """Increment the failed heartbeats counter and kill the process if too many failures."""
+    def _on_heartbeat_success(self):
+        # Update the last heartbeat time on success
+        self._last_successful_heartbeat = time.monotonic()
+
+        # Reset the counter on success
+        self.failed_heartbeats = 0
+
+    def _on_heartbeat_error(self, e: Exception):
+        if self._heartbeat_error_needs_kill(e):
+            self.kill(signal.SIGTERM, force=True)
+            self._on_killed_after_heartbeat_error(e)
+
+    @staticmethod
+    def _is_task_gone_on_server(e: Exception) -> TypeGuard[ServerResponseError]:
+        return isinstance(e, ServerResponseError) and e.response.status_code in {
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.CONFLICT,
+        }
+
+    def _heartbeat_error_needs_kill(self, e: Exception) -> bool:
+        """Log a failed heartbeat, returning whether the process has to be terminated because of it."""
+        if self._is_task_gone_on_server(e):
+            log.error(
+                "Server indicated the task shouldn't be running anymore",
+                detail=e.detail,
+                status_code=e.response.status_code,
+                ti_id=self.id,
+            )
+            self.process_log.error(
+                "Server indicated the task shouldn't be running anymore. Terminating process",
+                detail=e.detail,
+            )
+            return True
+        # If we get any other error, we'll just log it and try again next time
+        return self._handle_heartbeat_failures(e)
+
+    def _on_killed_after_heartbeat_error(self, e: Exception):
+        if self._is_task_gone_on_server(e):
+            self.process_log.error("Task killed!")
+            self._terminal_state = SERVER_TERMINATED
+
+    def _handle_heartbeat_failures(self, exc: Exception | None) -> bool:
+        """Increment the failed heartbeats counter, returning whether there were too many failures."""
         self.failed_heartbeats += 1
         log.warning(
             "Failed to send heartbeat. Will be retried",
@@ -1044,7 +1289,8 @@ class ActivitySubprocess(WatchedSubprocess):
             log.error(
                 "Too many failed heartbeats; terminating process", failed_heartbeats=self.failed_heartbeats
             )
-            self.kill(signal.SIGTERM, force=True)
+            return True
+        return False
 
     @property
     def final_state(self):
@@ -1287,7 +1533,8 @@ class ActivitySubprocess(WatchedSubprocess):
         if self.subprocess_logs_to_stdout:
             target_loggers += (log,)
 
-        self.selector.register(
+        self._call_in_selector_thread(
+            self.selector.register,
             read_logs,
             selectors.EVENT_READ,
             make_buffered_socket_reader(
@@ -1791,9 +2038,16 @@ def supervise(
     if not dag_rel_path:
         raise ValueError("dag_path is required")
 
+    use_asyncio = conf.getboolean("workers", "asyncio_supervisor", fallback=False)
+    async_client: AsyncClient | None = None
     if not client:
         limits = httpx.Limits(max_keepalive_connections=1, max_connections=10)
         client = Client(base_url=server or "", limits=limits, dry_run=dry_run, token=token)
+        if use_asyncio:
+            async_client = AsyncClient(base_url=server or "", limits=limits, dry_run=dry_run, token=token)
+            # Share the token, so whichever client gets a refreshed token from the server updates both
+            if client.auth is not None:
+                async_client.auth = client.auth
 
     start = time.monotonic()
 
@@ -1812,6 +2066,10 @@ def supervise(
 
     reset_secrets_masker()
 
+    target: Callable[[], None] = _subprocess_main
+    if (warm_dag_file := get_warm_runner_pool().get(bundle_info, dag_rel_path)) is not None:
+        target = functools.partial(run_with_preloaded, warm_dag_file, _subprocess_main)
+
     process = ActivitySubprocess.start(
         dag_rel_path=dag_rel_path,
         what=ti,
@@ -1819,6 +2077,9 @@ def supervise(
         logger=logger,
         bundle_info=bundle_info,
         subprocess_logs_to_stdout=subprocess_logs_to_stdout,
+        target=target,
+        use_asyncio=use_asyncio,
+        async_client=async_client,
     )
 
     exit_code = process.wait()
@@ -103,6 +103,7 @@ from airflow.sdk.execution_time.context import (
     get_previous_dagrun_success,
     set_current_context,
 )
+from airflow.sdk.execution_time.warm_runner import take_preloaded_task
 from airflow.sdk.execution_time.xcom import XCom
 from airflow.sdk.timezone import coerce_datetime
 
@@ -604,6 +605,12 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
 
     from airflow.models.dagbag import DagBag
 
+    if (preloaded := take_preloaded_task(what)) is not None:
+        # Our supervisor already parsed this DAG file, and we inherited it when we were forked
+        bundle_instance, task = preloaded
+        log.debug("Using DAG parsed by supervisor", dag_id=what.ti.dag_id, path=what.dag_rel_path)
+        return _make_runtime_ti(what, task, bundle_instance)
+
     bundle_info = what.bundle_info
     bundle_instance = DagBundlesManager().get_bundle(
         name=bundle_info.name,
@@ -616,23 +623,56 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     if (bundle_root := os.fspath(bundle_instance.path)) not in sys.path:
         sys.path.append(bundle_root)
 
-    dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
-    bag = DagBag(
-        dag_folder=dag_absolute_path,
-        include_examples=False,
-        safe_mode=False,
-        load_op_links=False,
-    )
     if TYPE_CHECKING:
         assert what.ti.dag_id
 
-    try:
-        dag = bag.dags[what.ti.dag_id]
-    except KeyError:
-        log.error(
-            "DAG not found during start up", dag_id=what.ti.dag_id, bundle=bundle_info, path=what.dag_rel_path
+    # Only versioned bundles are immutable, so we can only trust a cached DAG for those
+    use_dag_cache = bundle_info.version is not None and conf.getboolean(
+        "workers", "cache_parsed_dags", fallback=False
+    )
+    dag = None
+    if use_dag_cache:
+        from airflow.sdk.execution_time import dag_cache
+
+        dag = dag_cache.load_dag(
+            bundle_name=bundle_info.name,
+            bundle_version=bundle_info.version,
+            dag_rel_path=what.dag_rel_path,
+            dag_id=what.ti.dag_id,
+        )
+        if dag is not None and what.ti.task_id not in dag.task_dict:
+            # The DAG file might only have created the task that was being run when it was cached
+            dag = None
+        if dag is not None:
+            log.debug("Using cached DAG", dag_id=what.ti.dag_id, path=what.dag_rel_path)
+
+    if dag is None:
+        dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
+        bag = DagBag(
+            dag_folder=dag_absolute_path,
+            include_examples=False,
+            safe_mode=False,
+            load_op_links=False,
         )
-        exit(1)
+
+        try:
+            dag = bag.dags[what.ti.dag_id]
+        except KeyError:
+            log.error(
+                "DAG not found during start up",
+                dag_id=what.ti.dag_id,
+                bundle=bundle_info,
+                path=what.dag_rel_path,
+            )
+            exit(1)
+
+        if use_dag_cache:
+            dag_cache.store_dag(
+                dag,
+                bundle_name=bundle_info.name,
+                bundle_version=bundle_info.version,
+                dag_rel_path=what.dag_rel_path,
+            )
 
     # install_loader()
 
@@ -648,6 +688,10 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         )
         exit(1)
 
+    return _make_runtime_ti(what, task, bundle_instance)
+
+
+def _make_runtime_ti(what: StartupDetails, task: Any, bundle_instance: BaseDagBundle) -> RuntimeTaskInstance:
     if not isinstance(task, (BaseOperator, MappedOperator)):
         raise TypeError(
             f"task is of the wrong type, got {type(task)}, wanted {BaseOperator} or {MappedOperator}"
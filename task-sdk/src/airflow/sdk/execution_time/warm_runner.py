@@ -0,0 +1,234 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Keep parsed DAG files "warm" in a long-lived supervisor process.
+
+Normally every task process re-imports its DAG file in ``task_runner.parse()``. For short tasks that parse (and
+the imports it pulls in) can dominate the wall time of the task. When ``[workers] warm_runner_pool_size`` is
+set, the supervisor keeps the parsed DAGs of recently run DAG files in memory, keyed by bundle name, bundle
+version and the DAG file, and every task process it forks inherits them, copy-on-write.
+
+Since each task instance still runs in its own freshly forked process any state the task mutates (module
+globals, the DAG objects themselves, open connections etc.) is thrown away when the task process exits, exactly
+as it is without the pool.
+
+DAG files of versioned bundles never change. For unversioned bundles, a DAG file is parsed again when its
+modification time changes, but changes to other modules of the bundle it imports are not noticed.
+
+Tasks can opt out by setting ``executor_config={"warm_runner": False}``, in which case the task process parses
+the DAG file itself as usual.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import attrs
+import structlog
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger
+
+    from airflow.dag_processing.bundles.base import BaseDagBundle
+    from airflow.executors.workloads import BundleInfo
+    from airflow.sdk import DAG
+    from airflow.sdk.execution_time.comms import StartupDetails
+
+__all__ = ["WarmDagFile", "WarmRunnerPool", "get_warm_runner_pool", "run_with_preloaded"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="supervisor")
+
+OPT_OUT_KEY = "warm_runner"
+"""Key in a task's ``executor_config`` which, when set to False, disables use of preloaded DAGs."""
+
+
+class WarmDagKey(NamedTuple):
+    """Identity of a parsed DAG file in the pool."""
+
+    bundle_name: str
+    bundle_version: str | None
+    dag_rel_path: str
+
+
+@attrs.define(kw_only=True)
+class WarmDagFile:
+    """The result of parsing a single DAG file in the supervisor process."""
+
+    key: WarmDagKey
+    bundle_instance: BaseDagBundle | None = None
+    dags: dict[str, DAG] = attrs.field(factory=dict)
+    path: str | None = None
+    mtime: float | None = None
+    """Modification time of the DAG file when it was parsed; only used for unversioned bundles."""
+
+    @property
+    def usable(self) -> bool:
+        """Whether the file parsed cleanly, a failed parse is cached so we don't retry it for every task."""
+        return self.bundle_instance is not None and bool(self.dags)
+
+    def get_task(self, dag_id: str, task_id: str):
+        if not self.usable or (dag := self.dags.get(dag_id)) is None:
+            return None
+        task = dag.task_dict.get(task_id)
+        if task is None:
+            return None
+        executor_config = getattr(task, "executor_config", None) or {}
+        if executor_config.get(OPT_OUT_KEY, True) is False:
+            return None
+        return task
+
+
+@attrs.define
+class WarmRunnerPool:
+    """
+    LRU cache of DAG files parsed in the supervisor process.
+
+    A DAG file that fails to parse in the supervisor (for instance because its top-level code needs to talk to
+    the API server, which is only possible from a task process) is remembered as unusable so that the tasks
+    from it fall straight back to parsing in the task process.
+    """
+
+    max_size: int
+    _entries: OrderedDict[WarmDagKey, WarmDagFile] = attrs.field(factory=OrderedDict, init=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, bundle_info: BundleInfo, dag_rel_path: str | os.PathLike[str]) -> WarmDagFile | None:
+        """Return the parsed DAG file for this bundle version, parsing it if we haven't got it already."""
+        if self.max_size <= 0:
+            return None
+
+        key = WarmDagKey(bundle_info.name, bundle_info.version, os.fspath(dag_rel_path))
+        entry = self._entries.get(key)
+        if entry is not None and self._is_stale(entry):
+            log.debug("DAG file changed on disk, re-parsing", key=key)
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            entry = self._load(key)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                log.debug("Evicted warm DAG file", key=evicted)
+        else:
+            self._entries.move_to_end(key)
+
+        return entry if entry.usable else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _is_stale(entry: WarmDagFile) -> bool:
+        # Versioned bundles are immutable, so only files from unversioned bundles can change under us. Only the
+        # DAG file itself is checked: a change to a module it imports from the bundle is not picked up until
+        # the DAG file changes too, or its entry is evicted.
+        if entry.key.bundle_version is not None or entry.path is None:
+            return False
+        try:
+            return os.stat(entry.path).st_mtime != entry.mtime
+        except OSError:
+            return True
+
+    @staticmethod
+    def _load(key: WarmDagKey) -> WarmDagFile:
+        from airflow.dag_processing.bundles.manager import DagBundlesManager
+        from airflow.models.dagbag import DagBag
+
+        entry = WarmDagFile(key=key)
+        try:
+            bundle_instance = DagBundlesManager().get_bundle(name=key.bundle_name, version=key.bundle_version)
+            bundle_instance.initialize()
+
+            if (bundle_root := os.fspath(bundle_instance.path)) not in sys.path:
+                sys.path.append(bundle_root)
+
+            entry.path = os.fspath(Path(bundle_instance.path, key.dag_rel_path))
+            entry.mtime = os.stat(entry.path).st_mtime
+            bag = DagBag(
+                dag_folder=entry.path,
+                include_examples=False,
+                safe_mode=False,
+                load_op_links=False,
+            )
+        except Exception:
+            log.warning(
+                "Unable to parse DAG file in supervisor, tasks will parse it themselves", exc_info=True
+            )
+            return entry
+
+        if bag.import_errors:
+            log.info(
+                "DAG file could not be parsed in supervisor, tasks will parse it themselves",
+                key=key,
+                errors=list(bag.import_errors.values()),
+            )
+            return entry
+
+        entry.bundle_instance = bundle_instance
+        entry.dags = dict(bag.dags)
+        log.debug("Parsed warm DAG file", key=key, dag_ids=list(entry.dags))
+        return entry
+
+
+@functools.cache
+def get_warm_runner_pool() -> WarmRunnerPool:
+    from airflow.configuration import conf
+
+    return WarmRunnerPool(max_size=conf.getint("workers", "warm_runner_pool_size", fallback=0))
+
+
+_preloaded: WarmDagFile | None = None
+
+
+def run_with_preloaded(entry: WarmDagFile, target: Callable[[], None]) -> None:
+    """
+    Entrypoint for a task process forked from a warm supervisor.
+
+    This is used (via ``functools.partial``) as the ``target`` of the forked process so the task runner knows
+    which of the inherited parsed DAG files belongs to it.
+    """
+    global _preloaded
+    _preloaded = entry
+    target()
+
+
+def take_preloaded_task(what: StartupDetails) -> tuple[BaseDagBundle, Any] | None:
+    """
+    Return the bundle and task for this task instance from the preloaded DAG file, if there is one.
+
+    This can only be used once per process, and returns None if the task was not in the preloaded file or the
+    task has opted out, in which case the caller should parse the DAG file itself.
+    """
+    global _preloaded
+    entry, _preloaded = _preloaded, None
+    if entry is None or entry.bundle_instance is None:
+        return None
+    if entry.key != WarmDagKey(what.bundle_info.name, what.bundle_info.version, what.dag_rel_path):
+        return None
+    if what.ti.dag_id is None or (task := entry.get_task(what.ti.dag_id, what.ti.task_id)) is None:
+        return None
+    return entry.bundle_instance, task
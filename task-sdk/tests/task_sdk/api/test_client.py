@@ -30,7 +30,12 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import RemoteValidationError, ServerResponseError
+from airflow.sdk.api.client import (
+    AsyncClient,
+    BulkStateUpdater,
+    RemoteValidationError,
+    ServerResponseError,
+)
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -38,6 +43,9 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunState,
     DagRunStateResponse,
     HITLDetailResponse,
+    TIRetryStatePayload,
+    TISuccessStatePayload,
+    TITerminalStatePayload,
     VariableResponse,
     XComResponse,
 )
@@ -247,6 +255,33 @@ class TestClient:
         assert response.status_code == 200
         assert response.request.headers["Authorization"] == "Bearer abc"
 
+    @pytest.mark.asyncio
+    async def test_async_client_shares_token_and_raises_errors(self):
+        responses = [
+            httpx.Response(
+                409, json={"detail": {"reason": "not_running"}}, headers={"Refreshed-API-Token": "abc"}
+            ),
+        ]
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        client = make_client_w_responses([httpx.Response(200, json={"ok": "1"})])
+        async_client = AsyncClient(
+            base_url="http://localhost", token="", transport=httpx.MockTransport(handle_request)
+        )
+        async_client.auth = client.auth
+
+        with pytest.raises(ServerResponseError) as err:
+            await async_client.task_instances.heartbeat(uuid6.uuid7(), pid=100)
+        await async_client.aclose()
+
+        assert err.value.response.status_code == 409
+        assert err.value.detail == {"detail": {"reason": "not_running"}}
+        # The token refreshed by the async client is used by the sync one too
+        response = client.get("/")
+        assert response.request.headers["Authorization"] == "Bearer abc"
+
     @pytest.mark.parametrize(
         ["status_code", "description"],
         [
@@ -326,6 +361,82 @@ class TestTaskInstanceOperations:
             ti_id, state=state, when="2024-10-31T12:00:00Z", rendered_map_index="test"
         )
 
+    def test_task_instance_bulk_update_state(self):
+        ti_ids = [uuid6.uuid7(), uuid6.uuid7()]
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/states" and request.method == "PATCH":
+                actual_body = json.loads(request.read())
+                assert [item["task_instance_id"] for item in actual_body["updates"]] == [
+                    str(ti_id) for ti_id in ti_ids
+                ]
+                assert [item["token"] for item in actual_body["updates"]] == ["token-1", "token-2"]
+                assert [item["payload"]["state"] for item in actual_body["updates"]] == [
+                    "success",
+                    "up_for_retry",
+                ]
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": [
+                            {"task_instance_id": str(ti_ids[0]), "status_code": 204},
+                            {
+                                "task_instance_id": str(ti_ids[1]),
+                                "status_code": 409,
+                                "detail": {"reason": "invalid_state"},
+                            },
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        with BulkStateUpdater(client, max_batch_size=10) as updater:
+            updater.add(ti_ids[0], "token-1", TISuccessStatePayload(end_date=timezone.utcnow()))
+            updater.add(ti_ids[1], "token-2", TIRetryStatePayload(end_date=timezone.utcnow()))
+
+        assert [(r.task_instance_id, r.status_code) for r in updater.results] == [
+            (ti_ids[0], 204),
+            (ti_ids[1], 409),
+        ]
+
+    def test_bulk_state_updater_sends_full_batches(self):
+        batch_sizes = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            updates = json.loads(request.read())["updates"]
+            batch_sizes.append(len(updates))
+            return httpx.Response(
+                status_code=200,
+                json={
+                    "results": [
+                        {"task_instance_id": item["task_instance_id"], "status_code": 204} for item in updates
+                    ]
+                },
+            )
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        updater = BulkStateUpdater(client, max_batch_size=2)
+        for _ in range(3):
+            updater.add(
+                uuid6.uuid7(),
+                "token",
+                TITerminalStatePayload(state=TerminalTIState.FAILED, end_date=timezone.utcnow()),
+            )
+        assert batch_sizes == [2]
+
+        assert len(updater.flush()) == 1
+        assert updater.flush() == []
+        assert batch_sizes == [2, 1]
+        assert len(updater.results) == 3
+
+    def test_bulk_state_updater_needs_a_batch_size(self):
+        with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+            BulkStateUpdater(
+                make_client(transport=httpx.MockTransport(lambda request: httpx.Response(204))),
+                max_batch_size=0,
+            )
+
     def test_task_instance_heartbeat(self):
         # Simulate a successful response from the server that sends a heartbeat for a ti
         ti_id = uuid6.uuid7()
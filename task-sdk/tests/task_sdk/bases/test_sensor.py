@@ -31,6 +31,7 @@ from airflow.exceptions import (
     AirflowSensorTimeout,
     AirflowSkipException,
     AirflowTaskTimeout,
+    TaskDeferred,
 )
 from airflow.models.trigger import TriggerFailureReason
 from airflow.providers.standard.operators.empty import EmptyOperator
@@ -39,6 +40,7 @@ from airflow.sdk.bases.sensor import BaseSensorOperator, PokeReturnValue, poke_m
 from airflow.sdk.definitions.dag import DAG
 from airflow.sdk.execution_time.comms import RescheduleTask, TaskRescheduleStartDate
 from airflow.sdk.timezone import datetime
+from airflow.triggers.sensor import SensorPokeTrigger
 from airflow.utils.state import State
 
 if TYPE_CHECKING:
@@ -278,6 +280,51 @@ class TestBaseSensor:
         with pytest.raises(AirflowException):
             DummySensor(task_id="a", mode="foo")
 
+    def test_ok_with_triggerer_mode(self, make_sensor):
+        sensor = make_sensor(True, mode="triggerer")
+        self._run(sensor)
+
+    def test_triggerer_mode_defers_after_first_poke(self, make_sensor):
+        sensor = make_sensor(False, mode="triggerer", timeout=60)
+
+        with pytest.raises(TaskDeferred) as exc_info:
+            self._run(sensor)
+
+        assert isinstance(exc_info.value.trigger, SensorPokeTrigger)
+        assert exc_info.value.trigger.poke_count == 1
+        assert exc_info.value.method_name == "_triggerer_poke_complete"
+        assert timedelta(seconds=59) < exc_info.value.timeout <= timedelta(seconds=60)
+
+    def test_triggerer_mode_pokes_in_task_if_sensor_cant_be_pickled(self, make_sensor):
+        sensor = make_sensor(False, mode="triggerer", timeout=0.05)
+        sensor.__class__ = type("DagFileSensor", (DummySensor,), {"__module__": "unusual_prefix_abc_dag"})
+
+        with pytest.raises(AirflowSensorTimeout):
+            self._run(sensor)
+
+    @pytest.mark.parametrize(
+        "event, soft_fail, expected",
+        [
+            ({"status": "success", "xcom_value": "value"}, False, "value"),
+            ({"status": "skipped", "message": "skip"}, False, AirflowSkipException),
+            ({"status": "failed", "message": "fail"}, False, AirflowFailException),
+            ({"status": "failed", "message": "fail"}, True, AirflowSkipException),
+            ({"status": "error", "message": "boom"}, False, AirflowException),
+            ({"status": "error", "message": "boom"}, True, AirflowSkipException),
+        ],
+    )
+    def test_triggerer_poke_complete(self, make_sensor, event, soft_fail, expected):
+        sensor = make_sensor(False, mode="triggerer", soft_fail=soft_fail)
+
+        def resume():
+            return sensor.resume_execution("_triggerer_poke_complete", {"event": event}, {})
+
+        if isinstance(expected, type) and issubclass(expected, Exception):
+            with pytest.raises(expected):
+                resume()
+        else:
+            assert resume() == expected
+
     def test_ok_with_custom_reschedule_exception(self, make_sensor, run_task):
         sensor = make_sensor(return_value=None, mode="reschedule")
         date1 = timezone.utcnow()
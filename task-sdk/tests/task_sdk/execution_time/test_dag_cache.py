@@ -0,0 +1,173 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from uuid6 import uuid7
+
+from airflow.models.dagbag import DagBag
+from airflow.sdk import DAG
+from airflow.sdk.api.datamodels._generated import TaskInstance
+from airflow.sdk.bases.operator import BaseOperator
+from airflow.sdk.execution_time import dag_cache
+from airflow.sdk.execution_time.comms import BundleInfo, StartupDetails
+from airflow.sdk.execution_time.task_runner import parse
+from airflow.utils import timezone
+
+from tests_common.test_utils.config import conf_vars
+
+CACHEABLE_DAG = """
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+with DAG("cacheable"):
+    BaseOperator(task_id="a") >> BaseOperator(task_id="b")
+"""
+
+UNCACHEABLE_DAG = """
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+class MyOperator(BaseOperator):
+    pass
+
+with DAG("uncacheable"):
+    MyOperator(task_id="a")
+"""
+
+
+@pytest.fixture
+def storage_path(tmp_path: Path):
+    with conf_vars({("dag_processor", "dag_bundle_storage_path"): str(tmp_path / "storage")}):
+        yield tmp_path / "storage"
+
+
+@pytest.fixture
+def bundle_dir(tmp_path: Path):
+    bundle_path = tmp_path / "bundle"
+    bundle_path.mkdir()
+    bundle_path.joinpath("cacheable.py").write_text(textwrap.dedent(CACHEABLE_DAG))
+    bundle_path.joinpath("uncacheable.py").write_text(textwrap.dedent(UNCACHEABLE_DAG))
+    bundle_config = [
+        {
+            "name": "my-bundle",
+            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+            "kwargs": {"path": str(bundle_path), "refresh_interval": 1},
+        }
+    ]
+    with mock.patch.dict(
+        os.environ, {"AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(bundle_config)}
+    ):
+        yield bundle_path
+
+
+def _parse_file(path: Path) -> DAG:
+    bag = DagBag(dag_folder=os.fspath(path), include_examples=False, safe_mode=False, load_op_links=False)
+    (dag,) = bag.dags.values()
+    return dag
+
+
+def test_round_trip(storage_path):
+    with DAG("round_trip") as dag:
+        BaseOperator(task_id="a") >> BaseOperator(task_id="b")
+
+    assert dag_cache.store_dag(dag, bundle_name="b", bundle_version="v1", dag_rel_path="f.py")
+
+    loaded = dag_cache.load_dag(
+        bundle_name="b", bundle_version="v1", dag_rel_path="f.py", dag_id="round_trip"
+    )
+    assert loaded is not dag
+    assert loaded.dag_id == "round_trip"
+    assert loaded.task_dict["a"].downstream_task_ids == {"b"}
+    assert loaded.task_dict["b"].dag is loaded
+
+    # Different bundle version, so nothing cached
+    assert (
+        dag_cache.load_dag(bundle_name="b", bundle_version="v2", dag_rel_path="f.py", dag_id="round_trip")
+        is None
+    )
+
+
+def test_dag_referencing_dag_file_is_not_cached(storage_path, bundle_dir):
+    dag = _parse_file(bundle_dir / "uncacheable.py")
+
+    assert not dag_cache.store_dag(dag, bundle_name="b", bundle_version="v1", dag_rel_path="uncacheable.py")
+    assert (
+        dag_cache.load_dag(
+            bundle_name="b", bundle_version="v1", dag_rel_path="uncacheable.py", dag_id="uncacheable"
+        )
+        is None
+    )
+
+    # The failure is remembered, so we don't try to pickle it again
+    with mock.patch.object(dag_cache, "_DagFilePickler") as pickler:
+        assert not dag_cache.store_dag(
+            dag, bundle_name="b", bundle_version="v1", dag_rel_path="uncacheable.py"
+        )
+    pickler.assert_not_called()
+
+
+def test_corrupt_cache_file_is_removed(storage_path):
+    path = dag_cache._cache_file("b", "v1", "f.py", "corrupt")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+
+    assert (
+        dag_cache.load_dag(bundle_name="b", bundle_version="v1", dag_rel_path="f.py", dag_id="corrupt")
+        is None
+    )
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("version", ["v1", None])
+@conf_vars({("workers", "cache_parsed_dags"): "True"})
+def test_parse_uses_cache_for_versioned_bundles(storage_path, bundle_dir, make_ti_context, version):
+    def startup_details(task_id: str) -> StartupDetails:
+        return StartupDetails(
+            ti=TaskInstance(
+                id=uuid7(),
+                task_id=task_id,
+                dag_id="cacheable",
+                run_id="c",
+                try_number=1,
+                dag_version_id=uuid7(),
+            ),
+            dag_rel_path="cacheable.py",
+            bundle_info=BundleInfo(name="my-bundle", version=version),
+            ti_context=make_ti_context(),
+            start_date=timezone.utcnow(),
+        )
+
+    first = parse(startup_details("a"), mock.Mock())
+    assert first.task.task_id == "a"
+
+    with mock.patch("airflow.models.dagbag.DagBag", wraps=DagBag) as dagbag:
+        second = parse(startup_details("b"), mock.Mock())
+
+    assert second.task.task_id == "b"
+    assert second.task.upstream_task_ids == {"a"}
+    if version:
+        dagbag.assert_not_called()
+    else:
+        dagbag.assert_called_once()
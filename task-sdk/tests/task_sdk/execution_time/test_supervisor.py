@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import logging
@@ -56,6 +57,7 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunType,
     TaskInstance,
     TaskInstanceState,
+    VariableResponse,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
 from airflow.sdk.execution_time import task_runner
@@ -1017,6 +1019,164 @@ class TestWatchedSubprocess:
         assert len(proc._open_sockets) == 0
 
 
+@pytest.mark.usefixtures("disable_capturing")
+class TestAsyncioMonitoring:
+    @staticmethod
+    def _start(client, target, **kwargs) -> ActivitySubprocess:
+        return ActivitySubprocess.start(
+            dag_rel_path=os.devnull,
+            bundle_info=FAKE_BUNDLE,
+            what=TaskInstance(
+                id="4d828a62-a417-4936-a7a6-2b3fabacecab",
+                task_id="b",
+                dag_id="c",
+                run_id="d",
+                try_number=1,
+                dag_version_id=uuid7(),
+            ),
+            client=client,
+            target=target,
+            use_asyncio=True,
+            **kwargs,
+        )
+
+    def test_forwards_logs_and_handles_requests(self, captured_logs, client_with_ti_start):
+        def subprocess_main():
+            comms = CommsDecoder()
+            comms._get_response()
+
+            print("I'm a short message")
+            logs = comms.send(ResendLoggingFD())
+            assert isinstance(logs, SentFDs)
+            fd = os.fdopen(logs.fds[0], "w")
+            json.dump({"level": "info", "event": "Log on new socket"}, fp=fd)
+
+        proc = self._start(client_with_ti_start, subprocess_main)
+
+        assert proc.wait() == 0
+        assert captured_logs == unordered(
+            [
+                {"chan": "stdout", "event": "I'm a short message", "level": "info", "logger": "task"}
+                | {"timestamp": mock.ANY},
+                {"event": "Log on new socket", "level": "info", "logger": "task", "timestamp": mock.ANY},
+            ]
+        )
+        assert not proc._open_sockets
+
+    def test_socket_changes_from_request_threads_are_made_in_loop_thread(self, mocker):
+        import threading
+
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.MagicMock(),
+            client=mocker.MagicMock(),
+            process=mocker.MagicMock(),
+        )
+        threads = []
+
+        async def main():
+            proc._event_loop = asyncio.get_running_loop()
+            await asyncio.to_thread(
+                proc._call_in_selector_thread, lambda: threads.append(threading.current_thread())
+            )
+            # Made by the time the loop learns that the request is handled
+            assert threads == [threading.current_thread()]
+
+        asyncio.run(main())
+
+    def test_slow_request_does_not_block_logs(self, captured_logs, client_with_ti_start):
+        def subprocess_main():
+            import threading
+
+            comms = CommsDecoder()
+            comms._get_response()
+
+            threading.Timer(0.1, lambda: print("ping", flush=True)).start()
+            var = comms.send(GetVariable(key="slow"))
+            print(f"Variable is {var.value}", flush=True)
+
+        def get_variable(key):
+            # Only reply once the supervisor has forwarded the log line the task wrote after asking for the
+            # Variable, which would never happen if handling this request blocked the reading of logs.
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if any(log.get("event") == "ping" for log in captured_logs):
+                    return VariableResponse(key=key, value="not blocked")
+                sleep(0.01)
+            return VariableResponse(key=key, value="blocked")
+
+        client_with_ti_start.variables.get.side_effect = get_variable
+
+        proc = self._start(client_with_ti_start, subprocess_main)
+
+        assert proc.wait() == 0
+        assert {
+            "chan": "stdout",
+            "event": "Variable is not blocked",
+            "level": "info",
+            "logger": "task",
+        }.items() <= (next(log for log in captured_logs if log["event"].startswith("Variable is")).items())
+
+    def test_heartbeats_with_async_client(self, monkeypatch, make_ti_context):
+        import airflow.sdk.execution_time.supervisor
+
+        monkeypatch.setattr(airflow.sdk.execution_time.supervisor, "MIN_HEARTBEAT_INTERVAL", 0.1)
+
+        def subprocess_main():
+            CommsDecoder()._get_response()
+            sleep(0.5)
+
+        heartbeats = []
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            heartbeats.append(request.url.path)
+            return httpx.Response(204)
+
+        client = MagicMock(spec=sdk_client.Client)
+        client.task_instances.start.return_value = make_ti_context()
+        async_client = sdk_client.AsyncClient(
+            base_url="http://localhost", token="", transport=httpx.MockTransport(handle_request)
+        )
+
+        proc = self._start(client, subprocess_main, async_client=async_client)
+
+        assert proc.wait() == 0
+        assert heartbeats
+        assert set(heartbeats) == {"/task-instances/4d828a62-a417-4936-a7a6-2b3fabacecab/heartbeat"}
+        client.task_instances.heartbeat.assert_not_called()
+        assert async_client.is_closed
+
+    def test_state_conflict_on_heartbeat_with_async_client(self, mocker, monkeypatch, make_ti_context):
+        import airflow.sdk.execution_time.supervisor
+
+        monkeypatch.setattr(airflow.sdk.execution_time.supervisor, "MIN_HEARTBEAT_INTERVAL", 0.1)
+
+        def subprocess_main():
+            CommsDecoder()._get_response()
+            sleep(5)
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(409, json={"detail": {"reason": "not_running"}})
+
+        client = MagicMock(spec=sdk_client.Client)
+        client.task_instances.start.return_value = make_ti_context()
+        async_client = sdk_client.AsyncClient(
+            base_url="http://localhost", token="", transport=httpx.MockTransport(handle_request)
+        )
+        # Killing the process from the event loop must not read the sockets it is watching itself
+        kill = mocker.spy(ActivitySubprocess, "kill")
+        akill = mocker.spy(ActivitySubprocess, "akill")
+
+        proc = self._start(client, subprocess_main, async_client=async_client)
+
+        assert proc.wait() == -signal.SIGTERM
+        assert proc.final_state == "SERVER_TERMINATED"
+        kill.assert_not_called()
+        akill.assert_called_once_with(proc, signal.SIGTERM, force=True)
+
+
 class TestWatchedSubprocessKill:
     @pytest.fixture
     def mock_process(self, mocker):
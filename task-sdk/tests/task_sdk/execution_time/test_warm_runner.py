@@ -0,0 +1,185 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from uuid6 import uuid7
+
+from airflow.sdk.api.datamodels._generated import TaskInstance
+from airflow.sdk.execution_time import warm_runner
+from airflow.sdk.execution_time.comms import BundleInfo, StartupDetails
+from airflow.sdk.execution_time.task_runner import parse
+from airflow.sdk.execution_time.warm_runner import WarmRunnerPool, run_with_preloaded
+from airflow.utils import timezone
+
+DAG_CODE = """
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+with DAG("{dag_id}"):
+    BaseOperator(task_id="a")
+    BaseOperator(task_id="opted_out", executor_config={{"warm_runner": False}})
+"""
+
+
+@pytest.fixture
+def bundle_dir(tmp_path: Path):
+    tmp_path.joinpath("warm.py").write_text(textwrap.dedent(DAG_CODE.format(dag_id="warm_dag")))
+    bundle_config = [
+        {
+            "name": "my-bundle",
+            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+            "kwargs": {"path": str(tmp_path), "refresh_interval": 1},
+        }
+    ]
+    with mock.patch.dict(
+        os.environ, {"AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(bundle_config)}
+    ):
+        yield tmp_path
+
+
+@pytest.fixture(autouse=True)
+def reset_preloaded():
+    yield
+    warm_runner._preloaded = None
+
+
+def _startup_details(make_ti_context, task_id="a", dag_rel_path="warm.py") -> StartupDetails:
+    return StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id=task_id,
+            dag_id="warm_dag",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+        ),
+        dag_rel_path=dag_rel_path,
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+    )
+
+
+class TestWarmRunnerPool:
+    def test_disabled(self, bundle_dir):
+        pool = WarmRunnerPool(max_size=0)
+        assert pool.get(BundleInfo(name="my-bundle", version=None), "warm.py") is None
+        assert len(pool) == 0
+
+    def test_parses_once(self, bundle_dir):
+        pool = WarmRunnerPool(max_size=2)
+        bundle_info = BundleInfo(name="my-bundle", version=None)
+
+        with mock.patch.object(WarmRunnerPool, "_load", wraps=WarmRunnerPool._load) as load:
+            first = pool.get(bundle_info, "warm.py")
+            second = pool.get(bundle_info, "warm.py")
+
+        assert first is not None
+        assert first is second
+        assert list(first.dags) == ["warm_dag"]
+        load.assert_called_once()
+
+    def test_reparses_changed_file_in_unversioned_bundle(self, bundle_dir):
+        pool = WarmRunnerPool(max_size=2)
+        bundle_info = BundleInfo(name="my-bundle", version=None)
+
+        first = pool.get(bundle_info, "warm.py")
+        dag_file = bundle_dir / "warm.py"
+        dag_file.write_text(textwrap.dedent(DAG_CODE.format(dag_id="renamed_dag")))
+        os.utime(dag_file, (first.mtime + 10, first.mtime + 10))
+
+        second = pool.get(bundle_info, "warm.py")
+        assert second is not first
+        assert list(second.dags) == ["renamed_dag"]
+
+    def test_lru_eviction(self, bundle_dir):
+        for name in ("one", "two"):
+            (bundle_dir / f"{name}.py").write_text(textwrap.dedent(DAG_CODE.format(dag_id=name)))
+        pool = WarmRunnerPool(max_size=2)
+        bundle_info = BundleInfo(name="my-bundle", version=None)
+
+        pool.get(bundle_info, "warm.py")
+        pool.get(bundle_info, "one.py")
+        # Touch the first one again so that "one.py" is the least recently used
+        pool.get(bundle_info, "warm.py")
+        pool.get(bundle_info, "two.py")
+
+        assert [key.dag_rel_path for key in pool._entries] == ["warm.py", "two.py"]
+
+    def test_failed_parse_is_cached(self, bundle_dir):
+        (bundle_dir / "broken.py").write_text("raise RuntimeError('no top-level code for you')")
+        pool = WarmRunnerPool(max_size=2)
+        bundle_info = BundleInfo(name="my-bundle", version=None)
+
+        with mock.patch.object(WarmRunnerPool, "_load", wraps=WarmRunnerPool._load) as load:
+            assert pool.get(bundle_info, "broken.py") is None
+            assert pool.get(bundle_info, "broken.py") is None
+
+        load.assert_called_once()
+
+
+class TestParseWithPreloaded:
+    def test_uses_preloaded_dag(self, bundle_dir, make_ti_context):
+        entry = WarmRunnerPool(max_size=1).get(BundleInfo(name="my-bundle", version=None), "warm.py")
+        what = _startup_details(make_ti_context)
+
+        with mock.patch("airflow.models.dagbag.DagBag") as dagbag:
+            run_with_preloaded(entry, lambda: None)
+            ti = parse(what, mock.Mock())
+
+        dagbag.assert_not_called()
+        assert ti.task is entry.dags["warm_dag"].task_dict["a"]
+        # The preloaded file is only ever handed out once
+        assert warm_runner._preloaded is None
+
+    def test_preloaded_task_of_wrong_type(self, bundle_dir, make_ti_context):
+        what = _startup_details(make_ti_context)
+
+        with mock.patch(
+            "airflow.sdk.execution_time.task_runner.take_preloaded_task",
+            return_value=(mock.Mock(), object()),
+        ):
+            with pytest.raises(TypeError, match="task is of the wrong type"):
+                parse(what, mock.Mock())
+
+    def test_opted_out_task_parses_itself(self, bundle_dir, make_ti_context):
+        entry = WarmRunnerPool(max_size=1).get(BundleInfo(name="my-bundle", version=None), "warm.py")
+        what = _startup_details(make_ti_context, task_id="opted_out")
+
+        run_with_preloaded(entry, lambda: None)
+        ti = parse(what, mock.Mock())
+
+        assert ti.task.task_id == "opted_out"
+        assert ti.task is not entry.dags["warm_dag"].task_dict["opted_out"]
+
+    def test_preloaded_for_other_file_is_ignored(self, bundle_dir, make_ti_context):
+        (bundle_dir / "other.py").write_text(textwrap.dedent(DAG_CODE.format(dag_id="warm_dag")))
+        entry = WarmRunnerPool(max_size=1).get(BundleInfo(name="my-bundle", version=None), "other.py")
+        what = _startup_details(make_ti_context)
+
+        run_with_preloaded(entry, lambda: None)
+        ti = parse(what, mock.Mock())
+
+        assert ti.task is not entry.dags["warm_dag"].task_dict["a"]